@@ -26,6 +26,7 @@ v4.0 Changes:
 import asyncio
 import collections
 import json as _json
+from html import escape as _html_escape
 import sys
 import signal
 import time
@@ -46,13 +47,13 @@ from src.analyzers.stop_hunt_detector import StopHuntDetector
 from src.analyzers.order_flow_analyzer import OrderFlowAnalyzer
 from src.analyzers.event_pattern_detector import EventPatternDetector
 from src.signals.signal_generator import SignalGenerator
-from src.signals.confidence_scorer import ConfidenceScorer
+from src.signals.confidence_scorer import ConfidenceScorer, OutcomeWindow
 from src.signals.signal_validator import SignalValidator
 from src.signals.signal_tracker import SignalTracker
 from src.alerts.message_formatter import MessageFormatter
 from src.alerts.telegram_bot import TelegramBot
 from src.alerts.telegram_router import TelegramRouter
-from src.alerts.alert_queue import AlertQueue
+from src.alerts.alert_queue import AlertQueue, Priority
 from src.storage.database import Database
 from src.connection.rest_poller import CoinGlassRestPoller
 from src.processors.market_context_buffer import MarketContextBuffer
@@ -472,11 +473,8 @@ class TeleglasPro:
                         self.discovered_symbols.add(symbol)
                         self.logger.info(f"🔍 New coin discovered: {symbol}")
 
-                    # Trigger analysis for ALL coins (debounced, resource-limited)
-                    if len(self._analysis_tasks) < self.max_concurrent_analysis:
-                        task = asyncio.create_task(self.analyze_and_alert(symbol))
-                        self._analysis_tasks.add(task)
-                        task.add_done_callback(self._analysis_tasks.discard)
+            # Trigger analysis once per coin touched by this message
+            self._schedule_dirty_analysis()
 
         except Exception as e:
             self.logger.error(f"Error handling liquidation: {e}")
@@ -514,16 +512,27 @@ class TeleglasPro:
 
                     self.stats['trades_processed'] += 1
 
-                    # Trigger analysis for this symbol (debounced, resource-limited)
-                    if len(self._analysis_tasks) < self.max_concurrent_analysis:
-                        task = asyncio.create_task(self.analyze_and_alert(symbol))
-                        self._analysis_tasks.add(task)
-                        task.add_done_callback(self._analysis_tasks.discard)
+            # Trigger analysis once per coin touched by this message
+            self._schedule_dirty_analysis()
 
         except Exception as e:
             self.logger.error(f"Error handling trade: {e}")
             self.stats['errors'] += 1
     
+    def _schedule_dirty_analysis(self):
+        """
+        Start analysis for symbols with new buffer data (debounced, resource-limited)
+        
+        Runs once per WebSocket message, so a batch of N events for one coin
+        spawns one analysis task instead of N.
+        """
+        for symbol in self.buffer_manager.pop_dirty():
+            if len(self._analysis_tasks) >= self.max_concurrent_analysis:
+                break
+            task = asyncio.create_task(self.analyze_and_alert(symbol))
+            self._analysis_tasks.add(task)
+            task.add_done_callback(self._analysis_tasks.discard)
+    
     def _is_coin_active(self, symbol: str) -> bool:
         """
         Check if coin is active (not disabled) on the dashboard.
@@ -684,7 +693,7 @@ class TeleglasPro:
                         await self.telegram_router.send_alert(msg, tier=tier)
                         self.stats['alerts_sent'] += 1
                     else:
-                        await self.alert_queue.add(msg, priority=alert.get("priority", 2))
+                        await self.alert_queue.add(msg, priority=alert.get("priority", Priority.WATCH))
 
                     self.logger.info(
                         f"🔍 Movement: {alert.get('type')} {coin} "
@@ -781,7 +790,7 @@ class TeleglasPro:
             if saved_confidence:
                 for signal_type, state in saved_confidence.items():
                     self.confidence_scorer.win_rates[signal_type] = state["win_rate"]
-                    self.confidence_scorer.signal_history[signal_type] = state["history"]
+                    self.confidence_scorer.signal_history[signal_type] = OutcomeWindow(state["history"])
                 self.logger.info(
                     f"Restored confidence state: "
                     f"{len(saved_confidence)} signal types loaded"
@@ -791,7 +800,7 @@ class TeleglasPro:
             saved_setups = await self.db.load_setup_states()
             if saved_setups:
                 for setup_key, state in saved_setups.items():
-                    self.confidence_scorer._setup_history[setup_key] = state["history"]
+                    self.confidence_scorer._setup_history[setup_key] = OutcomeWindow(state["history"])
                     self.confidence_scorer._setup_win_rates[setup_key] = state["win_rate"]
                 self.logger.info(
                     f"Restored setup learning: {len(saved_setups)} setups loaded"
@@ -860,13 +869,13 @@ class TeleglasPro:
                     await self.db.save_confidence_state(
                         signal_type,
                         self.confidence_scorer.win_rates.get(signal_type, 0.5),
-                        history
+                        list(history)
                     )
 
             # Save setup-level learning state
             if self.confidence_scorer._setup_history:
                 await self.db.save_all_setup_states(
-                    dict(self.confidence_scorer._setup_history),
+                    {k: list(v) for k, v in self.confidence_scorer._setup_history.items()},
                     dict(self.confidence_scorer._setup_win_rates),
                 )
 
@@ -1305,13 +1314,13 @@ class TeleglasPro:
                         lines.append(f"{bar} {conf}%")
                         lines.append("DYOR — verifikasi sebelum entry")
 
-                        alert_msg = "\n".join(lines)
+                        alert_msg = _html_escape("\n".join(lines), quote=False)
                         # Route through TelegramRouter based on tier
                         if self.telegram_router.enabled:
                             await self.telegram_router.send_alert(alert_msg, tier=alert_tier)
                             self.stats['alerts_sent'] += 1
                         else:
-                            await self.alert_queue.add(alert_msg, priority=2)
+                            await self.alert_queue.add(alert_msg, priority=Priority.WATCH)
                     except Exception as e:
                         self.logger.debug(f"REST alert format error: {e}")
 
@@ -1446,9 +1455,14 @@ class TeleglasPro:
                 self.last_analysis[symbol] = now
 
                 # Run analyzers (always - data collection doesn't depend on toggle)
-                stop_hunt_signal = await self.stop_hunt_detector.analyze(symbol)
-                order_flow_signal = await self.order_flow_analyzer.analyze(symbol)
-                event_signals = await self.event_detector.analyze(symbol)
+                # Pure CPU over in-memory buffers, so called synchronously;
+                # both trade analyzers share one 5-minute column snapshot
+                trade_columns = self.buffer_manager.get_trade_columns(symbol, time_window=300)
+                stop_hunt_signal = self.stop_hunt_detector.analyze(symbol)
+                order_flow_signal = self.order_flow_analyzer.analyze(
+                    symbol, trade_columns=trade_columns
+                )
+                event_signals = self.event_detector.analyze(symbol, trade_columns=trade_columns)
 
                 # Log analyzer results for debugging (only when something detected)
                 if stop_hunt_signal:
@@ -1500,6 +1514,7 @@ class TeleglasPro:
                 is_valid, reason = self.signal_validator.validate(trading_signal)
                 if not is_valid:
                     self.logger.debug(f"Signal rejected: {reason}")
+                    self.signal_generator.release(trading_signal)
                     return
 
                 # Market context filter (OI + Funding Rate + CVD + Whale)
@@ -1516,6 +1531,7 @@ class TeleglasPro:
                         f"{trading_signal.signal_type} {trading_signal.direction} — "
                         f"{filter_result.assessment}: {filter_result.reason}"
                     )
+                    self.signal_generator.release(trading_signal)
                     return
                 if not filter_result.passed and is_stop_hunt:
                     self.logger.info(
@@ -1535,6 +1551,7 @@ class TeleglasPro:
                         f"Signal dropped below threshold after context adjustment: "
                         f"{trading_signal.confidence:.0f}%"
                     )
+                    self.signal_generator.release(trading_signal)
                     return
 
                 self.stats['signals_generated'] += 1
@@ -1633,6 +1650,7 @@ class TeleglasPro:
                             f"⏭️ Low volume: skip | {symbol} tier {tier} "
                             f"vol=${vol_24h/1e6:.1f}M < min=${min_vol/1e6:.0f}M"
                         )
+                        self.signal_generator.release(trading_signal)
                         return
 
                 # Fallback: derive price from WebSocket trade data if REST price missing
@@ -1654,8 +1672,9 @@ class TeleglasPro:
                                 mc['_price_source'] = 'liquidation'
 
                 # Compute 24h liquidation volume from buffer
-                liqs_24h = self.buffer_manager.get_liquidations(symbol, time_window=86400)
-                liq_vol_24h = sum(float(l.get("vol", 0)) for l in liqs_24h) if liqs_24h else 0
+                liq_vol_24h, _, _ = self.buffer_manager.get_window_sum(
+                    symbol, 86400, liquidations=True
+                )
                 uptime_hours = (datetime.now() - self.start_time).total_seconds() / 3600
                 mc.update({
                     'liquidation_24h_volume': liq_vol_24h,
@@ -1905,7 +1924,7 @@ class TeleglasPro:
                         success = await self.telegram_bot.send_alert(queued_alert.alert)
                         
                         if success:
-                            await self.alert_queue.mark_processed(success=True)
+                            await self.alert_queue.mark_processed(success=True, queued_alert=queued_alert)
                             self.stats['alerts_sent'] += 1
                         else:
                             # Mark task_done BEFORE retry to keep queue accounting correct
@@ -1916,7 +1935,7 @@ class TeleglasPro:
                     else:
                         # No Telegram - just log
                         self.logger.info(f"📤 Alert (Telegram disabled):\n{queued_alert.alert[:100]}...")
-                        await self.alert_queue.mark_processed(success=True)
+                        await self.alert_queue.mark_processed(success=True, queued_alert=queued_alert)
                         
             except Exception as e:
                 self.logger.error(f"Alert processor error: {e}")
@@ -2398,15 +2417,15 @@ class TeleglasPro:
                 else:
                     btc_label = " | BTC: ALIGNED ✅" if btc_dir == "FALLING" else " | BTC: DIVERGENT ⚠️"
 
-        header = f"\U0001f4a1 *{symbol}* | {price_str} | {time_str} WIB"
+        header = f"\U0001f4a1 <b>{symbol}</b> | {price_str} | {time_str} WIB"
 
         # --- Trigger: Leading Indicator ---
-        trigger_lines = [f"\U0001f514 *Trigger: LEADING SCAN* | {direction}{btc_label}"]
+        trigger_lines = [f"\U0001f514 <b>Trigger: LEADING SCAN</b> | {direction}{btc_label}"]
         for ind in score.indicators:
             if ind.detail:
-                trigger_lines.append(f"\u2726 {ind.detail}")
+                trigger_lines.append(f"\u2726 {_html_escape(ind.detail, quote=False)}")
         for note in score.notes:
-            trigger_lines.append(f"\u2726 {note}")
+            trigger_lines.append(f"\u2726 {_html_escape(note, quote=False)}")
         trigger = "\n".join(trigger_lines)
 
         # --- Order Flow ---
@@ -2417,7 +2436,7 @@ class TeleglasPro:
         has_ob = ctx.get('orderbook_dominant', 'UNKNOWN') != 'UNKNOWN'
 
         if any([has_spot, has_fut, has_oi, has_ob]):
-            of_lines.append("\U0001f4ca *ORDER FLOW*")
+            of_lines.append("\U0001f4ca <b>ORDER FLOW</b>")
             if has_spot:
                 arrow = fmt._dir_arrow(ctx['spot_cvd_direction'])
                 chg = ctx.get('spot_cvd_change', 0)
@@ -2449,12 +2468,12 @@ class TeleglasPro:
         if per_exchange:
             sane = {k: v for k, v in per_exchange.items() if abs(v) < 0.01}
             if sane:
-                fr_lines.append("\U0001f4b8 *FUNDING RATE*")
+                fr_lines.append("\U0001f4b8 <b>FUNDING RATE</b>")
                 for exchange, rate in sorted(sane.items(), key=lambda x: abs(x[1]), reverse=True)[:5]:
-                    fr_lines.append(f"{exchange:9s}: {rate*100:+.4f}%")
+                    fr_lines.append(f"{_html_escape(exchange, quote=False):9s}: {rate*100:+.4f}%")
                 fr_lines.append(f"Alignment: {ctx.get('funding_alignment', 'NEUTRAL')}")
         elif fr != 0 and abs(fr) < 0.01:
-            fr_lines.append("\U0001f4b8 *FUNDING RATE*")
+            fr_lines.append("\U0001f4b8 <b>FUNDING RATE</b>")
             fr_lines.append(f"Avg      : {fr*100:+.4f}%")
             fr_lines.append(f"Alignment: {ctx.get('funding_alignment', 'NEUTRAL')}")
         funding = "\n".join(fr_lines)
@@ -2463,7 +2482,7 @@ class TeleglasPro:
         whale_lines = []
         whale_val = ctx.get('whale_largest_value_usd', 0)
         if whale_val >= 1_000_000:
-            whale_lines.append("\U0001f40b *WHALE (Hyperliquid)*")
+            whale_lines.append("\U0001f40b <b>WHALE (Hyperliquid)</b>")
             w_dir = (ctx.get('whale_largest_direction', '') or '?').upper()
             detail = f"{w_dir} {fmt._fmt_large_usd(whale_val)}"
             w_entry = ctx.get('whale_entry_price', 0)
@@ -2481,7 +2500,7 @@ class TeleglasPro:
         volume = ctx.get('volume_24h', 0)
         change = ctx.get('price_change_24h_pct', 0)
         if price > 0 or volume > 0:
-            pa_lines.append("\U0001f4c8 *PRICE ACTION*")
+            pa_lines.append("\U0001f4c8 <b>PRICE ACTION</b>")
             if price > 0:
                 if change != 0:
                     pa_lines.append(f"Harga    : {price_str} ({change:+.1f}% 24h)")
@@ -2499,7 +2518,7 @@ class TeleglasPro:
             assess_emoji = {"FAVORABLE": "\u2705", "NEUTRAL": "\u2796", "UNFAVORABLE": "\u274c"}.get(assessment, "")
             assess_line = f"\nContext  : {assess_emoji} {assessment}"
 
-        label = f"{score.label_emoji} {direction} {dir_emoji} \u2014 {score.label_text}" if score.label_text else f"\U0001f4a1 {direction} {dir_emoji}"
+        label = f"{score.label_emoji} {direction} {dir_emoji} \u2014 {_html_escape(score.label_text, quote=False)}" if score.label_text else f"\U0001f4a1 {direction} {dir_emoji}"
         bias = f"{label}\n{bar} {score.total:.0f}%{assess_line}\n\u26a0\ufe0f DYOR \u2014 verifikasi sebelum entry"
 
         # --- Assemble ---
@@ -2571,8 +2590,10 @@ class TeleglasPro:
                         continue
 
                     # Check if this coin has recent liquidation activity
-                    liqs = self.buffer_manager.get_liquidations(symbol, time_window=300)
-                    if len(liqs) >= 3:  # At least 3 liquidations in 5 min = worth subscribing
+                    _, liq_count, _ = self.buffer_manager.get_window_sum(
+                        symbol, 300, liquidations=True
+                    )
+                    if liq_count >= 3:  # At least 3 liquidations in 5 min = worth subscribing
                         trade_channel = f"futures_trades@all_{symbol}@10000"
                         subscribe_msg = {
                             "method": "subscribe",
@@ -2583,7 +2604,7 @@ class TeleglasPro:
                             self._trade_subscribed.add(symbol)
                             self.logger.info(
                                 f"📡 Dynamic subscription: {trade_channel} "
-                                f"({len(liqs)} liquidations detected)"
+                                f"({liq_count} liquidations detected)"
                             )
 
                             # Also add to dashboard
@@ -2591,7 +2612,7 @@ class TeleglasPro:
                                 'symbol': symbol,
                                 'type': 'DISCOVERY',
                                 'confidence': 0,
-                                'description': f"New coin discovered with {len(liqs)} liquidations"
+                                'description': f"New coin discovered with {liq_count} liquidations"
                             })
 
             except Exception as e:
@@ -2623,10 +2644,10 @@ class TeleglasPro:
             # Save baselines to database
             try:
                 for symbol in self.buffer_manager.get_tracked_symbols():
-                    liqs = self.buffer_manager.get_liquidations(symbol, time_window=3600)
-                    liq_vol = sum(float(l.get("vol", 0)) for l in liqs)
-                    trades = self.buffer_manager.get_trades(symbol, time_window=3600)
-                    trade_vol = sum(float(t.get("vol", 0)) for t in trades)
+                    liq_vol, _, _ = self.buffer_manager.get_window_sum(
+                        symbol, 3600, liquidations=True
+                    )
+                    trade_vol, _, _ = self.buffer_manager.get_window_sum(symbol, 3600)
                     if liq_vol > 0 or trade_vol > 0:
                         await self.db.save_baseline(symbol, liq_vol, trade_vol)
                 await self.db.cleanup_old_baselines(max_age_hours=72)
@@ -2642,12 +2663,12 @@ class TeleglasPro:
                         await self.db.save_confidence_state(
                             signal_type,
                             self.confidence_scorer.win_rates.get(signal_type, 0.5),
-                            history
+                            list(history)
                         )
                 # Save setup-level learning state
                 if self.confidence_scorer._setup_history:
                     await self.db.save_all_setup_states(
-                        dict(self.confidence_scorer._setup_history),
+                        {k: list(v) for k, v in self.confidence_scorer._setup_history.items()},
                         dict(self.confidence_scorer._setup_win_rates),
                     )
             except Exception as e:
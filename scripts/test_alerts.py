@@ -23,7 +23,7 @@ from typing import List
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.alerts.message_formatter import MessageFormatter
-from src.alerts.alert_queue import AlertQueue
+from src.alerts.alert_queue import AlertQueue, Priority
 from src.utils.logger import setup_logger
 
 # Setup logger
@@ -180,14 +180,14 @@ async def test_alert_queue():
     logger.info("\n2.1 Add Alerts to Queue:")
     
     # Add low priority
-    await queue.add("Info alert 1", priority=3)
-    await queue.add("Info alert 2", priority=3)
+    await queue.add("Info alert 1", priority=Priority.INFO)
+    await queue.add("Info alert 2", priority=Priority.INFO)
     
     # Add high priority
-    await queue.add("Urgent alert!", priority=1)
+    await queue.add("Urgent alert!", priority=Priority.URGENT)
     
     # Add medium priority
-    await queue.add("Watch alert", priority=2)
+    await queue.add("Watch alert", priority=Priority.WATCH)
     
     logger.info(f"✅ Added 4 alerts")
     logger.info(f"   Queue size: {queue.size()}")
@@ -204,12 +204,12 @@ async def test_alert_queue():
             logger.info(f"   Priority {alert.priority}: {alert.alert}")
     
     # Verify order
-    if order[0][0] == 1:  # First should be priority 1
+    if order[0][0] == Priority.URGENT:  # First should be priority 1
         logger.info("✅ Correct priority ordering")
     
     # Test 2.3: Retry logic
     logger.info("\n2.3 Test Retry Logic:")
-    await queue.add("Test retry", priority=2, max_retries=2)
+    await queue.add("Test retry", priority=Priority.WATCH, max_retries=2)
     
     alert = await queue.get()
     logger.info(f"   First attempt (retry_count={alert.retry_count})")
@@ -230,13 +230,31 @@ async def test_alert_queue():
     
     # Add multiple alerts
     for i in range(5):
-        await queue.add(f"Batch alert {i+1}", priority=2)
+        await queue.add(f"Batch alert {i+1}", priority=Priority.WATCH)
     
     batch = await queue.get_batch(batch_size=3, timeout=0.1)
     logger.info(f"✅ Retrieved batch of {len(batch)} alerts")
     
-    # Mark as processed
-    for _ in batch:
+    # Mark as processed (recycles the QueuedAlert objects)
+    for queued in batch:
+        await queue.mark_processed(success=True, queued_alert=queued)
+    
+    # Drain whatever is left without waiting
+    drained = await queue.drain_batch(max_n=64)
+    logger.info(f"✅ Drained remaining {len(drained)} alerts")
+    for _ in drained:
+        await queue.mark_processed(success=True)
+    
+    # Empty queue: get_batch returns as soon as the first alert arrives
+    async def late_producer():
+        await asyncio.sleep(0.02)
+        await queue.add("Late alert", priority=Priority.URGENT)
+    
+    producer = asyncio.create_task(late_producer())
+    flushed = await queue.get_batch(batch_size=10, timeout=1.0)
+    await producer
+    logger.info(f"✅ get_batch flushed {len(flushed)} alert(s) on arrival")
+    for _ in flushed:
         await queue.mark_processed(success=True)
     
     # Test 2.5: Queue stats
@@ -14,7 +14,6 @@ No API key required - uses mock data
 """
 
 import sys
-import asyncio
 import time
 from pathlib import Path
 
@@ -30,25 +29,32 @@ from src.utils.logger import setup_logger
 # Setup logger
 logger = setup_logger("TestAnalyzers", "INFO")
 
+def _make_liquidation_builder(base_price: float):
+    """Build a mock-liquidation factory with base_price bound once"""
+    def build(symbol: str, count: int, total_volume: float, direction: int):
+        volume_per_event = total_volume / count
+        timestamp = int(time.time() * 1000)
+        return [
+            {
+                "symbol": symbol,
+                "exchange": "Binance",
+                "price": base_price + (i * 10),
+                "side": direction,  # 1=Long liq, 2=Short liq
+                "volume_usd": volume_per_event,
+                "vol": volume_per_event,
+                "timestamp": timestamp
+            }
+            for i in range(count)
+        ]
+    return build
+
+_mk_liqs_btc = _make_liquidation_builder(96000)
+_mk_liqs_eth = _make_liquidation_builder(2800)
+
 def create_mock_liquidations(symbol: str, count: int, total_volume: float, direction: int):
     """Create mock liquidation events"""
-    events = []
-    volume_per_event = total_volume / count
-    base_price = 96000 if "BTC" in symbol else 2800
-    
-    for i in range(count):
-        event = {
-            "symbol": symbol,
-            "exchange": "Binance",
-            "price": base_price + (i * 10),
-            "side": direction,  # 1=Long liq, 2=Short liq
-            "volume_usd": volume_per_event,
-            "vol": volume_per_event,
-            "timestamp": int(time.time() * 1000)
-        }
-        events.append(event)
-    
-    return events
+    builder = _mk_liqs_btc if symbol.startswith("BTC") else _mk_liqs_eth
+    return builder(symbol, count, total_volume, direction)
 
 def create_mock_trades(symbol: str, buy_count: int, sell_count: int, large_order_vol: float = 15000):
     """Create mock trade events"""
@@ -83,7 +89,7 @@ def create_mock_trades(symbol: str, buy_count: int, sell_count: int, large_order
     
     return events
 
-async def test_stop_hunt_detector():
+def test_stop_hunt_detector():
     """Test StopHuntDetector"""
     logger.info("=" * 60)
     logger.info("TEST 1: StopHuntDetector")
@@ -107,7 +113,7 @@ async def test_stop_hunt_detector():
         buffer.add_trade(symbol, trade)
     
     # Analyze
-    signal = await detector.analyze(symbol)
+    signal = detector.analyze(symbol)
     
     if signal:
         logger.info(f"✅ Signal detected!")
@@ -134,7 +140,7 @@ async def test_stop_hunt_detector():
     for trade in absorption_trades:
         buffer.add_trade(symbol, trade)
     
-    signal = await detector.analyze(symbol)
+    signal = detector.analyze(symbol)
     
     if signal:
         logger.info(f"✅ Signal: {signal.direction} - Confidence: {signal.confidence:.1f}%")
@@ -142,7 +148,7 @@ async def test_stop_hunt_detector():
     # Stats
     logger.info(f"\n1.3 Detector Stats: {detector.get_stats()}")
 
-async def test_order_flow_analyzer():
+def test_order_flow_analyzer():
     """Test OrderFlowAnalyzer"""
     logger.info("\n" + "=" * 60)
     logger.info("TEST 2: OrderFlowAnalyzer")
@@ -161,7 +167,7 @@ async def test_order_flow_analyzer():
         buffer.add_trade(symbol, trade)
     
     # Analyze
-    signal = await analyzer.analyze(symbol)
+    signal = analyzer.analyze(symbol)
     
     if signal:
         logger.info(f"✅ Signal detected!")
@@ -185,15 +191,25 @@ async def test_order_flow_analyzer():
     for trade in trades:
         buffer.add_trade(symbol, trade)
     
-    signal = await analyzer.analyze(symbol)
+    signal = analyzer.analyze(symbol)
     
     if signal:
         logger.info(f"✅ Signal: {signal.signal_type} - Confidence: {signal.confidence:.1f}%")
-    
+
+    # Test 2.3: Watchlist sweep matches per-symbol analysis
+    logger.info("\n2.3 Analyze Many:")
+    batch = analyzer.analyze_many([symbol, "BTCUSDT"])
+    batch_signal = batch.get(symbol)
+    if (batch_signal and signal and batch_signal.signal_type == signal.signal_type
+            and "BTCUSDT" not in batch):
+        logger.info(f"✅ analyze_many matches analyze: {batch_signal.signal_type}")
+    else:
+        logger.error(f"❌ analyze_many mismatch: {list(batch)}")
+
     # Stats
-    logger.info(f"\n2.3 Analyzer Stats: {analyzer.get_stats()}")
+    logger.info(f"\n2.4 Analyzer Stats: {analyzer.get_stats()}")
 
-async def test_event_pattern_detector():
+def test_event_pattern_detector():
     """Test EventPatternDetector"""
     logger.info("\n" + "=" * 60)
     logger.info("TEST 3: EventPatternDetector")
@@ -210,7 +226,7 @@ async def test_event_pattern_detector():
     for liq in liquidations:
         buffer.add_liquidation(symbol, liq)
     
-    signal = await detector.detect_liquidation_cascade(symbol)
+    signal = detector.detect_liquidation_cascade(symbol)
     if signal:
         logger.info(f"✅ {signal.description}")
         logger.info(f"   Confidence: {signal.confidence:.1f}%")
@@ -221,22 +237,42 @@ async def test_event_pattern_detector():
     for trade in trades:
         buffer.add_trade(symbol, trade)
     
-    signal = await detector.detect_whale_accumulation_window(symbol)
+    signal = detector.detect_whale_accumulation_window(symbol)
     if signal:
         logger.info(f"✅ {signal.description}")
         logger.info(f"   Confidence: {signal.confidence:.1f}%")
     
     # Test 3.3: Run all detectors
     logger.info("\n3.3 Run All Event Detectors:")
-    signals = await detector.analyze(symbol)
+    signals = detector.analyze(symbol)
     logger.info(f"✅ Detected {len(signals)} events")
     for sig in signals:
         logger.info(f"   - {sig.event_type}: {sig.description}")
     
+    # Test 3.4: Watchlist sweep matches per-symbol analysis
+    # (fresh detector: a repeat sweep on this one is suppressed as duplicate)
+    logger.info("\n3.4 Analyze Many:")
+    batch = EventPatternDetector(buffer).analyze_many([symbol, "ETHUSDT"])
+    batch_types = [sig.event_type for sig in batch.get(symbol, [])]
+    if batch_types == [sig.event_type for sig in signals] and "ETHUSDT" not in batch:
+        logger.info(f"✅ analyze_many matches analyze: {', '.join(batch_types)}")
+    else:
+        logger.error(f"❌ analyze_many mismatch: {', '.join(batch_types)}")
+    
+    # Test 3.5: Repeat sweep within the dedup window emits nothing
+    logger.info("\n3.5 Duplicate Suppression:")
+    detections_before = detector.get_stats()["total_detections"]
+    repeat = detector.analyze(symbol)
+    stats = detector.get_stats()
+    if signals and not repeat and stats["total_detections"] == detections_before:
+        logger.info(f"✅ Repeat suppressed ({stats['duplicates_suppressed']} duplicates)")
+    elif signals:
+        logger.error(f"❌ Repeat not suppressed: {len(repeat)} events")
+    
     # Stats
-    logger.info(f"\n3.4 Detector Stats: {detector.get_stats()}")
+    logger.info(f"\n3.6 Detector Stats: {detector.get_stats()}")
 
-async def test_integration():
+def test_integration():
     """Test integrated workflow"""
     logger.info("\n" + "=" * 60)
     logger.info("TEST 4: Integration (All Analyzers)")
@@ -263,9 +299,9 @@ async def test_integration():
         buffer.add_trade(symbol, trade)
     
     # Run all analyzers
-    stop_hunt_signal = await stop_hunt.analyze(symbol)
-    order_flow_signal = await order_flow.analyze(symbol)
-    event_signals = await events.analyze(symbol)
+    stop_hunt_signal = stop_hunt.analyze(symbol)
+    order_flow_signal = order_flow.analyze(symbol)
+    event_signals = events.analyze(symbol)
     
     # Results
     logger.info(f"\n✅ Integration Test Results:")
@@ -278,7 +314,7 @@ async def test_integration():
     
     logger.info(f"\n   Total signals: {1 if stop_hunt_signal else 0} + {1 if order_flow_signal else 0} + {len(event_signals)} = {(1 if stop_hunt_signal else 0) + (1 if order_flow_signal else 0) + len(event_signals)}")
 
-async def main():
+def main():
     """Run all tests"""
     logger.info("\n" + "=" * 60)
     logger.info("🧪 TELEGLAS Pro - Analyzers Layer Tests")
@@ -286,10 +322,10 @@ async def main():
     
     try:
         # Run tests
-        await test_stop_hunt_detector()
-        await test_order_flow_analyzer()
-        await test_event_pattern_detector()
-        await test_integration()
+        test_stop_hunt_detector()
+        test_order_flow_analyzer()
+        test_event_pattern_detector()
+        test_integration()
         
         # Summary
         logger.info("\n" + "=" * 60)
@@ -307,4 +343,4 @@ async def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
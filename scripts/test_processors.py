@@ -83,16 +83,26 @@ def test_data_validator():
     if not result.is_valid:
         logger.info("✅ Correctly rejected invalid data")
 
-    # Test 1.4: Symbol validation
-    logger.info("\n1.4 Symbol Format Validation:")
+    # Test 1.4: Batch validation (fast path)
+    logger.info("\n1.4 Batch Validate (fast path):")
+    liq_ok = validator.validate_many([MOCK_LIQUIDATION_EVENT] * 10, "liquidation")
+    trade_ok = validator.validate_many([MOCK_TRADE_EVENT] * 15, "trade")
+    mixed_ok = validator.validate_many([MOCK_LIQUIDATION_EVENT, invalid_data], "liquidation")
+    if all(liq_ok) and all(trade_ok) and mixed_ok == [True, False]:
+        logger.info(f"✅ Batch validation passed ({len(liq_ok)} liquidations, {len(trade_ok)} trades)")
+    else:
+        logger.error("❌ Batch validation failed")
+
+    # Test 1.5: Symbol validation
+    logger.info("\n1.5 Symbol Format Validation:")
     test_symbols = ["BTCUSDT", "ETHUSDT", "btcusdt", "BTC", "123ABC"]
     for symbol in test_symbols:
         is_valid = validator.is_valid_symbol(symbol)
         status = "✅" if is_valid else "❌"
         logger.info(f"   {status} {symbol}: {is_valid}")
 
-    # Test 1.5: Statistics
-    logger.info("\n1.5 Validator Statistics:")
+    # Test 1.6: Statistics
+    logger.info("\n1.6 Validator Statistics:")
     stats = validator.get_stats()
     logger.info(f"   Total validations: {stats['total_validations']}")
     logger.info(f"   Success rate: {stats['success_rate']:.1f}%")
@@ -104,20 +114,24 @@ def test_buffer_manager():
     logger.info("=" * 60)
 
     buffer = BufferManager(max_liquidations=100, max_trades=50)
+    validator = DataValidator()
 
     # Test 2.1: Add liquidations
     logger.info("\n2.1 Add Liquidation Events:")
-    for i in range(10):
-        buffer.add_liquidation("BTCUSDT", MOCK_LIQUIDATION_EVENT)
+    liquidations = [MOCK_LIQUIDATION_EVENT] * 10
+    for liq, ok in zip(liquidations, validator.validate_many(liquidations, "liquidation")):
+        if ok:
+            buffer.add_liquidation("BTCUSDT", liq)
 
-    size = buffer.get_buffer_size("BTCUSDT")
     logger.info(f"✅ Added 10 liquidations")
-    logger.info(f"   Buffer size: {size['liquidations']}")
+    logger.info(f"   Buffer size: {buffer.liquidation_count('BTCUSDT')}")
 
     # Test 2.2: Add trades
     logger.info("\n2.2 Add Trade Events:")
-    for i in range(15):
-        buffer.add_trade("ETHUSDT", MOCK_TRADE_EVENT)
+    trades = [MOCK_TRADE_EVENT] * 15
+    for trade, ok in zip(trades, validator.validate_many(trades, "trade")):
+        if ok:
+            buffer.add_trade("ETHUSDT", trade)
 
     size = buffer.get_buffer_size("ETHUSDT")
     logger.info(f"✅ Added 15 trades")
@@ -134,6 +148,11 @@ def test_buffer_manager():
     logger.info("\n2.4 Tracked Symbols:")
     symbols = buffer.get_tracked_symbols()
     logger.info(f"   Symbols: {symbols}")
+    dirty = buffer.pop_dirty()
+    if dirty == {"BTCUSDT", "ETHUSDT"} and not buffer.pop_dirty():
+        logger.info(f"✅ Dirty symbols popped once: {sorted(dirty)}")
+    else:
+        logger.error(f"❌ Unexpected dirty set: {dirty}")
 
     # Test 2.5: Statistics
     logger.info("\n2.5 Buffer Statistics:")
@@ -15,24 +15,23 @@ No API key required - uses mock data
 
 import sys
 import asyncio
-import time
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.signals.signal_generator import SignalGenerator, TradingSignal
+from src.signals.signal_generator import SignalGenerator, SignalType, Direction
 from src.signals.confidence_scorer import ConfidenceScorer
 from src.signals.signal_validator import SignalValidator
-from src.utils.logger import setup_logger
+from src.utils.logger import setup_logger, LogBatcher
 
 # Setup logger
 logger = setup_logger("TestSignals", "INFO")
 
 # Mock signal data classes (simplified versions)
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockStopHuntSignal:
     symbol: str
     direction: str
@@ -43,7 +42,7 @@ class MockStopHuntSignal:
     directional_percentage: float
     confidence: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockOrderFlowSignal:
     symbol: str
     signal_type: str
@@ -56,7 +55,7 @@ class MockOrderFlowSignal:
     total_trades: int
     confidence: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockEventSignal:
     event_type: str
     symbol: str
@@ -76,11 +75,14 @@ def create_mock_stop_hunt(symbol: str = "BTCUSDT", conf: float = 85.0):
         confidence=conf
     )
 
+# Template for loops that only vary the symbol (copied via dataclasses.replace)
+_BASE_STOP_HUNT = create_mock_stop_hunt("__TEMPLATE__", conf=80.0)
+
 def create_mock_order_flow(symbol: str = "BTCUSDT", conf: float = 75.0):
     """Create mock order flow signal"""
     return MockOrderFlowSignal(
         symbol=symbol,
-        signal_type="ACCUMULATION",
+        signal_type=SignalType.ACCUMULATION,
         buy_ratio=0.72,
         buy_volume=216000,
         sell_volume=84000,
@@ -108,282 +110,306 @@ def create_mock_events(symbol: str = "BTCUSDT"):
         )
     ]
 
+# Shared across tests so one-time init and the generator's combine cache
+# carry over; each test resets the stateful counters on entry
+generator = SignalGenerator(min_confidence=65.0)
+scorer = ConfidenceScorer(learning_rate=0.1)
+validator = SignalValidator(max_signals_per_hour=50, min_confidence=65.0, cooldown_minutes=5)
+
 async def test_signal_generator():
     """Test SignalGenerator"""
-    logger.info("=" * 60)
-    logger.info("TEST 1: SignalGenerator")
-    logger.info("=" * 60)
+    with LogBatcher(logger) as lb:
+        lb.log("=" * 60)
+        lb.log("TEST 1: SignalGenerator")
+        lb.log("=" * 60)
     
-    generator = SignalGenerator(min_confidence=65.0)
+        generator.reset()
     
-    # Test 1.1: Generate signal from all sources
-    logger.info("\n1.1 Generate Signal (All Sources):")
-    symbol = "BTCUSDT"
+        # Test 1.1: Generate signal from all sources
+        lb.log("\n1.1 Generate Signal (All Sources):")
+        symbol = "BTCUSDT"
     
-    stop_hunt = create_mock_stop_hunt(symbol, conf=85.0)
-    order_flow = create_mock_order_flow(symbol, conf=75.0)
-    events = create_mock_events(symbol)
+        stop_hunt = create_mock_stop_hunt(symbol, conf=85.0)
+        order_flow = create_mock_order_flow(symbol, conf=75.0)
+        events = create_mock_events(symbol)
     
-    signal = await generator.generate(
-        symbol=symbol,
-        stop_hunt_signal=stop_hunt,
-        order_flow_signal=order_flow,
-        event_signals=events
-    )
+        signal = await generator.generate(
+            symbol=symbol,
+            stop_hunt_signal=stop_hunt,
+            order_flow_signal=order_flow,
+            event_signals=events
+        )
     
-    if signal:
-        logger.info(f"✅ Signal generated!")
-        logger.info(f"   Symbol: {signal.symbol}")
-        logger.info(f"   Type: {signal.signal_type}")
-        logger.info(f"   Direction: {signal.direction}")
-        logger.info(f"   Confidence: {signal.confidence:.1f}%")
-        logger.info(f"   Sources: {signal.sources}")
-        logger.info(f"   Priority: {signal.priority}")
-        logger.info(f"   Metadata keys: {list(signal.metadata.keys())}")
-    else:
-        logger.error("❌ No signal generated")
-    
-    # Test 1.2: Stop hunt only
-    logger.info("\n1.2 Generate Signal (Stop Hunt Only):")
-    signal = await generator.generate(
-        symbol=symbol,
-        stop_hunt_signal=stop_hunt
-    )
+        if signal:
+            lb.log("✅ Signal generated!")
+            lb.log("   Symbol: %s", signal.symbol)
+            lb.log("   Type: %s", signal.signal_type)
+            lb.log("   Direction: %s", signal.direction)
+            lb.log("   Confidence: %.1f%%", signal.confidence)
+            lb.log("   Sources: %s", signal.sources)
+            lb.log("   Priority: %s", signal.priority)
+            lb.log("   Metadata keys: %s", list(signal.metadata.keys()))
+        else:
+            lb.error("❌ No signal generated")
+    
+        # Test 1.2: Stop hunt only
+        lb.log("\n1.2 Generate Signal (Stop Hunt Only):")
+        signal = await generator.generate(
+            symbol=symbol,
+            stop_hunt_signal=stop_hunt
+        )
     
-    if signal:
-        logger.info(f"✅ Signal: {signal.signal_type} {signal.direction} - Confidence: {signal.confidence:.1f}%")
+        if signal:
+            lb.log("✅ Signal: %s %s - Confidence: %.1f%%", signal.signal_type, signal.direction, signal.confidence)
     
-    # Test 1.3: Order flow only
-    logger.info("\n1.3 Generate Signal (Order Flow Only):")
-    signal = await generator.generate(
-        symbol=symbol,
-        order_flow_signal=order_flow
-    )
+        # Test 1.3: Order flow only
+        lb.log("\n1.3 Generate Signal (Order Flow Only):")
+        signal = await generator.generate(
+            symbol=symbol,
+            order_flow_signal=order_flow
+        )
     
-    if signal:
-        logger.info(f"✅ Signal: {signal.signal_type} {signal.direction} - Confidence: {signal.confidence:.1f}%")
+        if signal:
+            lb.log("✅ Signal: %s %s - Confidence: %.1f%%", signal.signal_type, signal.direction, signal.confidence)
     
-    # Test 1.4: Low confidence (below threshold)
-    logger.info("\n1.4 Low Confidence Signal (Should Reject):")
-    low_conf_stop_hunt = create_mock_stop_hunt(symbol, conf=55.0)
-    signal = await generator.generate(
-        symbol=symbol,
-        stop_hunt_signal=low_conf_stop_hunt
-    )
+        # Test 1.4: Low confidence (below threshold)
+        lb.log("\n1.4 Low Confidence Signal (Should Reject):")
+        low_conf_stop_hunt = create_mock_stop_hunt(symbol, conf=55.0)
+        signal = await generator.generate(
+            symbol=symbol,
+            stop_hunt_signal=low_conf_stop_hunt
+        )
     
-    if not signal:
-        logger.info("✅ Correctly rejected low confidence signal")
-    else:
-        logger.error("❌ Should have rejected low confidence")
+        if not signal:
+            lb.log("✅ Correctly rejected low confidence signal")
+        else:
+            lb.error("❌ Should have rejected low confidence")
     
-    # Stats
-    logger.info(f"\n1.5 Generator Stats: {generator.get_stats()}")
+        # Stats
+        lb.log("\n1.5 Generator Stats: %s", generator.get_stats())
 
 async def test_confidence_scorer():
     """Test ConfidenceScorer"""
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 2: ConfidenceScorer")
-    logger.info("=" * 60)
-    
-    scorer = ConfidenceScorer(learning_rate=0.1)
-    
-    # Test 2.1: Initial adjustment (no history)
-    logger.info("\n2.1 Initial Confidence Adjustment:")
-    base_conf = 75.0
-    adjusted = scorer.adjust_confidence(base_conf, "STOP_HUNT")
-    logger.info(f"   Base: {base_conf:.1f}% → Adjusted: {adjusted:.1f}%")
-    
-    # Test 2.2: Record successful signals
-    logger.info("\n2.2 Record Successful Signals:")
-    for i in range(7):
-        scorer.record_result("STOP_HUNT", was_successful=True)
-    logger.info(f"   Recorded 7 successful STOP_HUNT signals")
-    logger.info(f"   Win rate: {scorer.get_win_rate('STOP_HUNT'):.1%}")
-    
-    # Test 2.3: Adjustment after good track record
-    logger.info("\n2.3 Adjustment After Good Track Record:")
-    adjusted = scorer.adjust_confidence(75.0, "STOP_HUNT")
-    logger.info(f"   Base: 75.0% → Adjusted: {adjusted:.1f}% (should be boosted)")
-    
-    # Test 2.4: Record failures
-    logger.info("\n2.4 Record Failed Signals:")
-    for i in range(5):
-        scorer.record_result("DISTRIBUTION", was_successful=False)
-    logger.info(f"   Recorded 5 failed DISTRIBUTION signals")
-    logger.info(f"   Win rate: {scorer.get_win_rate('DISTRIBUTION'):.1%}")
-    
-    # Test 2.5: Adjustment after poor track record
-    logger.info("\n2.5 Adjustment After Poor Track Record:")
-    adjusted = scorer.adjust_confidence(75.0, "DISTRIBUTION")
-    logger.info(f"   Base: 75.0% → Adjusted: {adjusted:.1f}% (should be reduced)")
-    
-    # Test 2.6: Metadata quality boost
-    logger.info("\n2.6 Quality Boost from Metadata:")
-    metadata = {
-        'stop_hunt': {
-            'absorption_volume': 600_000,
-            'directional_pct': 0.88
-        },
-        'order_flow': {
-            'buy_ratio': 0.78,
-            'large_buys': 20,
-            'large_sells': 3
+    with LogBatcher(logger) as lb:
+        lb.log("\n" + "=" * 60)
+        lb.log("TEST 2: ConfidenceScorer")
+        lb.log("=" * 60)
+    
+        scorer.reset()
+    
+        # Test 2.1: Initial adjustment (no history)
+        lb.log("\n2.1 Initial Confidence Adjustment:")
+        base_conf = 75.0
+        adjusted = scorer.adjust_confidence(base_conf, SignalType.STOP_HUNT)
+        lb.log("   Base: %.1f%% → Adjusted: %.1f%%", base_conf, adjusted)
+    
+        # Test 2.2: Record successful signals
+        lb.log("\n2.2 Record Successful Signals:")
+        for i in range(7):
+            scorer.record_result(SignalType.STOP_HUNT, was_successful=True)
+        lb.log("   Recorded 7 successful STOP_HUNT signals")
+        lb.log("   Win rate: %.1f%%", scorer.get_win_rate(SignalType.STOP_HUNT) * 100)
+    
+        # Test 2.3: Adjustment after good track record
+        lb.log("\n2.3 Adjustment After Good Track Record:")
+        adjusted = scorer.adjust_confidence(75.0, SignalType.STOP_HUNT)
+        lb.log("   Base: 75.0%% → Adjusted: %.1f%% (should be boosted)", adjusted)
+    
+        # Test 2.4: Record failures
+        lb.log("\n2.4 Record Failed Signals:")
+        for i in range(5):
+            scorer.record_result(SignalType.DISTRIBUTION, was_successful=False)
+        lb.log("   Recorded 5 failed DISTRIBUTION signals")
+        lb.log("   Win rate: %.1f%%", scorer.get_win_rate(SignalType.DISTRIBUTION) * 100)
+    
+        # Test 2.5: Adjustment after poor track record
+        lb.log("\n2.5 Adjustment After Poor Track Record:")
+        adjusted = scorer.adjust_confidence(75.0, SignalType.DISTRIBUTION)
+        lb.log("   Base: 75.0%% → Adjusted: %.1f%% (should be reduced)", adjusted)
+    
+        # Test 2.6: Metadata quality boost
+        lb.log("\n2.6 Quality Boost from Metadata:")
+        metadata = {
+            'stop_hunt': {
+                'absorption_volume': 600_000,
+                'directional_pct': 0.88
+            },
+            'order_flow': {
+                'buy_ratio': 0.78,
+                'large_buys': 20,
+                'large_sells': 3
+            }
         }
-    }
-    adjusted = scorer.adjust_confidence(75.0, "STOP_HUNT", metadata)
-    logger.info(f"   With quality metadata: {adjusted:.1f}% (should be boosted)")
-    
-    # Test 2.7: Overall stats
-    logger.info("\n2.7 Overall Statistics:")
-    stats = scorer.get_overall_stats()
-    logger.info(f"   Total signals: {stats['total_signals']}")
-    logger.info(f"   Total wins: {stats['total_wins']}")
-    logger.info(f"   Overall win rate: {stats['overall_win_rate']:.1%}")
-    logger.info(f"   Per type: {stats['per_type']}")
+        adjusted = scorer.adjust_confidence(75.0, SignalType.STOP_HUNT, metadata)
+        lb.log("   With quality metadata: %.1f%% (should be boosted)", adjusted)
+    
+        # Test 2.7: Batch adjustment matches per-signal adjustment
+        lb.log("\n2.7 Batch Confidence Adjustment:")
+        batch_types = [SignalType.STOP_HUNT, SignalType.DISTRIBUTION, SignalType.ACCUMULATION, SignalType.STOP_HUNT]
+        batch_bases = [75.0, 75.0, 70.0, 80.0]
+        batch_meta = [metadata, None, None, metadata]
+        batch = scorer.adjust_confidence_batch(batch_bases, batch_types, batch_meta)
+        single = [
+            scorer.adjust_confidence(base, st, md)
+            for base, st, md in zip(batch_bases, batch_types, batch_meta)
+        ]
+        if batch == single:
+            lb.log("✅ Batch matches per-signal results: %s", batch)
+        else:
+            lb.error("❌ Batch %s != per-signal %s", batch, single)
+
+        # Test 2.8: Overall stats
+        lb.log("\n2.8 Overall Statistics:")
+        stats = scorer.get_overall_stats()
+        lb.log("   Total signals: %s", stats['total_signals'])
+        lb.log("   Total wins: %s", stats['total_wins'])
+        lb.log("   Overall win rate: %.1f%%", stats['overall_win_rate'] * 100)
+        lb.log("   Per type: %s", stats['per_type'])
 
 async def test_signal_validator():
     """Test SignalValidator"""
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 3: SignalValidator")
-    logger.info("=" * 60)
+    with LogBatcher(logger) as lb:
+        lb.log("\n" + "=" * 60)
+        lb.log("TEST 3: SignalValidator")
+        lb.log("=" * 60)
     
-    validator = SignalValidator(
-        max_signals_per_hour=50,
-        min_confidence=65.0,
-        cooldown_minutes=5
-    )
-    
-    # Create mock signal generator
-    generator = SignalGenerator(min_confidence=65.0)
+        validator.reset()
+        generator.reset()
     
-    # Test 3.1: Valid signal (should pass)
-    logger.info("\n3.1 Validate Valid Signal:")
-    stop_hunt = create_mock_stop_hunt("BTCUSDT", conf=85.0)
-    signal = await generator.generate("BTCUSDT", stop_hunt_signal=stop_hunt)
+        # Test 3.1: Valid signal (should pass)
+        lb.log("\n3.1 Validate Valid Signal:")
+        stop_hunt = create_mock_stop_hunt("BTCUSDT", conf=85.0)
+        signal = await generator.generate("BTCUSDT", stop_hunt_signal=stop_hunt)
     
-    if signal:
-        is_valid, reason = validator.validate(signal)
-        if is_valid:
-            logger.info(f"✅ Signal approved")
+        if signal:
+            is_valid, reason = validator.validate(signal)
+            if is_valid:
+                lb.log("✅ Signal approved")
+            else:
+                lb.error("❌ Signal rejected: %s", reason)
+    
+        # Test 3.2: Duplicate signal (should reject)
+        lb.log("\n3.2 Validate Duplicate Signal:")
+        signal2 = await generator.generate("BTCUSDT", stop_hunt_signal=stop_hunt)
+        if signal2:
+            is_valid, reason = validator.validate(signal2)
+            if not is_valid:
+                lb.log("✅ Correctly rejected duplicate: %s", reason)
+                # Rejected signal is discarded; hand it back to the pool
+                generator.release(signal2)
+                reused = await generator.generate("BTCUSDT", stop_hunt_signal=stop_hunt)
+                if reused is signal2:
+                    lb.log("✅ Released signal reused from pool")
+                else:
+                    lb.error("❌ Pooled signal was not reused")
+            else:
+                lb.error("❌ Should have rejected duplicate")
+    
+        # Test 3.3: Low confidence (should reject)
+        lb.log("\n3.3 Validate Low Confidence Signal:")
+        low_conf = create_mock_stop_hunt("ETHUSDT", conf=55.0)
+        low_signal = await generator.generate("ETHUSDT", stop_hunt_signal=low_conf)
+    
+        if low_signal:  # Generator should reject, but if it passes...
+            is_valid, reason = validator.validate(low_signal)
+            if not is_valid:
+                lb.log("✅ Correctly rejected: %s", reason)
         else:
-            logger.error(f"❌ Signal rejected: {reason}")
-    
-    # Test 3.2: Duplicate signal (should reject)
-    logger.info("\n3.2 Validate Duplicate Signal:")
-    signal2 = await generator.generate("BTCUSDT", stop_hunt_signal=stop_hunt)
-    if signal2:
-        is_valid, reason = validator.validate(signal2)
-        if not is_valid:
-            logger.info(f"✅ Correctly rejected duplicate: {reason}")
+            lb.log("✅ Generator already rejected low confidence")
+    
+        # Test 3.4: Multiple different signals (should pass)
+        lb.log("\n3.4 Validate Multiple Different Signals:")
+        symbols = ["ETHUSDT", "SOLUSDT", "BNBUSDT"]
+    
+        generated = await asyncio.gather(*(
+            generator.generate(sym, stop_hunt_signal=replace(_BASE_STOP_HUNT, symbol=sym))
+            for sym in symbols
+        ))
+        results = validator.validate_many([sig for sig in generated if sig])
+        approved_count = sum(1 for is_valid, _ in results if is_valid)
+    
+        lb.log("✅ Approved %s/%s different signals", approved_count, len(symbols))
+    
+        # Test 3.5: Cooldown check
+        lb.log("\n3.5 Check Cooldown Remaining:")
+        remaining = validator.get_cooldown_remaining("BTCUSDT", SignalType.STOP_HUNT, Direction.LONG)
+        if remaining:
+            lb.log("   BTCUSDT in cooldown: %.1f minutes remaining", remaining)
         else:
-            logger.error(f"❌ Should have rejected duplicate")
-    
-    # Test 3.3: Low confidence (should reject)
-    logger.info("\n3.3 Validate Low Confidence Signal:")
-    low_conf = create_mock_stop_hunt("ETHUSDT", conf=55.0)
-    low_signal = await generator.generate("ETHUSDT", stop_hunt_signal=low_conf)
-    
-    if low_signal:  # Generator should reject, but if it passes...
-        is_valid, reason = validator.validate(low_signal)
-        if not is_valid:
-            logger.info(f"✅ Correctly rejected: {reason}")
-    else:
-        logger.info("✅ Generator already rejected low confidence")
-    
-    # Test 3.4: Multiple different signals (should pass)
-    logger.info("\n3.4 Validate Multiple Different Signals:")
-    symbols = ["ETHUSDT", "SOLUSDT", "BNBUSDT"]
-    approved_count = 0
-    
-    for sym in symbols:
-        sh = create_mock_stop_hunt(sym, conf=80.0)
-        sig = await generator.generate(sym, stop_hunt_signal=sh)
-        if sig:
-            is_valid, reason = validator.validate(sig)
-            if is_valid:
-                approved_count += 1
-    
-    logger.info(f"✅ Approved {approved_count}/{len(symbols)} different signals")
-    
-    # Test 3.5: Cooldown check
-    logger.info("\n3.5 Check Cooldown Remaining:")
-    remaining = validator.get_cooldown_remaining("BTCUSDT", "STOP_HUNT", "LONG")
-    if remaining:
-        logger.info(f"   BTCUSDT in cooldown: {remaining:.1f} minutes remaining")
-    else:
-        logger.info(f"   BTCUSDT not in cooldown")
-    
-    # Test 3.6: Quota check
-    logger.info("\n3.6 Check Remaining Quota:")
-    quota = validator.get_remaining_quota()
-    logger.info(f"   Remaining quota: {quota}/50 signals")
-    
-    # Test 3.7: Validator stats
-    logger.info("\n3.7 Validator Statistics:")
-    stats = validator.get_stats()
-    logger.info(f"   Total validated: {stats['total_validated']}")
-    logger.info(f"   Approved: {stats['total_approved']}")
-    logger.info(f"   Rejected: {stats['total_rejected']}")
-    logger.info(f"   Approval rate: {stats['approval_rate']:.1%}")
-    logger.info(f"   Rejection reasons: {stats['rejection_reasons']}")
+            lb.log("   BTCUSDT not in cooldown")
+    
+        # Test 3.6: Quota check
+        lb.log("\n3.6 Check Remaining Quota:")
+        quota = validator.get_remaining_quota()
+        lb.log("   Remaining quota: %s/50 signals", quota)
+    
+        # Test 3.7: Validator stats
+        lb.log("\n3.7 Validator Statistics:")
+        stats = validator.get_stats()
+        lb.log("   Total validated: %s", stats['total_validated'])
+        lb.log("   Approved: %s", stats['total_approved'])
+        lb.log("   Rejected: %s", stats['total_rejected'])
+        lb.log("   Approval rate: %.1f%%", stats['approval_rate'] * 100)
+        lb.log("   Rejection reasons: %s", stats['rejection_reasons'])
 
 async def test_integration():
     """Test integrated workflow"""
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 4: Integration (All Modules)")
-    logger.info("=" * 60)
-    
-    # Create all modules
-    generator = SignalGenerator(min_confidence=65.0)
-    scorer = ConfidenceScorer(learning_rate=0.1)
-    validator = SignalValidator(max_signals_per_hour=50, min_confidence=65.0)
-    
-    # Scenario: High-quality stop hunt + accumulation
-    logger.info("\n Scenario: Strong signal with all components")
-    symbol = "BTCUSDT"
-    
-    # Step 1: Generate signal
-    stop_hunt = create_mock_stop_hunt(symbol, conf=85.0)
-    order_flow = create_mock_order_flow(symbol, conf=78.0)
-    events = create_mock_events(symbol)
-    
-    signal = await generator.generate(
-        symbol=symbol,
-        stop_hunt_signal=stop_hunt,
-        order_flow_signal=order_flow,
-        event_signals=events
-    )
-    
-    logger.info(f"\n1️⃣  Signal Generated:")
-    if signal:
-        logger.info(f"   {signal.symbol} {signal.signal_type} {signal.direction}")
-        logger.info(f"   Base confidence: {signal.confidence:.1f}%")
-    
-    # Step 2: Adjust confidence
-    if signal:
-        adjusted_conf = scorer.adjust_confidence(
-            signal.confidence,
-            signal.signal_type,
-            signal.metadata
+    with LogBatcher(logger) as lb:
+        lb.log("\n" + "=" * 60)
+        lb.log("TEST 4: Integration (All Modules)")
+        lb.log("=" * 60)
+    
+        # Reset shared modules
+        generator.reset()
+        scorer.reset()
+        validator.reset()
+    
+        # Scenario: High-quality stop hunt + accumulation
+        lb.log("\n Scenario: Strong signal with all components")
+        symbol = "BTCUSDT"
+    
+        # Step 1: Generate signal
+        stop_hunt = create_mock_stop_hunt(symbol, conf=85.0)
+        order_flow = create_mock_order_flow(symbol, conf=78.0)
+        events = create_mock_events(symbol)
+    
+        signal = await generator.generate(
+            symbol=symbol,
+            stop_hunt_signal=stop_hunt,
+            order_flow_signal=order_flow,
+            event_signals=events
         )
-        logger.info(f"\n2️⃣  Confidence Adjusted:")
-        logger.info(f"   {signal.confidence:.1f}% → {adjusted_conf:.1f}%")
-        signal.confidence = adjusted_conf
-    
-    # Step 3: Validate
-    if signal:
-        is_valid, reason = validator.validate(signal)
-        logger.info(f"\n3️⃣  Signal Validated:")
-        if is_valid:
-            logger.info(f"   ✅ APPROVED - Signal ready to send!")
-        else:
-            logger.info(f"   ❌ REJECTED: {reason}")
     
-    # Summary
-    logger.info(f"\n📊 Pipeline Summary:")
-    logger.info(f"   Generator: {generator.get_stats()['signals_generated']} signals")
-    logger.info(f"   Scorer: {scorer.get_overall_stats()['scores_calculated']} adjustments")
-    logger.info(f"   Validator: {validator.get_stats()['total_approved']}/{validator.get_stats()['total_validated']} approved")
+        lb.log("\n1️⃣  Signal Generated:")
+        if signal:
+            lb.log("   %s %s %s", signal.symbol, signal.signal_type, signal.direction)
+            lb.log("   Base confidence: %.1f%%", signal.confidence)
+    
+        # Step 2: Adjust confidence
+        if signal:
+            adjusted_conf = scorer.adjust_confidence(
+                signal.confidence,
+                signal.signal_type,
+                signal.metadata
+            )
+            lb.log("\n2️⃣  Confidence Adjusted:")
+            lb.log("   %.1f%% → %.1f%%", signal.confidence, adjusted_conf)
+            signal.confidence = adjusted_conf
+    
+        # Step 3: Validate
+        if signal:
+            is_valid, reason = validator.validate(signal)
+            lb.log("\n3️⃣  Signal Validated:")
+            if is_valid:
+                lb.log("   ✅ APPROVED - Signal ready to send!")
+            else:
+                lb.log("   ❌ REJECTED: %s", reason)
+    
+        # Summary
+        lb.log("\n📊 Pipeline Summary:")
+        lb.log("   Generator: %s signals", generator.get_stats()['signals_generated'])
+        lb.log("   Scorer: %s adjustments", scorer.get_overall_stats()['scores_calculated'])
+        lb.log("   Validator: %s/%s approved", validator.get_stats()['total_approved'], validator.get_stats()['total_validated'])
 
 async def main():
     """Run all tests"""
@@ -409,7 +435,7 @@ async def main():
         logger.info("- Integration: ✅ Working")
         
     except Exception as e:
-        logger.error(f"\n❌ Test failed: {e}")
+        logger.error("\n❌ Test failed: %s", e)
         import traceback
         traceback.print_exc()
 
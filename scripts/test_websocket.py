@@ -24,7 +24,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.connection.websocket_client import WebSocketClient, ConnectionState
+from src.connection.websocket_client import WebSocketClient
 from src.utils.logger import setup_logger
 from dotenv import load_dotenv
 
@@ -41,6 +41,11 @@ class WebSocketTester:
         self.api_key = api_key
         self.client = None
         self.message_count = 0
+        self.pong_count = 0
+        
+        # Signalled from callbacks so tests finish as soon as data arrives
+        self._pong_event = asyncio.Event()
+        self._message_cond = asyncio.Condition()
         
     async def on_connect(self):
         """Called when connected"""
@@ -53,12 +58,20 @@ class WebSocketTester:
     async def on_message(self, data: dict):
         """Called when message received"""
         self.message_count += 1
-        logger.info(f"📨 CALLBACK: Message #{self.message_count}")
-        logger.info(f"   Data: {data}")
+        logger.info("📨 CALLBACK: Message #%s", self.message_count)
+        logger.info("   Data: %s", data)
+        async with self._message_cond:
+            self._message_cond.notify_all()
+    
+    async def on_pong(self):
+        """Called when heartbeat pong received"""
+        self.pong_count += 1
+        logger.info("💓 CALLBACK: Pong #%s", self.pong_count)
+        self._pong_event.set()
         
     async def on_error(self, error: Exception):
         """Called on error"""
-        logger.error(f"❌ CALLBACK: Error - {error}")
+        logger.error("❌ CALLBACK: Error - %s", error)
     
     async def test_connection(self):
         """Test basic connection"""
@@ -78,14 +91,15 @@ class WebSocketTester:
         self.client.on_disconnect(self.on_disconnect)
         self.client.on_message(self.on_message)
         self.client.on_error(self.on_error)
+        self.client.on_pong(self.on_pong)
         
         # Connect
         success = await self.client.connect()
         
         if success:
             logger.info("✅ Connection successful!")
-            logger.info(f"   State: {self.client.get_state()}")
-            logger.info(f"   Authenticated: {self.client.is_authenticated()}")
+            logger.info("   State: %s", self.client.get_state())
+            logger.info("   Authenticated: %s", self.client.is_authenticated())
         else:
             logger.error("❌ Connection failed!")
             return False
@@ -98,13 +112,17 @@ class WebSocketTester:
         logger.info("="*60)
         logger.info("TEST 2: Heartbeat Mechanism")
         logger.info("="*60)
-        logger.info("Waiting 60 seconds to observe heartbeat...")
-        logger.info("(You should see 'Sent ping' every 20 seconds)")
+        logger.info("Waiting up to 60 seconds for a heartbeat pong...")
+        logger.info("(Ping is sent every 20 seconds)")
         
-        await asyncio.sleep(60)
+        try:
+            await asyncio.wait_for(self._pong_event.wait(), timeout=60)
+        except asyncio.TimeoutError:
+            logger.error("❌ No pong received within 60s")
+            return
         
         if self.client.is_connected():
-            logger.info("✅ Heartbeat working! Still connected after 60s")
+            logger.info("✅ Heartbeat working! Pong received, still connected")
         else:
             logger.error("❌ Connection lost during heartbeat test")
     
@@ -114,13 +132,25 @@ class WebSocketTester:
         logger.info("="*60)
         logger.info("TEST 3: Message Receiving")
         logger.info("="*60)
-        logger.info("Waiting 30 seconds to receive messages...")
+        target = 5
+        logger.info("Waiting up to 30 seconds for %s messages...", target)
         
         initial_count = self.message_count
-        await asyncio.sleep(30)
+        start = asyncio.get_running_loop().time()
+        try:
+            async with self._message_cond:
+                await asyncio.wait_for(
+                    self._message_cond.wait_for(
+                        lambda: self.message_count - initial_count >= target
+                    ),
+                    timeout=30
+                )
+        except asyncio.TimeoutError:
+            pass
+        elapsed = asyncio.get_running_loop().time() - start
         
         messages_received = self.message_count - initial_count
-        logger.info(f"✅ Received {messages_received} messages in 30 seconds")
+        logger.info("✅ Received %s messages in %.1f seconds", messages_received, elapsed)
     
     async def test_manual_message(self):
         """Test sending manual message"""
@@ -149,7 +179,7 @@ class WebSocketTester:
         
         if not self.client.is_connected():
             logger.info("✅ Disconnected successfully!")
-            logger.info(f"   State: {self.client.get_state()}")
+            logger.info("   State: %s", self.client.get_state())
         else:
             logger.error("❌ Still connected after disconnect!")
     
@@ -165,10 +195,10 @@ class WebSocketTester:
                 logger.error("Connection test failed. Aborting.")
                 return
             
-            # Test 2: Heartbeat (60 seconds)
+            # Test 2: Heartbeat (up to 60 seconds)
             await self.test_heartbeat()
             
-            # Test 3: Message receiving (30 seconds)
+            # Test 3: Message receiving (up to 30 seconds)
             await self.test_message_receiving()
             
             # Test 4: Manual message
@@ -182,7 +212,7 @@ class WebSocketTester:
             logger.info("="*60)
             logger.info("TEST SUMMARY")
             logger.info("="*60)
-            logger.info(f"✅ Total messages received: {self.message_count}")
+            logger.info("✅ Total messages received: %s", self.message_count)
             logger.info("✅ All tests completed!")
             
         except KeyboardInterrupt:
@@ -190,7 +220,7 @@ class WebSocketTester:
             if self.client:
                 await self.client.disconnect()
         except Exception as e:
-            logger.error(f"❌ Test error: {e}")
+            logger.error("❌ Test error: %s", e)
             if self.client:
                 await self.client.disconnect()
 
@@ -205,7 +235,7 @@ async def main():
         logger.info("  COINGLASS_API_KEY=your_key_here")
         return
     
-    logger.info(f"API Key loaded: {api_key[:10]}...{api_key[-5:]}")
+    logger.info("API Key loaded: %s...%s", api_key[:10], api_key[-5:])
     
     # Run tests
     tester = WebSocketTester(api_key)
@@ -18,22 +18,54 @@ Queue behavior:
 - Failed alerts can be re-queued with retry count
 """
 
+import array
 import asyncio
-from asyncio import PriorityQueue
-from typing import Any, Optional, Tuple
+import heapq
+import itertools
+import logging
+from collections import deque
+from typing import Any, Deque, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
 
 from ..utils.logger import setup_logger
 
-@dataclass(order=True)
+# Indices into AlertQueue._stats
+_QUEUED, _PROCESSED, _FAILED, _RETRIED = range(4)
+
+# Base retry delay in seconds; doubles per attempt (0.2s, 0.4s, 0.8s, ...)
+RETRY_BACKOFF = 0.1
+
+class Priority(IntEnum):
+    """Alert priority levels (lower value is processed first)"""
+    URGENT = 1
+    WATCH = 2
+    INFO = 3
+
+@dataclass(slots=True)
 class QueuedAlert:
     """Alert in queue with priority"""
     priority: int
-    alert: Any = field(compare=False)
-    timestamp: datetime = field(default_factory=datetime.now, compare=False)
-    retry_count: int = field(default=0, compare=False)
-    max_retries: int = field(default=3, compare=False)
+    alert: Any
+    timestamp: datetime = field(default_factory=datetime.now)
+    retry_count: int = 0
+    max_retries: int = 3
+
+# Free list of processed QueuedAlert objects, refilled by mark_processed()
+_POOL: Deque[QueuedAlert] = deque(maxlen=256)
+
+def _new_queued_alert(priority: int, alert: Any, max_retries: int) -> QueuedAlert:
+    """Reuse a pooled QueuedAlert if available, else allocate one"""
+    if not _POOL:
+        return QueuedAlert(priority=priority, alert=alert, max_retries=max_retries)
+    queued_alert = _POOL.pop()
+    queued_alert.priority = priority
+    queued_alert.alert = alert
+    queued_alert.timestamp = datetime.now()
+    queued_alert.retry_count = 0
+    queued_alert.max_retries = max_retries
+    return queued_alert
 
 class AlertQueue:
     """
@@ -57,56 +89,120 @@ class AlertQueue:
         Initialize alert queue
         
         Args:
-            max_size: Maximum queue size
+            max_size: Maximum queue size (<= 0 for unbounded)
         """
-        self.queue: PriorityQueue = PriorityQueue(maxsize=max_size)
+        self.max_size = max_size
+
+        # Heap of (priority, sequence, QueuedAlert): the sequence number keeps
+        # FIFO order within a priority and means QueuedAlert is never compared
+        self._heap: List[Tuple[int, int, QueuedAlert]] = []
+        self._counter = itertools.count()
+        self._unfinished = 0
+
+        # Heap ops are synchronous on the event loop, so no lock is needed;
+        # consumers only park on these events when they must block
+        self._not_empty = asyncio.Event()
+        self._all_done = asyncio.Event()
+        self._all_done.set()
+
+        # Producer backpressure: one slot per queued alert, taken on push and
+        # released on pop, so a full queue makes add() wait instead of dropping
+        self._slots: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_size) if max_size > 0 else None
+        )
+        self._retry_tasks: Set[asyncio.Task] = set()
+
         self.logger = setup_logger("AlertQueue", "INFO")
         
         # Statistics
-        self._total_queued = 0
-        self._total_processed = 0
-        self._total_failed = 0
-        self._total_retried = 0
+        # Counters in one contiguous uint64 array, indexed by _QUEUED etc.
+        self._stats = array.array('Q', [0, 0, 0, 0])
         
-    async def add(self, alert: Any, priority: int = 2, max_retries: int = 3) -> bool:
+    async def add(self, alert: Any, priority: int = Priority.WATCH, max_retries: int = 3) -> bool:
         """
         Add alert to queue
         
         Args:
             alert: Alert object (TradingSignal or formatted message)
-            priority: Priority level (1=High, 2=Medium, 3=Low)
+            priority: Priority level (Priority or plain int 1-3)
             max_retries: Maximum retry attempts
             
+        When the queue is full this waits for a consumer to free a slot
+        (backpressure) rather than dropping the alert.
+            
         Returns:
-            True if added, False if queue full
+            True if added, False on error
         """
         try:
-            queued_alert = QueuedAlert(
-                priority=priority,
-                alert=alert,
-                max_retries=max_retries
-            )
+            queued_alert = _new_queued_alert(priority, alert, max_retries)
             
-            # Non-blocking put with timeout
-            await asyncio.wait_for(
-                self.queue.put(queued_alert),
-                timeout=1.0
-            )
+            # Returns without suspending while a slot is free
+            if self._slots is not None:
+                await self._slots.acquire()
+            self._push(queued_alert)
             
-            self._total_queued += 1
-            self.logger.debug(
-                f"Added alert to queue (priority={priority}, "
-                f"queue_size={self.size()})"
-            )
+            self._stats[_QUEUED] += 1
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Added alert to queue (priority={priority}, "
+                    f"queue_size={self.size()})"
+                )
             return True
             
-        except asyncio.TimeoutError:
-            self.logger.error("❌ Queue full - cannot add alert")
-            return False
         except Exception as e:
             self.logger.error(f"❌ Failed to add alert: {e}")
             return False
     
+    def _push(self, queued_alert: QueuedAlert):
+        """Push onto the heap (caller holds a slot) and update the events"""
+        heapq.heappush(
+            self._heap,
+            (queued_alert.priority, next(self._counter), queued_alert)
+        )
+        self._unfinished += 1
+        self._all_done.clear()
+        self._not_empty.set()
+    
+    def _pop(self) -> QueuedAlert:
+        """Pop the highest-priority alert, free its slot and update the events"""
+        queued_alert = heapq.heappop(self._heap)[2]
+        if not self._heap:
+            self._not_empty.clear()
+        if self._slots is not None:
+            self._slots.release()
+        return queued_alert
+    
+    async def _wait_not_empty(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until at least one alert is queued
+        
+        Args:
+            timeout: Maximum wait time in seconds (None = wait forever)
+            
+        Returns:
+            True if the heap is non-empty, False on timeout
+        """
+        if self._heap:
+            return True
+        
+        if timeout is None:
+            while not self._heap:
+                await self._not_empty.wait()
+            return True
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # Re-check after every wakeup: another consumer may have taken it
+        while not self._heap:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._not_empty.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return False
+        return True
+    
     async def get(self, timeout: Optional[float] = None) -> Optional[QueuedAlert]:
         """
         Get next alert from queue
@@ -118,38 +214,43 @@ class AlertQueue:
             QueuedAlert or None if timeout
         """
         try:
-            if timeout is not None:
-                queued_alert = await asyncio.wait_for(
-                    self.queue.get(),
-                    timeout=timeout
-                )
-            else:
-                queued_alert = await self.queue.get()
+            if not await self._wait_not_empty(timeout):
+                return None
             
-            self.logger.debug(
-                f"Retrieved alert from queue (priority={queued_alert.priority}, "
-                f"queue_size={self.size()})"
-            )
+            queued_alert = self._pop()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Retrieved alert from queue (priority={queued_alert.priority}, "
+                    f"queue_size={self.size()})"
+                )
             return queued_alert
             
-        except asyncio.TimeoutError:
-            return None
         except Exception as e:
             self.logger.error(f"❌ Failed to get alert: {e}")
             return None
     
-    async def mark_processed(self, success: bool = True):
+    async def mark_processed(self, success: bool = True,
+                             queued_alert: Optional[QueuedAlert] = None):
         """
         Mark task as done
         
         Args:
             success: Whether processing was successful
+            queued_alert: The finished alert; on success it is recycled for
+                later add() calls, so the caller must not use it afterwards
         """
-        self.queue.task_done()
+        if self._unfinished <= 0:
+            raise ValueError("mark_processed() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._all_done.set()
         if success:
-            self._total_processed += 1
+            self._stats[_PROCESSED] += 1
+            if queued_alert is not None:
+                queued_alert.alert = None
+                _POOL.append(queued_alert)
         else:
-            self._total_failed += 1
+            self._stats[_FAILED] += 1
     
     async def retry(self, queued_alert: QueuedAlert) -> bool:
         """
@@ -161,71 +262,105 @@ class AlertQueue:
         Args:
             queued_alert: Failed alert to retry
 
+        The alert is re-pushed after an exponential backoff via
+        loop.call_later, so this returns immediately and never waits on a
+        full queue (the delayed push waits for a slot instead). The pending
+        retry counts as unfinished work for wait_empty().
+
         Returns:
-            True if re-queued, False if max retries reached
+            True if the retry was scheduled, False if max retries reached
         """
         if queued_alert.retry_count >= queued_alert.max_retries:
             self.logger.warning(
                 f"Max retries ({queued_alert.max_retries}) reached for alert"
             )
-            # Note: _total_failed is NOT incremented here because the caller
+            # Note: the failed counter is NOT incremented here because the caller
             # must call mark_processed(success=False) before retry(), which
-            # already increments _total_failed for the final failed attempt.
+            # already counts the final failed attempt.
             return False
 
         # Increment retry count
         queued_alert.retry_count += 1
-        self._total_retried += 1
+        self._stats[_RETRIED] += 1
 
         # Lower priority for retries (increase number)
-        retry_priority = min(queued_alert.priority + 1, 3)
+        retry_priority = min(queued_alert.priority + 1, Priority.INFO)
 
         self.logger.info(
             f"Retrying alert (attempt {queued_alert.retry_count}/{queued_alert.max_retries})"
         )
 
-        # Re-queue: preserve retry_count by reusing the object with updated priority
+        # Re-queue: preserve retry_count by reusing the object with updated priority.
+        # Scheduled, not awaited, so the caller never blocks on a full queue
         queued_alert.priority = retry_priority
+        backoff = RETRY_BACKOFF * 2 ** queued_alert.retry_count
+        self._unfinished += 1
+        self._all_done.clear()
+        asyncio.get_running_loop().call_later(
+            backoff, self._requeue_later, queued_alert
+        )
+        return True
+    
+    def _requeue_later(self, queued_alert: QueuedAlert):
+        """Timer callback: start the re-push once the backoff has elapsed"""
+        task = asyncio.ensure_future(self._requeue(queued_alert))
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+    
+    async def _requeue(self, queued_alert: QueuedAlert):
+        """Wait for a free slot, then push the retried alert"""
+        # The pending retry has held an unfinished count since retry()
         try:
-            await asyncio.wait_for(
-                self.queue.put(queued_alert),
-                timeout=1.0
-            )
-            self._total_queued += 1
-            return True
-        except asyncio.TimeoutError:
-            self.logger.error("Queue full - cannot retry alert")
-            self._total_failed += 1
-            return False
+            if self._slots is not None:
+                await self._slots.acquire()
+        except asyncio.CancelledError:
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._all_done.set()
+            raise
+        self._unfinished -= 1
+        self._push(queued_alert)
+        self._stats[_QUEUED] += 1
     
     async def get_batch(self, batch_size: int = 10, timeout: float = 1.0) -> list:
         """
         Get multiple alerts from queue
         
+        Waits at most once (only if the queue is empty), then pops up to
+        batch_size alerts synchronously. Low-rate urgent alerts go out as
+        soon as they arrive, while bursts are still delivered together.
+        
         Args:
             batch_size: Maximum alerts to retrieve
-            timeout: Max wait time for each alert
+            timeout: Max wait time for the first alert
             
         Returns:
-            List of QueuedAlert objects
+            List of QueuedAlert objects in priority order (empty on timeout)
         """
-        batch = []
+        if not await self._wait_not_empty(timeout):
+            return []
         
-        for _ in range(batch_size):
-            if self.is_empty():
-                break
-            
-            alert = await self.get(timeout=timeout)
-            if alert:
-                batch.append(alert)
-            else:
-                break
+        n = min(batch_size, len(self._heap))
+        batch = [self._pop() for _ in range(n)]
         
-        if batch:
+        if batch and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Retrieved batch of {len(batch)} alerts")
         
         return batch
     
+    async def drain_batch(self, max_n: int = 64) -> list:
+        """
+        Pop up to max_n alerts that are already queued, without waiting
+        
+        Args:
+            max_n: Maximum alerts to retrieve
+            
+        Returns:
+            List of QueuedAlert objects in priority order (may be empty)
+        """
+        n = min(max_n, len(self._heap))
+        return [self._pop() for _ in range(n)]
+    
     def size(self) -> int:
         """
         Get current queue size
@@ -233,7 +368,7 @@ class AlertQueue:
         Returns:
             Number of alerts in queue
         """
-        return self.queue.qsize()
+        return len(self._heap)
     
     def is_empty(self) -> bool:
         """
@@ -242,7 +377,7 @@ class AlertQueue:
         Returns:
             True if empty, False otherwise
         """
-        return self.queue.empty()
+        return not self._heap
     
     def is_full(self) -> bool:
         """
@@ -251,18 +386,19 @@ class AlertQueue:
         Returns:
             True if full, False otherwise
         """
-        return self.queue.full()
+        return 0 < self.max_size <= len(self._heap)
     
     async def clear(self):
         """Clear all alerts from queue"""
-        cleared = 0
-        while not self.is_empty():
-            try:
-                await asyncio.wait_for(self.queue.get(), timeout=0.1)
-                self.queue.task_done()
-                cleared += 1
-            except Exception:
-                break
+        cleared = len(self._heap)
+        self._heap.clear()
+        self._unfinished -= cleared
+        self._not_empty.clear()
+        if self._slots is not None:
+            for _ in range(cleared):
+                self._slots.release()
+        if self._unfinished == 0:
+            self._all_done.set()
         
         if cleared > 0:
             self.logger.info(f"Cleared {cleared} alerts from queue")
@@ -275,23 +411,21 @@ class AlertQueue:
             timeout: Maximum wait time (None = wait forever)
         """
         try:
-            if timeout is not None:
-                await asyncio.wait_for(self.queue.join(), timeout=timeout)
-            else:
-                await self.queue.join()
+            await asyncio.wait_for(self._all_done.wait(), timeout=timeout)
             self.logger.info("✅ Queue fully processed")
         except asyncio.TimeoutError:
             self.logger.warning(f"⚠️ Queue not empty after {timeout}s timeout")
     
     def get_stats(self) -> dict:
         """Get queue statistics"""
+        stats = self._stats
         return {
             "current_size": self.size(),
             "is_empty": self.is_empty(),
             "is_full": self.is_full(),
-            "total_queued": self._total_queued,
-            "total_processed": self._total_processed,
-            "total_failed": self._total_failed,
-            "total_retried": self._total_retried,
-            "success_rate": (self._total_processed / max(self._total_queued, 1)) * 100
+            "total_queued": stats[_QUEUED],
+            "total_processed": stats[_PROCESSED],
+            "total_failed": stats[_FAILED],
+            "total_retried": stats[_RETRIED],
+            "success_rate": (stats[_PROCESSED] / max(stats[_QUEUED], 1)) * 100
         }
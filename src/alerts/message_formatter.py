@@ -12,14 +12,35 @@ Every alert shows raw market data first:
 
 System bias (LONG/SHORT + confidence) at bottom as reference only.
 User decides entry based on data, not system conclusion.
+
+Output is Telegram HTML: static markup is written inline, dynamic text
+fields go through html.escape() once.
 """
 
+import time
+from html import escape
 from typing import Any
-from datetime import datetime, timezone, timedelta
 
 from ..utils.logger import setup_logger
 from ..utils.symbol_normalizer import display_symbol
 
+# WIB = UTC+7, as a fixed offset for time.gmtime()
+_WIB_OFFSET_SEC = 7 * 3600
+
+# Last formatted WIB clock time, reused for every message in the same second
+_last_ts_sec = -1
+_last_ts_str = ""
+
+
+def _now_hms_wib() -> str:
+    """Current WIB time as HH:MM:SS, recomputed at most once per second."""
+    global _last_ts_sec, _last_ts_str
+    now_sec = int(time.time())
+    if now_sec != _last_ts_sec:
+        _last_ts_str = time.strftime('%H:%M:%S', time.gmtime(now_sec + _WIB_OFFSET_SEC))
+        _last_ts_sec = now_sec
+    return _last_ts_str
+
 
 class MessageFormatter:
     """
@@ -29,8 +50,38 @@ class MessageFormatter:
     as a small reference at the bottom.
     """
 
-    # WIB = UTC+7
-    _WIB = timezone(timedelta(hours=7))
+    # Stop-hunt trigger labels per hunt direction: (sweep target, what to prepare)
+    _HUNT_LABELS = {
+        "SHORT_HUNT": ("BAWAH (hunt longs)", "LONG setelah sweep"),
+    }
+    _HUNT_LABELS_DEFAULT = ("ATAS (hunt shorts)", "SHORT setelah sweep")
+
+    # Priority -> emoji (1=urgent red, 2=watch yellow, else info blue)
+    _PRIORITY_EMOJI = {1: "\U0001f534", 2: "\U0001f7e1"}
+    _PRIORITY_EMOJI_DEFAULT = "\U0001f535"
+
+    # Bias direction -> (emoji, label); anything else is NEUTRAL
+    _BIAS_DIRECTIONS = {
+        "LONG": ("\U0001f4c8", "LONG"),
+        "BULLISH": ("\U0001f4c8", "LONG"),
+        "SHORT": ("\U0001f4c9", "SHORT"),
+        "BEARISH": ("\U0001f4c9", "SHORT"),
+    }
+    _BIAS_NEUTRAL = ("\u2796", "NEUTRAL")
+
+    # Market context verdict -> emoji
+    _ASSESSMENT_EMOJI = {
+        "FAVORABLE": "\u2705",
+        "NEUTRAL": "\u2796",
+        "UNFAVORABLE": "\u274c",
+    }
+
+    # Every bar for the lengths callers use, indexed by filled cell count
+    _BAR_TABLES = {
+        length: tuple("\u2588" * filled + "\u2591" * (length - filled)
+                      for filled in range(length + 1))
+        for length in (10, 20)
+    }
 
     def __init__(self):
         """Initialize message formatter"""
@@ -69,7 +120,9 @@ class MessageFormatter:
         7. Bias: system direction + confidence
         8. DYOR disclaimer
         """
-        ctx = signal.metadata.get('market_context', {})
+        metadata = signal.metadata
+        ctx = metadata.get('market_context', {})
+        ls = metadata.get('leading_score', {})
 
         # Build sections
         header = self._format_header(signal, ctx)
@@ -77,9 +130,9 @@ class MessageFormatter:
         order_flow = self._format_order_flow_section(ctx)
         funding = self._format_funding_section(ctx)
         whale = self._format_whale_section(ctx)
-        leading = self._format_leading_section(signal)
+        leading = self._format_leading_section(ls)
         price_action = self._format_price_action_section(ctx, signal)
-        bias = self._format_bias_line(signal)
+        bias = self._format_bias_line(signal, ctx, ls)
 
         # Assemble — skip empty sections instead of showing N/A
         hidden = sum(1 for s in [order_flow, funding] if not s)
@@ -95,18 +148,18 @@ class MessageFormatter:
         if price_action:
             sections.append(price_action)
         if hidden > 0:
-            sections.append("\U0001f4e1 _Market context limited_")
+            sections.append("\U0001f4e1 <i>Market context limited</i>")
         sections.append(bias)
 
         return "\n\n".join(sections)
 
     def _format_header(self, signal: Any, ctx: dict) -> str:
         """Header: symbol | price | time WIB"""
-        symbol_clean = display_symbol(signal.symbol)
+        symbol_clean = escape(display_symbol(signal.symbol), quote=False)
         price = ctx.get('current_price', 0)
         price_str = self.format_price(price) if price > 0 else "N/A"
-        time_str = datetime.now(self._WIB).strftime('%H:%M:%S')
-        return f"\u26a1 *{symbol_clean}* | {price_str} | {time_str} WIB"
+        time_str = _now_hms_wib()
+        return f"\u26a1 <b>{symbol_clean}</b> | {price_str} | {time_str} WIB"
 
     def _format_trigger_line(self, signal: Any) -> str:
         """Trigger line with signal type + full numerical detail"""
@@ -118,27 +171,29 @@ class MessageFormatter:
             direction = sh.get('direction', 'UNKNOWN')
             oi_spike = sh.get('oi_spike_pct', sh.get('directional_percentage', 0) * 100)
             crowded = sh.get('crowded_side', 'N/A')
-            crowding_reason = sh.get('crowding_reason', '')
+            crowding_reason = escape(sh.get('crowding_reason', ''), quote=False)
             conditions = sh.get('conditions_met', 0)
             long_pct = sh.get('long_pct', 50)
             short_pct = sh.get('short_pct', 50)
             cvd_ok = sh.get('cvd_aligned', False)
             oi_usd = sh.get('absorption_volume', 0)
 
-            sweep_dir = "BAWAH (hunt longs)" if direction == "SHORT_HUNT" else "ATAS (hunt shorts)"
-            prepare = "LONG setelah sweep" if direction == "SHORT_HUNT" else "SHORT setelah sweep"
-
-            lines = ["\U0001f534\U0001f534\U0001f534 *PRE-HUNT SCANNER* \U0001f534\U0001f534\U0001f534"]
-            lines.append(f"\u2550\u2550\u2550 SETUP BUILDING \u2014 {conditions}/3 \u2550\u2550\u2550")
-            lines.append(f"\U0001f4c8 OI Spike : {oi_spike:+.2f}% ({self._fmt_large_usd(oi_usd)} masuk)")
-            lines.append(f"\U0001f465 Crowding : {crowding_reason or 'balanced'}")
-            lines.append(f"\U0001f4ca L/S Ratio: {long_pct:.0f}%L / {short_pct:.0f}%S")
-            lines.append(f"\U0001f501 CVD Align: {'\u2705 selaras' if cvd_ok else '\u274c belum'}")
-            lines.append(f"\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550")
-            lines.append(f"\U0001f3af Prediksi : sweep ke {sweep_dir}")
-            lines.append(f"\u27a1\ufe0f Prepare  : *{prepare}*")
-            lines.append(f"\n\U0001f50d _Cek heatmap CoinGlass untuk konfirmasi cluster_")
-            return "\n".join(lines)
+            sweep_dir, prepare = self._HUNT_LABELS.get(direction, self._HUNT_LABELS_DEFAULT)
+            cvd_label = "\u2705 selaras" if cvd_ok else "\u274c belum"
+
+            # Fixed layout: one f-string, constant text folded at compile time
+            return (
+                f"\U0001f534\U0001f534\U0001f534 <b>PRE-HUNT SCANNER</b> \U0001f534\U0001f534\U0001f534\n"
+                f"\u2550\u2550\u2550 SETUP BUILDING \u2014 {conditions}/3 \u2550\u2550\u2550\n"
+                f"\U0001f4c8 OI Spike : {oi_spike:+.2f}% ({self._fmt_large_usd(oi_usd)} masuk)\n"
+                f"\U0001f465 Crowding : {crowding_reason or 'balanced'}\n"
+                f"\U0001f4ca L/S Ratio: {long_pct:.0f}%L / {short_pct:.0f}%S\n"
+                f"\U0001f501 CVD Align: {cvd_label}\n"
+                f"\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\n"
+                f"\U0001f3af Prediksi : sweep ke {sweep_dir}\n"
+                f"\u27a1\ufe0f Prepare  : <b>{prepare}</b>\n"
+                f"\n\U0001f50d <i>Cek heatmap CoinGlass untuk konfirmasi cluster</i>"
+            )
 
         elif sig_type in ("ACCUMULATION", "DISTRIBUTION"):
             of = metadata.get('order_flow', {})
@@ -147,7 +202,7 @@ class MessageFormatter:
             large_buys = of.get('large_buys', 0)
             large_sells = of.get('large_sells', 0)
             total_vol = of.get('total_volume', 0)
-            lines = [f"\U0001f514 *Trigger: {sig_type}*"]
+            lines = [f"\U0001f514 <b>Trigger: {sig_type}</b>"]
             lines.append(f"Volume   : {self._fmt_large_usd(total_vol)} | Net delta: {self._fmt_value(net)}")
             lines.append(f"Buy ratio: {buy_ratio:.0f}% | Whale orders: {large_buys}B/{large_sells}S")
             return "\n".join(lines)
@@ -155,58 +210,61 @@ class MessageFormatter:
         elif sig_type == "EVENT":
             events = metadata.get('events', [])
             count = len(events)
-            descs = [e.get('type', 'unknown').replace('_', ' ').title() for e in events[:3]]
-            lines = [f"\U0001f514 *Trigger: EVENT* ({count} event{'s' if count > 1 else ''})"]
+            descs = [escape(e.get('type', 'unknown').replace('_', ' ').title(), quote=False) for e in events[:3]]
+            lines = [f"\U0001f514 <b>Trigger: EVENT</b> ({count} event{'s' if count > 1 else ''})"]
             for d in descs:
                 lines.append(f"\u2022 {d}")
             return "\n".join(lines)
 
         else:
-            return f"\U0001f514 *Trigger: {sig_type}*"
+            return f"\U0001f514 <b>Trigger: {escape(sig_type, quote=False)}</b>"
 
     def _format_order_flow_section(self, ctx: dict) -> str:
         """Order Flow section: SpotCVD, FutCVD, OI, OBDelta with full numbers."""
-        has_spot = ctx.get('spot_cvd_direction', 'UNKNOWN') != 'UNKNOWN'
-        has_fut = ctx.get('futures_cvd_direction', 'UNKNOWN') != 'UNKNOWN'
-        has_oi = ctx.get('oi_usd', 0) > 0
-        has_ob = ctx.get('orderbook_dominant', 'UNKNOWN') != 'UNKNOWN'
-
-        if not any([has_spot, has_fut, has_oi, has_ob]):
+        # Bind each context field once
+        spot_dir = ctx.get('spot_cvd_direction', 'UNKNOWN')
+        fut_dir = ctx.get('futures_cvd_direction', 'UNKNOWN')
+        oi_usd = ctx.get('oi_usd', 0)
+        ob_dominant = ctx.get('orderbook_dominant', 'UNKNOWN')
+
+        has_spot = spot_dir != 'UNKNOWN'
+        has_fut = fut_dir != 'UNKNOWN'
+        has_oi = oi_usd > 0
+        has_ob = ob_dominant != 'UNKNOWN'
+
+        if not (has_spot or has_fut or has_oi or has_ob):
             return ""
 
-        lines = ["\U0001f4ca *ORDER FLOW*"]
+        fmt_value = self._fmt_value
+        fmt_usd = self._fmt_large_usd
+        lines = ["\U0001f4ca <b>ORDER FLOW</b>"]
 
         if has_spot:
-            spot_dir = ctx['spot_cvd_direction']
             chg = ctx.get('spot_cvd_change', 0)
             chg_arrow = "\u25b2" if chg > 0 else "\u25bc" if chg < 0 else "\u2192"
-            lines.append(f"SpotCVD  : {self._fmt_value(ctx.get('spot_cvd_latest', 0))} | \u039460m: {chg_arrow}{self._fmt_value(chg)} | {spot_dir}")
+            lines.append(f"SpotCVD  : {fmt_value(ctx.get('spot_cvd_latest', 0))} | \u039460m: {chg_arrow}{fmt_value(chg)} | {spot_dir}")
 
         if has_fut:
-            fut_dir = ctx['futures_cvd_direction']
             chg = ctx.get('futures_cvd_change', 0)
             chg_arrow = "\u25b2" if chg > 0 else "\u25bc" if chg < 0 else "\u2192"
-            lines.append(f"FutCVD   : {self._fmt_value(ctx.get('futures_cvd_latest', 0))} | \u039460m: {chg_arrow}{self._fmt_value(chg)} | {fut_dir}")
+            lines.append(f"FutCVD   : {fmt_value(ctx.get('futures_cvd_latest', 0))} | \u039460m: {chg_arrow}{fmt_value(chg)} | {fut_dir}")
 
         # CVD alignment label
-        cvd_align = ctx.get('cvd_alignment', 'NEUTRAL')
         if has_spot or has_fut:
-            lines.append(f"CVD sync : {cvd_align}")
+            lines.append(f"CVD sync : {ctx.get('cvd_alignment', 'NEUTRAL')}")
 
         if has_oi:
-            oi_usd = ctx['oi_usd']
             oi_change = ctx.get('oi_change_1h_pct', 0)
             oi_align = ctx.get('oi_alignment', 'NEUTRAL')
             oi_arrow = "\u25b2" if oi_change > 0 else "\u25bc" if oi_change < 0 else "\u25b6"
-            lines.append(f"OI       : {self._fmt_large_usd(oi_usd)} {oi_arrow} {oi_change:+.1f}% 1h [{oi_align}]")
+            lines.append(f"OI       : {fmt_usd(oi_usd)} {oi_arrow} {oi_change:+.1f}% 1h [{oi_align}]")
 
         if has_ob:
-            ob_dominant = ctx['orderbook_dominant']
             bid_vol = ctx.get('orderbook_bid_vol', 0)
             ask_vol = ctx.get('orderbook_ask_vol', 0)
             total_ob = bid_vol + ask_vol
             bid_pct = (bid_vol / total_ob * 100) if total_ob > 0 else 50
-            lines.append(f"OBDelta  : Bid {self._fmt_large_usd(bid_vol)} ({bid_pct:.0f}%) / Ask {self._fmt_large_usd(ask_vol)} ({100-bid_pct:.0f}%)")
+            lines.append(f"OBDelta  : Bid {fmt_usd(bid_vol)} ({bid_pct:.0f}%) / Ask {fmt_usd(ask_vol)} ({100-bid_pct:.0f}%)")
 
         return "\n".join(lines)
 
@@ -224,13 +282,13 @@ class MessageFormatter:
         def is_sane_fr(rate):
             return abs(rate) < 0.01  # < 1%
 
-        lines = ["\U0001f4b8 *FUNDING RATE*"]
+        lines = ["\U0001f4b8 <b>FUNDING RATE</b>"]
         if per_exchange:
             sane_rates = {k: v for k, v in per_exchange.items() if is_sane_fr(v)}
             if sane_rates:
                 sorted_rates = sorted(sane_rates.items(), key=lambda x: abs(x[1]), reverse=True)
                 for exchange, rate in sorted_rates[:5]:
-                    lines.append(f"{exchange:9s}: {rate * 100:+.4f}%")
+                    lines.append(f"{escape(exchange, quote=False):9s}: {rate * 100:+.4f}%")
             elif is_sane_fr(fr):
                 lines.append(f"Avg      : {fr * 100:+.4f}%")
             else:
@@ -256,7 +314,7 @@ class MessageFormatter:
         if whale_val < 1_000_000:
             return ""
 
-        lines = ["\U0001f40b *WHALE (Hyperliquid)*"]
+        lines = ["\U0001f40b <b>WHALE (Hyperliquid)</b>"]
 
         dir_label = whale_dir.upper() if whale_dir else "?"
         val_str = self._fmt_large_usd(whale_val)
@@ -281,7 +339,7 @@ class MessageFormatter:
         if price == 0 and volume == 0 and liq_24h == 0:
             return ""
 
-        lines = ["\U0001f4c8 *PRICE ACTION*"]
+        lines = ["\U0001f4c8 <b>PRICE ACTION</b>"]
 
         # Price + 24h change (omit % if from WebSocket since we don't have 24h data)
         if price > 0:
@@ -306,44 +364,32 @@ class MessageFormatter:
 
         return "\n".join(lines)
 
-    def _format_leading_section(self, signal: Any) -> str:
+    def _format_leading_section(self, ls: dict) -> str:
         """Leading indicators section with details. Returns '' if no data."""
-        ls = signal.metadata.get('leading_score', {})
         indicators = ls.get('indicators', [])
         notes = ls.get('notes', [])
 
         if not indicators and not notes:
             return ""
 
-        lines = ["\U0001f525 *LEADING SIGNALS*"]
+        lines = ["\U0001f525 <b>LEADING SIGNALS</b>"]
         for ind in indicators:
             if ind.get('detail'):
-                lines.append(f"\u2726 {ind['detail']}")
+                lines.append(f"\u2726 {escape(ind['detail'], quote=False)}")
         for note in notes:
-            lines.append(f"\u2726 {note}")
+            lines.append(f"\u2726 {escape(note, quote=False)}")
 
         return "\n".join(lines)
 
-    def _format_bias_line(self, signal: Any) -> str:
+    def _format_bias_line(self, signal: Any, ctx: dict, ls: dict) -> str:
         """System bias with leading label + progress bar + context verdict + DYOR"""
         direction = signal.direction.upper() if signal.direction else "NEUTRAL"
         confidence = signal.confidence
-        ctx = signal.metadata.get('market_context', {})
-
-        if direction in ("LONG", "BULLISH"):
-            dir_emoji = "\U0001f4c8"
-            dir_label = "LONG"
-        elif direction in ("SHORT", "BEARISH"):
-            dir_emoji = "\U0001f4c9"
-            dir_label = "SHORT"
-        else:
-            dir_emoji = "\u2796"
-            dir_label = "NEUTRAL"
+        dir_emoji, dir_label = self._BIAS_DIRECTIONS.get(direction, self._BIAS_NEUTRAL)
 
         # Use leading score label if available
-        ls = signal.metadata.get('leading_score', {})
         label_emoji = ls.get('label_emoji', '\U0001f3af')
-        label_text = ls.get('label_text', '')
+        label_text = escape(ls.get('label_text', ''), quote=False)
 
         # Progress bar
         bar = self.create_progress_bar(confidence, length=10)
@@ -357,11 +403,7 @@ class MessageFormatter:
         assessment = ctx.get('combined_assessment', '')
         assessment_line = ""
         if assessment:
-            assess_emoji = {
-                "FAVORABLE": "\u2705",
-                "NEUTRAL": "\u2796",
-                "UNFAVORABLE": "\u274c",
-            }.get(assessment, "")
+            assess_emoji = self._ASSESSMENT_EMOJI.get(assessment, "")
             assessment_line = f"\nContext  : {assess_emoji} {assessment}"
 
         return f"{header}\n{bar} {confidence:.0f}%{assessment_line}\n\u26a0\ufe0f DYOR \u2014 verifikasi sebelum entry"
@@ -405,20 +447,20 @@ class MessageFormatter:
         """Generic fallback formatter"""
         priority_emoji = self.get_priority_emoji(signal.priority)
 
-        return f"""{priority_emoji} *{signal.symbol}* - {signal.signal_type}
+        return f"""{priority_emoji} <b>{escape(signal.symbol, quote=False)}</b> - {signal.signal_type}
 
 Direction: {signal.direction}
 Sources: {', '.join(signal.sources)}
 
 \U0001f3af Confidence: {signal.confidence:.0f}%
-\u23f0 {datetime.now(self._WIB).strftime('%H:%M:%S')} WIB"""
+\u23f0 {_now_hms_wib()} WIB"""
 
     def format_error(self, signal: Any) -> str:
         """Format error message"""
-        return f"""\u26a0\ufe0f *Signal Formatting Error*
+        return f"""\u26a0\ufe0f <b>Signal Formatting Error</b>
 
-Symbol: {getattr(signal, 'symbol', 'Unknown')}
-Type: {getattr(signal, 'signal_type', 'Unknown')}
+Symbol: {escape(str(getattr(signal, 'symbol', 'Unknown')), quote=False)}
+Type: {escape(str(getattr(signal, 'signal_type', 'Unknown')), quote=False)}
 
 Please check logs for details."""
 
@@ -445,17 +487,15 @@ Please check logs for details."""
 
     def get_priority_emoji(self, priority: int) -> str:
         """Get emoji based on priority (1=urgent, 2=watch, 3=info)"""
-        if priority == 1:
-            return "\U0001f534"  # red circle
-        elif priority == 2:
-            return "\U0001f7e1"  # yellow circle
-        else:
-            return "\U0001f535"  # blue circle
+        return self._PRIORITY_EMOJI.get(priority, self._PRIORITY_EMOJI_DEFAULT)
 
     def create_progress_bar(self, percentage: float, length: int = 20) -> str:
         """Create visual progress bar"""
         filled = int(length * percentage / 100)
         filled = max(0, min(filled, length))
+        table = self._BAR_TABLES.get(length)
+        if table is not None:
+            return table[filled]
         return "\u2588" * filled + "\u2591" * (length - filled)
 
     def get_stats(self) -> dict:
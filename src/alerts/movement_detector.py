@@ -21,6 +21,7 @@ Data flow:
 """
 
 import time
+from html import escape
 import logging
 from datetime import datetime, timezone, timedelta
 
@@ -448,7 +449,7 @@ class MovementDetector:
             "direction": d_label,
             "grade": grade,
             "confidence": _grade_confidence(grade),
-            "message": msg,
+            "message": escape(msg, quote=False),
             "priority": 1 if grade == "A" else 2,
         }
 
@@ -535,7 +536,7 @@ class MovementDetector:
             "direction": "SHORT",
             "grade": "A",
             "confidence": _grade_confidence("A"),
-            "message": msg,
+            "message": escape(msg, quote=False),
             "priority": 1,
         }
 
@@ -622,7 +623,7 @@ class MovementDetector:
             "direction": "LONG",
             "grade": grade,
             "confidence": _grade_confidence(grade),
-            "message": msg,
+            "message": escape(msg, quote=False),
             "priority": 1,
         }
 
@@ -716,7 +717,7 @@ class MovementDetector:
                 "direction": "LONG" if current_side == "BUY" else "SHORT",
                 "grade": "A",
                 "confidence": _grade_confidence("A"),
-                "message": msg,
+                "message": escape(msg, quote=False),
                 "priority": 1,
             })
 
@@ -808,7 +809,7 @@ class MovementDetector:
                         "direction": d_label,
                         "grade": grade,
                         "confidence": _grade_confidence(grade),
-                        "message": msg,
+                        "message": escape(msg, quote=False),
                         "priority": 1 if grade == "A" else 2,
                     })
 
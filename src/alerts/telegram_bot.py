@@ -13,12 +13,112 @@ Responsibilities:
 """
 
 import asyncio
+import json
+import random
+import re
+import weakref
 import aiohttp
-from typing import Optional
-from datetime import datetime, timedelta
+from enum import Enum
+from typing import Optional, Tuple
+from datetime import datetime
 
 from ..utils.logger import setup_logger
 
+# Optional fast encoder; both produce compact UTF-8 JSON bytes
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One keep-alive pool per event loop, shared by every TelegramBot (all tier
+# bots talk to api.telegram.org); sessions borrow it with connector_owner=False
+SHARED_POOL_LIMIT = 50
+_shared_connectors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.TCPConnector]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_shared_connector(limit_per_host: int) -> aiohttp.TCPConnector:
+    """Return this loop's shared connector, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    connector = _shared_connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=SHARED_POOL_LIMIT,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=75
+        )
+        _shared_connectors[loop] = connector
+    return connector
+
+
+async def close_shared_connector():
+    """Close the running loop's shared connector (after all bots are closed)."""
+    connector = _shared_connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None and not connector.closed:
+        await connector.close()
+
+
+# Formatters emit Telegram HTML (<b>, <i>, escaped dynamic fields)
+DEFAULT_PARSE_MODE = "HTML"
+
+# Retry backoff: full jitter over min(cap, base * 2**attempt)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Telegram sendMessage hard limit, in characters
+TELEGRAM_MAX_LENGTH = 4096
+
+_TAG_RE = re.compile(r"<(/?)([a-zA-Z]+)[^>]*>")
+
+
+def _truncate_html(message: str, limit: int = TELEGRAM_MAX_LENGTH) -> str:
+    """
+    Cut an HTML message to at most limit characters without breaking markup
+    
+    Never splits a tag or an entity, and closes any tags left open after
+    the cut so Telegram can still parse the result.
+    """
+    if len(message) <= limit:
+        return message
+    
+    budget = limit - 3  # room for "..."
+    while budget > 0:
+        cut = message[:budget]
+        # Drop a trailing partial tag ("<b") or entity ("&amp")
+        lt = cut.rfind("<")
+        if lt > cut.rfind(">"):
+            cut = cut[:lt]
+        amp = cut.rfind("&")
+        if amp > cut.rfind(";"):
+            cut = cut[:amp]
+        
+        open_tags = []
+        for closing, name in _TAG_RE.findall(cut):
+            if not closing:
+                open_tags.append(name)
+            elif open_tags and open_tags[-1] == name:
+                open_tags.pop()
+        closers = "".join(f"</{name}>" for name in reversed(open_tags))
+        
+        result = cut + "..." + closers
+        if len(result) <= limit:
+            return result
+        budget -= len(result) - limit
+    return message[:limit]
+
+class SendOutcome(Enum):
+    """Result of a single sendMessage attempt"""
+    OK = "ok"
+    TIMEOUT = "timeout"
+    HTTP_429 = "http_429"
+    HTTP_5XX = "http_5xx"
+    OTHER = "other"
+
 class TelegramBot:
     """
     Production-ready Telegram bot
@@ -35,18 +135,26 @@ class TelegramBot:
     - Statistics tracking
     """
     
-    def __init__(self, bot_token: str, chat_id: str, rate_limit_delay: float = 3.0):
+    def __init__(self, bot_token: str, chat_id: str, rate_limit_delay: float = 3.0,
+                 connection_pool_size: int = 20, burst_capacity: int = 3,
+                 parse_mode: str = DEFAULT_PARSE_MODE):
         """
         Initialize Telegram bot
         
         Args:
             bot_token: Telegram bot token
             chat_id: Target chat ID
-            rate_limit_delay: Seconds between messages (default 3s = 20 msg/min)
+            rate_limit_delay: Long-run seconds per message (default 3s = 20 msg/min)
+            connection_pool_size: Max connections to api.telegram.org (applies
+                when this bot creates the loop's shared connector)
+            burst_capacity: Messages that may go out back-to-back after a lull
+            parse_mode: Telegram parse mode for alerts (HTML, Markdown or "")
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.rate_limit_delay = rate_limit_delay
+        self.connection_pool_size = connection_pool_size
+        self.parse_mode = parse_mode
         
         self.api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
         self.logger = setup_logger("TelegramBot", "INFO")
@@ -54,74 +162,130 @@ class TelegramBot:
         # Reusable aiohttp session (created lazily)
         self._session: Optional[aiohttp.ClientSession] = None
 
+        # Token bucket: a loop.call_later timer adds one token every
+        # rate_limit_delay seconds while below burst_capacity, so sending
+        # is a plain counter check; the timer is idle when the bucket is full
+        self._capacity = max(1, burst_capacity)
+        self._tokens = self._capacity
+        self._refill_interval = max(0.0, rate_limit_delay)
+        self._refill_handle: Optional[asyncio.TimerHandle] = None
+        self._tokens_available = asyncio.Event()
+
         # Statistics
         self._messages_sent = 0
         self._messages_failed = 0
         self._last_send_time = None
         
-    async def send_message(self, message: str, parse_mode: str = "Markdown") -> bool:
+    async def send_message(self, message: str, parse_mode: Optional[str] = None) -> bool:
         """
         Send message to Telegram
         
         Args:
             message: Message text
-            parse_mode: Markdown or HTML (default: Markdown)
+            parse_mode: HTML, Markdown or "" for plain (default: self.parse_mode)
             
         Returns:
             True if sent successfully, False otherwise
         """
+        if parse_mode is None:
+            parse_mode = self.parse_mode
+        outcome, _ = await self._send(message, self._encode_payload(message, parse_mode))
+        return outcome is SendOutcome.OK
+    
+    def _encode_payload(self, message: str, parse_mode: Optional[str] = None) -> bytes:
+        """Encode a sendMessage request body once, for reuse across retries"""
+        payload = {"chat_id": self.chat_id, "text": message}
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
+        return _json_dumps(payload)
+    
+    async def _send(self, message: str, body: bytes) -> Tuple[SendOutcome, float]:
+        """
+        Single send attempt, classified for the retry loop
+        
+        Args:
+            message: Message text (used for the plain-text fallback)
+            body: Pre-encoded JSON request body
+            
+        Returns:
+            (outcome, retry_after) - retry_after is Telegram's requested
+            wait in seconds on HTTP 429, otherwise 0
+        """
         try:
             # Rate limiting
             await self._wait_for_rate_limit()
             
-            # Prepare payload
-            payload = {
-                "chat_id": self.chat_id,
-                "text": message,
-                "parse_mode": parse_mode
-            }
-            
-            # Lazily create reusable session
-            if self._session is None or self._session.closed:
-                self._session = aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=15)
-                )
+            session = self._get_session()
 
             # Send via HTTP POST (reusing connection pool)
-            async with self._session.post(self.api_url, json=payload) as response:
+            async with session.post(self.api_url, data=body, headers=_JSON_HEADERS) as response:
                 if response.status == 200:
                     self._messages_sent += 1
                     self._last_send_time = datetime.now()
                     self.logger.info(f"✅ Message sent successfully")
-                    return True
-                else:
-                    error_text = await response.text()
-                    # Fallback: if Markdown parsing fails, retry without parse_mode
-                    if response.status == 400 and "parse entities" in error_text and parse_mode:
-                        self.logger.warning(f"⚠️ Markdown parse failed, retrying as plain text")
-                        plain_payload = {"chat_id": self.chat_id, "text": message}
-                        async with self._session.post(self.api_url, json=plain_payload) as r2:
-                            if r2.status == 200:
-                                self._messages_sent += 1
-                                self._last_send_time = datetime.now()
-                                self.logger.info(f"✅ Message sent (plain text fallback)")
-                                return True
-                    self.logger.error(f"❌ Send failed: {response.status} - {error_text}")
+                    return SendOutcome.OK, 0.0
+                
+                if response.status == 429:
+                    retry_after = await self._read_retry_after(response)
+                    self.logger.warning(f"⚠️ Rate limited by Telegram, retry after {retry_after}s")
                     self._messages_failed += 1
-                    return False
+                    return SendOutcome.HTTP_429, retry_after
+                
+                error_text = await response.text()
+                # Fallback: if markup parsing fails, retry without parse_mode
+                if response.status == 400 and "parse entities" in error_text:
+                    self.logger.warning(f"⚠️ Markup parse failed, retrying as plain text")
+                    plain_body = self._encode_payload(message)
+                    async with session.post(self.api_url, data=plain_body, headers=_JSON_HEADERS) as r2:
+                        if r2.status == 200:
+                            self._messages_sent += 1
+                            self._last_send_time = datetime.now()
+                            self.logger.info(f"✅ Message sent (plain text fallback)")
+                            return SendOutcome.OK, 0.0
+                self.logger.error(f"❌ Send failed: {response.status} - {error_text}")
+                self._messages_failed += 1
+                if response.status >= 500:
+                    return SendOutcome.HTTP_5XX, 0.0
+                return SendOutcome.OTHER, 0.0
                         
         except asyncio.TimeoutError:
             self.logger.error("❌ Send timeout")
             self._messages_failed += 1
-            return False
+            return SendOutcome.TIMEOUT, 0.0
         except Exception as e:
             self.logger.error(f"❌ Send error: {e}")
             self._messages_failed += 1
-            return False
+            return SendOutcome.OTHER, 0.0
+    
+    @staticmethod
+    async def _read_retry_after(response) -> float:
+        """Extract parameters.retry_after from a 429 body (0 if absent)"""
+        try:
+            body = await response.json(content_type=None)
+            return float(body.get("parameters", {}).get("retry_after", 0))
+        except Exception:
+            return 0.0
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the long-lived session, creating it on first use.
+        
+        The session borrows the loop-wide shared connector, which keeps TLS
+        connections alive between alerts so sends after a lull skip the
+        handshake. Creation has no await point, so concurrent senders on
+        the event loop cannot race here.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=_get_shared_connector(self.connection_pool_size),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
     
     async def send_with_retry(self, message: str, max_retries: int = 3) -> bool:
         """
-        Send message with retry logic and exponential backoff
+        Send message with retry logic and capped, jittered backoff
         
         Args:
             message: Message text
@@ -130,17 +294,31 @@ class TelegramBot:
         Returns:
             True if sent successfully, False after all retries failed
         """
+        # Encode once; every attempt posts the same bytes
+        body = self._encode_payload(message, self.parse_mode)
+        
         for attempt in range(max_retries):
-            success = await self.send_message(message)
+            outcome, retry_after = await self._send(message, body)
             
-            if success:
+            if outcome is SendOutcome.OK:
                 return True
             
             if attempt < max_retries - 1:
-                # Exponential backoff: 1s, 2s, 4s
-                wait_time = 2 ** attempt
-                self.logger.warning(f"⚠️ Retry {attempt + 1}/{max_retries} in {wait_time}s")
-                await asyncio.sleep(wait_time)
+                if outcome is SendOutcome.TIMEOUT:
+                    # The request already spent the full client timeout
+                    wait_time = 0.0
+                elif outcome is SendOutcome.HTTP_429 and retry_after > 0:
+                    wait_time = retry_after
+                else:
+                    # Capped exponential backoff with full jitter
+                    wait_time = random.uniform(
+                        0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+                    )
+                self.logger.warning(
+                    f"⚠️ Retry {attempt + 1}/{max_retries} ({outcome.value}) in {wait_time:.1f}s"
+                )
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
         
         self.logger.error(f"❌ Failed after {max_retries} retries")
         return False
@@ -161,10 +339,9 @@ class TelegramBot:
             self.logger.error("❌ Empty message")
             return False
         
-        # Telegram limit: 4096 characters
-        if len(formatted_message) > 4096:
+        if len(formatted_message) > TELEGRAM_MAX_LENGTH:
             self.logger.warning(f"⚠️ Message too long ({len(formatted_message)} chars), truncating")
-            formatted_message = formatted_message[:4090] + "..."
+            formatted_message = _truncate_html(formatted_message)
         
         return await self.send_with_retry(formatted_message)
     
@@ -191,16 +368,37 @@ class TelegramBot:
             return False
     
     async def _wait_for_rate_limit(self):
-        """Wait for rate limit delay if needed"""
-        if self._last_send_time:
-            elapsed = (datetime.now() - self._last_send_time).total_seconds()
-            if elapsed < self.rate_limit_delay:
-                wait_time = self.rate_limit_delay - elapsed
-                self.logger.debug(f"Rate limit: waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
+        """Take one token from the bucket, waiting for the refill timer if empty"""
+        if self._refill_interval == 0:
+            return
+        
+        while self._tokens < 1:
+            self.logger.debug("Rate limit: waiting for token refill")
+            self._arm_refill()
+            self._tokens_available.clear()
+            await self._tokens_available.wait()
+        
+        self._tokens -= 1
+        self._arm_refill()
+    
+    def _arm_refill(self):
+        """Schedule the next token refill if the bucket is below capacity"""
+        if self._refill_handle is None and self._tokens < self._capacity:
+            loop = asyncio.get_running_loop()
+            self._refill_handle = loop.call_later(self._refill_interval, self._refill)
+    
+    def _refill(self):
+        """Timer callback: add one token, wake waiters, re-arm while not full"""
+        self._refill_handle = None
+        self._tokens = min(self._capacity, self._tokens + 1)
+        self._tokens_available.set()
+        self._arm_refill()
     
     async def close(self):
         """Close aiohttp session to prevent resource leak."""
+        if self._refill_handle is not None:
+            self._refill_handle.cancel()
+            self._refill_handle = None
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
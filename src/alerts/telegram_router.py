@@ -14,7 +14,7 @@ Each tier has its own Telegram bot to avoid rate-limit interference.
 
 import asyncio
 from typing import Optional
-from .telegram_bot import TelegramBot
+from .telegram_bot import TelegramBot, close_shared_connector
 from ..utils.logger import setup_logger
 
 
@@ -98,9 +98,10 @@ class TelegramRouter:
         return results
 
     async def close(self):
-        """Close all bot sessions."""
+        """Close all bot sessions, then the connection pool they share."""
         for bot in self.bots.values():
             await bot.close()
+        await close_shared_connector()
 
     def get_stats(self) -> dict:
         """Get combined stats from all bots."""
@@ -19,21 +19,61 @@ Algorithm:
 """
 
 import time as _time
-from typing import List, Optional
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+from ..models.events import Side, StrEnum
 from ..utils.logger import setup_logger
 
-@dataclass
+# Repeat (event_type, symbol) signals within this window are suppressed
+DEDUP_WINDOW_SEC = 30
+
+# Cascade confidence by volume / threshold ratio: CONFIDENCE[i] past the i-th edge (>)
+CASCADE_RATIO_EDGES = (1.5, 2.5, 5.0)
+CASCADE_CONFIDENCE = (65.0, 75.0, 85.0, 95.0)
+
+# Last UTC ISO timestamp, shared by every signal emitted in the same second
+_last_ts_sec = -1
+_last_ts_iso = ""
+
+
+def _now_iso_utc() -> str:
+    """Current UTC time as ISO 8601 (second resolution), built once per second."""
+    global _last_ts_sec, _last_ts_iso
+    now_sec = int(_time.time())
+    if now_sec != _last_ts_sec:
+        _last_ts_iso = datetime.fromtimestamp(now_sec, timezone.utc).isoformat()
+        _last_ts_sec = now_sec
+    return _last_ts_iso
+
+
+class EventType(StrEnum):
+    """Event signal types (str-compatible, one shared object per value)"""
+    LIQUIDATION_CASCADE = "LIQUIDATION_CASCADE"
+    WHALE_ACCUMULATION = "WHALE_ACCUMULATION"
+    WHALE_DISTRIBUTION = "WHALE_DISTRIBUTION"
+    VOLUME_SPIKE = "VOLUME_SPIKE"
+
+# Log prefix per event type, written once a signal survives dedup
+_EVENT_EMOJI = {
+    EventType.LIQUIDATION_CASCADE: "⚡",
+    EventType.WHALE_ACCUMULATION: "🐋",
+    EventType.WHALE_DISTRIBUTION: "🐋",
+    EventType.VOLUME_SPIKE: "📈",
+}
+
+@dataclass(slots=True, frozen=True)
 class EventSignal:
-    """Event signal data structure"""
+    """Event signal data structure (immutable; use dataclasses.replace)"""
     event_type: str
     symbol: str
     description: str
     confidence: float
     timestamp: str
-    data: dict
+    data: dict = field(compare=False)
 
 class EventPatternDetector:
     """
@@ -64,6 +104,10 @@ class EventPatternDetector:
         self.logger = setup_logger("EventPatternDetector", "INFO")
         self._detections = 0
 
+        # (event_type, symbol) -> emit time, oldest first, for dedup
+        self._recent: "OrderedDict[tuple, float]" = OrderedDict()
+        self._duplicates_suppressed = 0
+
         # Tiered thresholds for dynamic all-coin monitoring
         monitoring = monitoring_config or {}
         self._tier1_symbols = set(monitoring.get('tier1_symbols', ['BTCUSDT', 'ETHUSDT']))
@@ -71,17 +115,33 @@ class EventPatternDetector:
         self._tier1_cascade = monitoring.get('tier1_cascade', 2_000_000)
         self._tier2_cascade = monitoring.get('tier2_cascade', 200_000)
         self._tier3_cascade = monitoring.get('tier3_cascade', 50_000)
+        self.rebuild_thresholds()
+
+    def rebuild_thresholds(self):
+        """
+        Flatten tier membership into per-symbol threshold dicts
+
+        Call again after changing the tier sets or tier thresholds.
+        Tier 1 wins if a symbol is listed in both tiers.
+        """
+        self._cascade_thresholds = {s: self._tier2_cascade for s in self._tier2_symbols}
+        self._cascade_thresholds.update({s: self._tier1_cascade for s in self._tier1_symbols})
+        self._default_cascade = self._tier3_cascade
+
+        # Large order threshold: $10K for BTC/ETH, $5K mid-caps, $2K small coins
+        self._large_order_thresholds = {
+            s: self.large_order_threshold * 0.5 for s in self._tier2_symbols
+        }
+        self._large_order_thresholds.update(
+            {s: self.large_order_threshold for s in self._tier1_symbols}
+        )
+        self._default_large_order = self.large_order_threshold * 0.2
 
     def get_threshold_for_symbol(self, symbol: str) -> float:
         """Get dynamic cascade threshold based on coin tier."""
-        if symbol in self._tier1_symbols:
-            return self._tier1_cascade
-        elif symbol in self._tier2_symbols:
-            return self._tier2_cascade
-        else:
-            return self._tier3_cascade
-
-    async def detect_liquidation_cascade(self, symbol: str, threshold: float = None) -> Optional[EventSignal]:
+        return self._cascade_thresholds.get(symbol, self._default_cascade)
+
+    def detect_liquidation_cascade(self, symbol: str, threshold: float = None) -> Optional[EventSignal]:
         """
         Detect liquidation cascade event
         
@@ -101,48 +161,39 @@ class EventPatternDetector:
             if threshold is None:
                 threshold = self.get_threshold_for_symbol(symbol)
 
-            liquidations = self.buffer_manager.get_liquidations(symbol, time_window=30)
+            # Running 30s sum maintained by BufferManager at ingest
+            total_volume, liquidation_count, _ = self.buffer_manager.get_window_sum(
+                symbol, 30, liquidations=True
+            )
 
-            if not liquidations:
+            if not liquidation_count:
                 return None
 
-            total_volume = sum(float(liq.get("vol", 0)) for liq in liquidations)
-
             if total_volume < threshold:
                 return None
 
             # Calculate confidence based on volume ratio to threshold
             volume_ratio = total_volume / max(threshold, 1)
-            if volume_ratio > 5.0:
-                confidence = 95.0
-            elif volume_ratio > 2.5:
-                confidence = 85.0
-            elif volume_ratio > 1.5:
-                confidence = 75.0
-            else:
-                confidence = 65.0
+            confidence = CASCADE_CONFIDENCE[bisect_left(CASCADE_RATIO_EDGES, volume_ratio)]
             
             description = (
                 f"Liquidation cascade detected: ${total_volume/1_000_000:.1f}M "
-                f"in {len(liquidations)} events over 30 seconds"
+                f"in {liquidation_count} events over 30 seconds"
             )
             
             signal = EventSignal(
-                event_type="LIQUIDATION_CASCADE",
+                event_type=EventType.LIQUIDATION_CASCADE,
                 symbol=symbol,
                 description=description,
                 confidence=confidence,
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=_now_iso_utc(),
                 data={
                     "total_volume": total_volume,
-                    "liquidation_count": len(liquidations),
+                    "liquidation_count": liquidation_count,
                     "time_window": 30
                 }
             )
             
-            self._detections += 1
-            self.logger.info(f"⚡ {description}")
-            
             return signal
             
         except Exception as e:
@@ -151,14 +202,10 @@ class EventPatternDetector:
     
     def _get_large_order_threshold(self, symbol: str) -> float:
         """Get tier-aware large order threshold for whale detection."""
-        if symbol in self._tier1_symbols:
-            return self.large_order_threshold  # $10K for BTC/ETH
-        elif symbol in self._tier2_symbols:
-            return self.large_order_threshold * 0.5  # $5K for mid-caps
-        else:
-            return self.large_order_threshold * 0.2  # $2K for small coins
-
-    async def detect_whale_accumulation_window(self, symbol: str, min_large_orders: int = 8) -> Optional[EventSignal]:
+        return self._large_order_thresholds.get(symbol, self._default_large_order)
+
+    def detect_whale_accumulation_window(self, symbol: str, min_large_orders: int = 8,
+                                         columns: tuple = None) -> Optional[EventSignal]:
         """
         Detect whale accumulation OR distribution window.
 
@@ -170,29 +217,29 @@ class EventPatternDetector:
         Args:
             symbol: Trading pair
             min_large_orders: Minimum large orders to detect (default 5)
+            columns: Pre-fetched 300s trade columns (fetched if None)
 
         Returns:
             EventSignal if detected, None otherwise
         """
         try:
-            trades = self.buffer_manager.get_trades(symbol, time_window=300)
+            if columns is None:
+                columns = self.buffer_manager.get_trade_columns(symbol, time_window=300)
+            vols, sides, _ = columns
 
-            if not trades or len(trades) < 20:
+            if len(vols) < 20:
                 return None
 
+            # Collect large-order sides; bail out before the side breakdown
+            # when there are too few whales (the common case)
             threshold = self._get_large_order_threshold(symbol)
-            large_buys = 0
-            large_sells = 0
+            large_sides = [side for vol, side in zip(vols, sides) if vol >= threshold]
 
-            for trade in trades:
-                vol = float(trade.get("vol", 0))
-                side = int(trade.get("side", 0))
+            if len(large_sides) < min_large_orders:
+                return None
 
-                if vol >= threshold:
-                    if side == 2:  # Buy
-                        large_buys += 1
-                    elif side == 1:  # Sell
-                        large_sells += 1
+            large_buys = large_sides.count(Side.BUY)
+            large_sells = large_sides.count(Side.SELL)
 
             total_large = large_buys + large_sells
 
@@ -204,7 +251,7 @@ class EventPatternDetector:
             # Detect accumulation (majority buys — tightened to 70%)
             if buy_ratio >= 0.7:
                 dominant_ratio = buy_ratio
-                event_type = "WHALE_ACCUMULATION"
+                event_type = EventType.WHALE_ACCUMULATION
                 description = (
                     f"Whale accumulation window: {large_buys} large buy orders "
                     f"vs {large_sells} sells in 5 minutes"
@@ -212,7 +259,7 @@ class EventPatternDetector:
             # Detect distribution (majority sells — tightened to 30%)
             elif buy_ratio <= 0.3:
                 dominant_ratio = 1.0 - buy_ratio  # sell ratio
-                event_type = "WHALE_DISTRIBUTION"
+                event_type = EventType.WHALE_DISTRIBUTION
                 description = (
                     f"Whale distribution window: {large_sells} large sell orders "
                     f"vs {large_buys} buys in 5 minutes"
@@ -227,7 +274,7 @@ class EventPatternDetector:
                 symbol=symbol,
                 description=description,
                 confidence=confidence,
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=_now_iso_utc(),
                 data={
                     "large_buys": large_buys,
                     "large_sells": large_sells,
@@ -236,16 +283,13 @@ class EventPatternDetector:
                 }
             )
 
-            self._detections += 1
-            self.logger.info(f"🐋 {description}")
-
             return signal
 
         except Exception as e:
             self.logger.error(f"Whale window detection failed: {e}")
             return None
     
-    async def detect_volume_spike(self, symbol: str, spike_multiplier: float = 3.0) -> Optional[EventSignal]:
+    def detect_volume_spike(self, symbol: str, spike_multiplier: float = 3.0) -> Optional[EventSignal]:
         """
         Detect volume spike
         
@@ -260,35 +304,26 @@ class EventPatternDetector:
             EventSignal if detected, None otherwise
         """
         try:
-            # Get recent trades (1 minute) - the potential spike window
-            recent_trades = self.buffer_manager.get_trades(symbol, time_window=60)
+            # Running 1-min and 5-min sums maintained by BufferManager at
+            # ingest; the 1-min window is a suffix of the 5-min one
+            recent_volume, recent_count, _ = self.buffer_manager.get_window_sum(symbol, 60)
+            total_volume, total_count, oldest_ms = self.buffer_manager.get_window_sum(symbol, 300)
 
-            # Get historical trades (5 minutes) for baseline
-            historical_trades = self.buffer_manager.get_trades(symbol, time_window=300)
-
-            if not recent_trades or not historical_trades:
+            # Need both a recent window and a baseline outside it
+            if recent_count == 0 or total_count <= recent_count:
                 return None
 
-            recent_volume = sum(float(t.get("vol", 0)) for t in recent_trades)
-
-            # Exclude the recent 1-min window from historical to avoid self-dilution
-            now_ms = int(_time.time() * 1000)
-            cutoff_ms = now_ms - 60_000
-            baseline_trades = [t for t in historical_trades if t.get("timestamp", 0) < cutoff_ms]
-
-            if not baseline_trades:
+            # Baseline excludes the recent 1-min window to avoid self-dilution;
+            # sub-dollar differences are running-sum float residue
+            baseline_volume = total_volume - recent_volume
+            if baseline_volume < 1.0:
                 return None
 
-            baseline_volume = sum(float(t.get("vol", 0)) for t in baseline_trades)
-
             # Calculate actual time span of baseline data
-            now_ts = _time.time()
-            oldest_ts = min(
-                (float(t.get("timestamp", now_ts * 1000)) / 1000 for t in baseline_trades),
-                default=now_ts
-            )
-            baseline_minutes = max((now_ts - 60 - oldest_ts) / 60, 1.0)
-            avg_volume_per_minute = baseline_volume / baseline_minutes
+            # (integer ms throughout, floored at one minute)
+            now_ms = int(_time.time() * 1000)
+            baseline_span_ms = max(now_ms - 60_000 - oldest_ms, 60_000)
+            avg_volume_per_minute = baseline_volume * 60_000 / baseline_span_ms
 
             if avg_volume_per_minute == 0:
                 return None
@@ -307,11 +342,11 @@ class EventPatternDetector:
             )
             
             signal = EventSignal(
-                event_type="VOLUME_SPIKE",
+                event_type=EventType.VOLUME_SPIKE,
                 symbol=symbol,
                 description=description,
                 confidence=confidence,
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=_now_iso_utc(),
                 data={
                     "recent_volume": recent_volume,
                     "avg_volume": avg_volume_per_minute,
@@ -319,50 +354,105 @@ class EventPatternDetector:
                 }
             )
             
-            self._detections += 1
-            self.logger.info(f"📈 {description}")
-            
             return signal
             
         except Exception as e:
             self.logger.error(f"Volume spike detection failed: {e}")
             return None
     
-    async def analyze(self, symbol: str) -> List[EventSignal]:
+    def analyze(self, symbol: str, trade_columns: tuple = None) -> List[EventSignal]:
         """
         Run all event detectors
         
         Args:
             symbol: Trading pair
+            trade_columns: Pre-fetched 300s trade columns (fetched if None)
             
         Returns:
             List of detected event signals
         """
-        signals = []
-        
         try:
-            # Detect liquidation cascade
-            cascade = await self.detect_liquidation_cascade(symbol)
-            if cascade:
-                signals.append(cascade)
+            if trade_columns is None:
+                trade_columns = self.buffer_manager.get_trade_columns(symbol, time_window=300)
+            return self._run_detectors(symbol, trade_columns)
             
-            # Detect whale accumulation
-            accumulation = await self.detect_whale_accumulation_window(symbol)
-            if accumulation:
-                signals.append(accumulation)
+        except Exception as e:
+            self.logger.error(f"Event analysis failed for {symbol}: {e}")
+            return []
+    
+    def analyze_many(self, symbols: List[str]) -> Dict[str, List[EventSignal]]:
+        """
+        Run all event detectors over a whole watchlist
+        
+        Trade buffers are snapshotted for every symbol under a single lock
+        hold, then each symbol's detectors run over its pre-fetched columns.
+        
+        Args:
+            symbols: Trading pairs
             
-            # Detect volume spike
-            volume_spike = await self.detect_volume_spike(symbol)
-            if volume_spike:
-                signals.append(volume_spike)
+        Returns:
+            {symbol: detected event signals}, only symbols with detections
+        """
+        results = {}
+        
+        try:
+            columns = self.buffer_manager.get_trade_columns_many(symbols, time_window=300)
+            for symbol, trade_columns in columns.items():
+                signals = self._run_detectors(symbol, trade_columns)
+                if signals:
+                    results[symbol] = signals
             
         except Exception as e:
-            self.logger.error(f"Event analysis failed for {symbol}: {e}")
+            self.logger.error(f"Event analysis failed for {len(symbols)} symbols: {e}")
         
+        return results
+    
+    def _run_detectors(self, symbol: str, trade_columns: tuple) -> List[EventSignal]:
+        """Run the three detectors, keeping new non-None results"""
+        # Each detector catches its own errors, so one failing path never
+        # hides the others' signals
+        now = _time.monotonic()
+        signals = [
+            signal for signal in (
+                self.detect_liquidation_cascade(symbol),
+                self.detect_whale_accumulation_window(symbol, columns=trade_columns),
+                self.detect_volume_spike(symbol),
+            )
+            if signal is not None and not self._is_duplicate(signal, now)
+        ]
+
+        # Count and log only what survives dedup, so repeats stay silent
+        for signal in signals:
+            self._detections += 1
+            self.logger.info(f"{_EVENT_EMOJI[signal.event_type]} {signal.description}")
+
         return signals
     
+    def _is_duplicate(self, signal: EventSignal, now: float) -> bool:
+        """
+        True if the same event fired for this symbol within DEDUP_WINDOW_SEC
+
+        Entries are kept in emit order, so expiry pops from the front. A
+        suppressed repeat does not extend the window, so a sustained event
+        re-alerts once per window.
+        """
+        recent = self._recent
+        while recent:
+            _, emitted = next(iter(recent.items()))
+            if now - emitted < DEDUP_WINDOW_SEC:
+                break
+            recent.popitem(last=False)
+
+        key = (signal.event_type, signal.symbol)
+        if key in recent:
+            self._duplicates_suppressed += 1
+            return True
+        recent[key] = now
+        return False
+    
     def get_stats(self) -> dict:
         """Get detector statistics"""
         return {
-            "total_detections": self._detections
+            "total_detections": self._detections,
+            "duplicates_suppressed": self._duplicates_suppressed
         }
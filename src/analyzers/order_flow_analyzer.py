@@ -19,13 +19,15 @@ Algorithm:
 5. Calculate confidence based on ratio clarity and whale activity
 """
 
-from typing import Optional, Tuple, List
+import time
+from bisect import bisect_left, bisect_right
+from typing import Dict, Optional, Tuple, List
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from ..utils.logger import setup_logger
 
-@dataclass
+@dataclass(slots=True)
 class OrderFlowSignal:
     """Order flow signal data structure"""
     symbol: str
@@ -37,10 +39,15 @@ class OrderFlowSignal:
     large_sells: int
     signal_type: str  # ACCUMULATION or DISTRIBUTION
     confidence: float
-    timestamp: str
+    timestamp: int  # Unix milliseconds
     total_trades: int
     net_delta: float
 
+    @property
+    def timestamp_iso(self) -> str:
+        """UTC ISO 8601 timestamp, formatted on demand"""
+        return datetime.fromtimestamp(self.timestamp / 1000, tz=timezone.utc).isoformat()
+
 class OrderFlowAnalyzer:
     """
     Production-ready order flow analyzer
@@ -54,6 +61,16 @@ class OrderFlowAnalyzer:
     - Accumulation/distribution signals
     - Confidence scoring
     """
+
+    # Confidence ladders: bonus[i] applies past the i-th edge
+    _RATIO_EDGES = (0.65, 0.7, 0.75, 0.8)           # buy/sell ratio clarity, >
+    _RATIO_BONUS = (0, 5, 10, 15, 20)
+    _LARGE_ORDER_EDGES = (3, 5, 7, 10)              # dominant large orders, >=
+    _LARGE_ORDER_BONUS = (0, 5, 10, 15, 20)
+    _VOLUME_EDGES = (1.0, 2.5, 5.0)                 # volume / tier threshold, >
+    _VOLUME_BONUS = (0, 5, 10, 15)
+    _TRADE_COUNT_EDGES = (50, 100)                  # total trades, >
+    _TRADE_COUNT_BONUS = (0, 3, 5)
     
     def __init__(
         self,
@@ -85,20 +102,37 @@ class OrderFlowAnalyzer:
         self._tier1_cascade = monitoring.get('tier1_cascade', 2_000_000)
         self._tier2_cascade = monitoring.get('tier2_cascade', 200_000)
         self._tier3_cascade = monitoring.get('tier3_cascade', 50_000)
+        self.rebuild_thresholds()
 
         self.logger = setup_logger("OrderFlowAnalyzer", "INFO")
         self._detections = 0
 
+    def rebuild_thresholds(self):
+        """
+        Flatten tier membership into per-symbol threshold dicts
+
+        Call again after changing the tier sets, tier thresholds or
+        large_order_threshold. Tier 1 wins if a symbol is listed in both tiers.
+        """
+        self._volume_thresholds = {s: self._tier2_cascade for s in self._tier2_symbols}
+        self._volume_thresholds.update({s: self._tier1_cascade for s in self._tier1_symbols})
+        self._default_volume = self._tier3_cascade
+
+        # Large order threshold: $10K for BTC/ETH, $5K mid-caps, $2K small coins
+        self._large_order_thresholds = {
+            s: self.large_order_threshold * 0.5 for s in self._tier2_symbols
+        }
+        self._large_order_thresholds.update(
+            {s: self.large_order_threshold for s in self._tier1_symbols}
+        )
+        self._default_large_order = self.large_order_threshold * 0.2
+
     def get_volume_threshold(self, symbol: str) -> float:
         """Get volume threshold for tier-aware confidence scoring."""
-        if symbol in self._tier1_symbols:
-            return self._tier1_cascade
-        elif symbol in self._tier2_symbols:
-            return self._tier2_cascade
-        else:
-            return self._tier3_cascade
+        return self._volume_thresholds.get(symbol, self._default_volume)
         
-    async def analyze(self, symbol: str, time_window: int = 300) -> Optional[OrderFlowSignal]:
+    def analyze(self, symbol: str, time_window: int = 300,
+                trade_columns: tuple = None) -> Optional[OrderFlowSignal]:
         """
         Analyze order flow for accumulation/distribution
         
@@ -113,79 +147,114 @@ class OrderFlowAnalyzer:
         Args:
             symbol: Trading pair (e.g., "ETHUSDT")
             time_window: Time window in seconds (default 300 = 5 minutes)
+            trade_columns: Pre-fetched trade columns for time_window (fetched if None)
             
         Returns:
             OrderFlowSignal if detected, None otherwise
         """
         try:
-            # Step 1: Get recent trades
-            trades = self.buffer_manager.get_trades(symbol, time_window=time_window)
-            
-            if not trades or len(trades) < 10:  # Need minimum trades
-                return None
-            
-            # Step 2: Calculate volumes
-            buy_volume, sell_volume = self.calculate_volumes(trades)
-            total_volume = buy_volume + sell_volume
-            
-            if total_volume == 0:
-                return None
-            
-            buy_ratio = buy_volume / total_volume
-            
-            # Step 3: Count large orders (tier-aware threshold)
-            large_buys, large_sells = self.count_large_orders(trades, symbol=symbol)
-            
-            # Step 4: Determine signal type
-            signal_type = self.determine_signal_type(buy_ratio, large_buys, large_sells)
-            
-            if not signal_type:
-                return None  # No clear signal
-            
-            # Step 5: Calculate confidence (tier-aware)
-            confidence = self.calculate_confidence(
-                buy_ratio=buy_ratio,
-                large_buys=large_buys,
-                large_sells=large_sells,
-                total_volume=total_volume,
-                total_trades=len(trades),
-                symbol=symbol
-            )
-            
-            # Calculate net delta
-            net_delta = buy_volume - sell_volume
-            
-            # Create signal
-            signal = OrderFlowSignal(
-                symbol=symbol,
-                time_window=time_window,
-                buy_volume=buy_volume,
-                sell_volume=sell_volume,
-                buy_ratio=buy_ratio,
-                large_buys=large_buys,
-                large_sells=large_sells,
-                signal_type=signal_type,
-                confidence=confidence,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                total_trades=len(trades),
-                net_delta=net_delta
-            )
-            
-            self._detections += 1
-            self.logger.info(
-                f"📊 Order flow: {symbol} - {signal_type} - "
-                f"Buy ratio: {buy_ratio*100:.1f}% - "
-                f"Whales: {large_buys}B/{large_sells}S - "
-                f"Confidence: {confidence:.0f}%"
-            )
-            
-            return signal
+            # Step 1: Get recent trades as (vol, side) columns
+            if trade_columns is None:
+                trade_columns = self.buffer_manager.get_trade_columns(symbol, time_window=time_window)
+            vols, sides, _ = trade_columns
+            return self._analyze_columns(symbol, vols, sides, time_window)
             
         except Exception as e:
             self.logger.error(f"Analysis failed for {symbol}: {e}")
             return None
     
-    def calculate_volumes(self, trades: List[dict]) -> Tuple[float, float]:
+    def analyze_many(self, symbols: List[str], time_window: int = 300) -> Dict[str, OrderFlowSignal]:
+        """
+        Analyze order flow over a whole watchlist
+        
+        Trade buffers are snapshotted for every symbol under a single lock
+        hold, then each symbol is scored from its pre-fetched columns.
+        
+        Args:
+            symbols: Trading pairs
+            time_window: Time window in seconds (default 300 = 5 minutes)
+            
+        Returns:
+            {symbol: OrderFlowSignal}, only symbols with a signal
+        """
+        results = {}
+        columns = self.buffer_manager.get_trade_columns_many(symbols, time_window=time_window)
+        
+        for symbol, (vols, sides, _) in columns.items():
+            try:
+                signal = self._analyze_columns(symbol, vols, sides, time_window)
+                if signal:
+                    results[symbol] = signal
+            except Exception as e:
+                self.logger.error(f"Analysis failed for {symbol}: {e}")
+        
+        return results
+    
+    def _analyze_columns(self, symbol: str, vols: List[float], sides: List[int],
+                         time_window: int) -> Optional[OrderFlowSignal]:
+        """Steps 2-6 of analyze() over pre-fetched trade columns"""
+        total_trades = len(vols)
+        
+        if total_trades < 10:  # Need minimum trades
+            return None
+        
+        # Steps 2-3: Volumes and large orders (tier-aware) in one pass
+        buy_volume, sell_volume, large_buys, large_sells = self._aggregate(
+            vols, sides, self.get_large_order_threshold(symbol)
+        )
+        total_volume = buy_volume + sell_volume
+        
+        if total_volume == 0:
+            return None
+        
+        buy_ratio = buy_volume / total_volume
+        
+        # Step 4: Determine signal type
+        signal_type = self.determine_signal_type(buy_ratio, large_buys, large_sells)
+        
+        if not signal_type:
+            return None  # No clear signal
+        
+        # Step 5: Calculate confidence (tier-aware)
+        confidence = self.calculate_confidence(
+            buy_ratio=buy_ratio,
+            large_buys=large_buys,
+            large_sells=large_sells,
+            total_volume=total_volume,
+            total_trades=total_trades,
+            symbol=symbol
+        )
+        
+        # Calculate net delta
+        net_delta = buy_volume - sell_volume
+        
+        # Create signal
+        signal = OrderFlowSignal(
+            symbol=symbol,
+            time_window=time_window,
+            buy_volume=buy_volume,
+            sell_volume=sell_volume,
+            buy_ratio=buy_ratio,
+            large_buys=large_buys,
+            large_sells=large_sells,
+            signal_type=signal_type,
+            confidence=confidence,
+            timestamp=int(time.time() * 1000),
+            total_trades=total_trades,
+            net_delta=net_delta
+        )
+        
+        self._detections += 1
+        self.logger.info(
+            f"📊 Order flow: {symbol} - {signal_type} - "
+            f"Buy ratio: {buy_ratio*100:.1f}% - "
+            f"Whales: {large_buys}B/{large_sells}S - "
+            f"Confidence: {confidence:.0f}%"
+        )
+        
+        return signal
+    
+    def calculate_volumes(self, vols: List[float], sides: List[int]) -> Tuple[float, float]:
         """
         Calculate buy and sell volumes
         
@@ -194,60 +263,60 @@ class OrderFlowAnalyzer:
         - 2 = Buy
         
         Args:
-            trades: List of trade events
+            vols: Trade volumes in USD (BufferManager.get_trade_columns)
+            sides: Trade sides, parallel to vols
             
         Returns:
             (buy_volume, sell_volume) tuple in USD
         """
-        buy_volume = 0.0
-        sell_volume = 0.0
-        
-        for trade in trades:
-            side = int(trade.get("side", 0))
-            vol = float(trade.get("vol", 0))
-
-            if side == 2:  # Buy
-                buy_volume += vol
-            elif side == 1:  # Sell
-                sell_volume += vol
-        
+        buy_volume, sell_volume, _, _ = self._aggregate(vols, sides, float("inf"))
         return (buy_volume, sell_volume)
     
     def get_large_order_threshold(self, symbol: str) -> float:
         """Get tier-aware large order threshold for fair whale detection."""
-        if symbol in self._tier1_symbols:
-            return self.large_order_threshold  # $10K for BTC/ETH
-        elif symbol in self._tier2_symbols:
-            return self.large_order_threshold * 0.5  # $5K for mid-caps
-        else:
-            return self.large_order_threshold * 0.2  # $2K for small coins
+        return self._large_order_thresholds.get(symbol, self._default_large_order)
 
-    def count_large_orders(self, trades: List[dict], symbol: str = "") -> Tuple[int, int]:
+    def count_large_orders(self, vols: List[float], sides: List[int], symbol: str = "") -> Tuple[int, int]:
         """
         Count large buy and sell orders (whale activity) with tier-aware thresholds.
 
         Args:
-            trades: List of trade events
+            vols: Trade volumes in USD (BufferManager.get_trade_columns)
+            sides: Trade sides, parallel to vols
             symbol: Trading pair for tier-aware threshold
 
         Returns:
             (large_buys, large_sells) count tuple
         """
-        large_buys = 0
-        large_sells = 0
         threshold = self.get_large_order_threshold(symbol) if symbol else self.large_order_threshold
+        _, _, large_buys, large_sells = self._aggregate(vols, sides, threshold)
+        return (large_buys, large_sells)
+
+    @staticmethod
+    def _aggregate(vols: List[float], sides: List[int],
+                   threshold: float) -> Tuple[float, float, int, int]:
+        """
+        Single pass over the trade columns
 
-        for trade in trades:
-            side = int(trade.get("side", 0))
-            vol = float(trade.get("vol", 0))
+        Returns:
+            (buy_volume, sell_volume, large_buys, large_sells)
+        """
+        buy_volume = 0.0
+        sell_volume = 0.0
+        large_buys = 0
+        large_sells = 0
 
-            if vol >= threshold:
-                if side == 2:  # Large buy
+        for vol, side in zip(vols, sides):
+            if side == 2:  # Buy
+                buy_volume += vol
+                if vol >= threshold:
                     large_buys += 1
-                elif side == 1:  # Large sell
+            elif side == 1:  # Sell
+                sell_volume += vol
+                if vol >= threshold:
                     large_sells += 1
 
-        return (large_buys, large_sells)
+        return (buy_volume, sell_volume, large_buys, large_sells)
     
     def determine_signal_type(self, buy_ratio: float, large_buys: int, large_sells: int) -> Optional[str]:
         """
@@ -304,44 +373,23 @@ class OrderFlowAnalyzer:
         """
         confidence = 50.0  # Base
 
-        # Factor 1: Ratio clarity
-        if buy_ratio > 0.8 or buy_ratio < 0.2:
-            confidence += 20
-        elif buy_ratio > 0.75 or buy_ratio < 0.25:
-            confidence += 15
-        elif buy_ratio > 0.7 or buy_ratio < 0.3:
-            confidence += 10
-        elif buy_ratio > 0.65 or buy_ratio < 0.35:
-            confidence += 5
+        # Factor 1: Ratio clarity (distance from 50/50 in either direction)
+        clarity = max(buy_ratio, 1.0 - buy_ratio)
+        confidence += self._RATIO_BONUS[bisect_left(self._RATIO_EDGES, clarity)]
 
         # Factor 2: Large order count
         dominant_large_orders = max(large_buys, large_sells)
-
-        if dominant_large_orders >= 10:
-            confidence += 20
-        elif dominant_large_orders >= 7:
-            confidence += 15
-        elif dominant_large_orders >= 5:
-            confidence += 10
-        elif dominant_large_orders >= 3:
-            confidence += 5
+        confidence += self._LARGE_ORDER_BONUS[
+            bisect_right(self._LARGE_ORDER_EDGES, dominant_large_orders)
+        ]
 
         # Factor 3: Volume relative to tier threshold (fair for all coin sizes)
         threshold = self.get_volume_threshold(symbol) if symbol else 2_000_000
         volume_ratio = total_volume / max(threshold, 1)
-
-        if volume_ratio > 5.0:
-            confidence += 15
-        elif volume_ratio > 2.5:
-            confidence += 10
-        elif volume_ratio > 1.0:
-            confidence += 5
+        confidence += self._VOLUME_BONUS[bisect_left(self._VOLUME_EDGES, volume_ratio)]
 
         # Factor 4: Trade count
-        if total_trades > 100:
-            confidence += 5
-        elif total_trades > 50:
-            confidence += 3
+        confidence += self._TRADE_COUNT_BONUS[bisect_left(self._TRADE_COUNT_EDGES, total_trades)]
 
         return min(confidence, 99.0)
     
@@ -18,6 +18,8 @@ Direction logic:
 - No clear crowding → use CVD direction as bias
 """
 
+import time
+from bisect import bisect_right
 from typing import Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -39,7 +41,7 @@ class StopHuntSignal:
     absorption_detected: bool    # True if CVD confirms (aligned)
     absorption_volume: float     # OI change in USD (absolute)
     confidence: float
-    timestamp: str
+    timestamp: int               # Unix milliseconds
     liquidation_count: int       # Crowding strength (long_pct or short_pct as int)
     directional_percentage: float  # OI change % (e.g., 0.023 = 2.3%)
     # New fields for pre-hunt metadata
@@ -52,6 +54,11 @@ class StopHuntSignal:
     cvd_aligned: bool = False
     conditions_met: int = 0
 
+    @property
+    def timestamp_iso(self) -> str:
+        """UTC ISO 8601 timestamp, formatted on demand"""
+        return datetime.fromtimestamp(self.timestamp / 1000, tz=timezone.utc).isoformat()
+
 
 class StopHuntDetector:
     """
@@ -65,6 +72,12 @@ class StopHuntDetector:
     Alerts BEFORE the sweep so the trader can prepare and watch the heatmap.
     """
 
+    # Confidence ladders: bonus[i] applies at or past the i-th edge (>=)
+    _OI_RATIO_EDGES = (1.5, 2.0, 3.0)        # |OI change| / tier threshold
+    _OI_RATIO_BONUS = (10, 15, 20, 25)
+    _CROWDING_EDGES = (60, 65, 70)           # dominant L/S side, %
+    _CROWDING_BONUS = (0, 10, 15, 20)
+
     def __init__(self, buffer_manager, threshold: float = 2000000,
                  absorption_threshold: float = 100000,
                  absorption_min_order_usd: float = 5000,
@@ -95,28 +108,34 @@ class StopHuntDetector:
         self._tier2_cooldown = monitoring.get('tier2_cooldown', 3600)   # 1h
         self._tier3_cooldown = monitoring.get('tier3_cooldown', 2700)   # 45m
         self._tier4_cooldown = monitoring.get('tier4_cooldown', 1800)   # 30m
+        self.rebuild_thresholds()
+
+    def rebuild_thresholds(self):
+        """
+        Flatten tier membership into a per-symbol tier dict
+
+        Call again after changing the tier sets or cooldowns. The lowest
+        tier number wins if a symbol is listed in several tiers.
+        """
+        self._symbol_tiers = {s: 3 for s in self._tier3_symbols}
+        self._symbol_tiers.update({s: 2 for s in self._tier2_symbols})
+        self._symbol_tiers.update({s: 1 for s in self._tier1_symbols})
+        self._cooldowns = {1: self._tier1_cooldown, 2: self._tier2_cooldown,
+                           3: self._tier3_cooldown, 4: self._tier4_cooldown}
 
     def _get_tier(self, symbol: str) -> int:
-        if symbol in self._tier1_symbols:
-            return 1
-        elif symbol in self._tier2_symbols:
-            return 2
-        elif symbol in self._tier3_symbols:
-            return 3
-        return 4
+        return self._symbol_tiers.get(symbol, 4)
 
     def _get_cooldown(self, symbol: str) -> int:
-        tier = self._get_tier(symbol)
-        return {1: self._tier1_cooldown, 2: self._tier2_cooldown,
-                3: self._tier3_cooldown, 4: self._tier4_cooldown}[tier]
+        return self._cooldowns[self._get_tier(symbol)]
 
     def get_threshold_for_symbol(self, symbol: str) -> tuple:
         """Backward compat — returns (oi_threshold_pct, 0) for this scanner."""
         tier = self._get_tier(symbol)
         return (self._oi_thresholds.get(tier, 2.0), 0)
 
-    async def analyze(self, symbol: str, cascade_window: int = 30,
-                      absorption_window: int = 30) -> Optional[StopHuntSignal]:
+    def analyze(self, symbol: str, cascade_window: int = 30,
+                absorption_window: int = 30) -> Optional[StopHuntSignal]:
         """
         Scan for pre-hunt setup conditions.
 
@@ -127,7 +146,7 @@ class StopHuntDetector:
                 return None
 
             # Cooldown check
-            now = datetime.now(timezone.utc).timestamp()
+            now = time.time()
             last = self._last_alert.get(symbol, 0)
             cooldown = self._get_cooldown(symbol)
             if now - last < cooldown:
@@ -246,7 +265,7 @@ class StopHuntDetector:
                 absorption_detected=cvd_aligned,
                 absorption_volume=oi_change_usd,
                 confidence=confidence,
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=int(now * 1000),
                 liquidation_count=int(max(long_pct, short_pct)),
                 directional_percentage=abs(oi_change_pct) / 100,
                 oi_spike_pct=oi_change_pct,
@@ -293,23 +312,11 @@ class StopHuntDetector:
 
         # OI spike strength (10-25 points)
         oi_ratio = abs(oi_change_pct) / max(oi_threshold, 0.1)
-        if oi_ratio >= 3.0:
-            confidence += 25
-        elif oi_ratio >= 2.0:
-            confidence += 20
-        elif oi_ratio >= 1.5:
-            confidence += 15
-        else:
-            confidence += 10
+        confidence += self._OI_RATIO_BONUS[bisect_right(self._OI_RATIO_EDGES, oi_ratio)]
 
         # Crowding strength (0-20 points)
         if crowding_met:
-            if crowded_pct >= 70:
-                confidence += 20
-            elif crowded_pct >= 65:
-                confidence += 15
-            elif crowded_pct >= 60:
-                confidence += 10
+            confidence += self._CROWDING_BONUS[bisect_right(self._CROWDING_EDGES, crowded_pct)]
 
             # FR extreme bonus
             if abs(fr) >= 0.0005:  # ≥0.05%
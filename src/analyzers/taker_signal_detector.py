@@ -10,6 +10,7 @@ Data source: CVDSnapshot.taker_buy_vol / taker_sell_vol from MarketContextBuffer
 """
 
 import time
+from html import escape
 import logging
 from collections import deque
 from datetime import datetime, timezone, timedelta
@@ -280,7 +281,7 @@ class TakerSignalDetector:
             "symbol": symbol,
             "direction": direction,
             "tier": 1,
-            "message": msg,
+            "message": escape(msg, quote=False),
             "is_combo": is_combo,
         }
 
@@ -335,6 +336,6 @@ class TakerSignalDetector:
             "symbol": symbol,
             "direction": direction,
             "tier": 1,
-            "message": msg,
+            "message": escape(msg, quote=False),
             "is_combo": is_combo,
         }
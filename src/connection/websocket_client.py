@@ -25,6 +25,14 @@ from typing import Optional, Callable, Dict, Any
 from enum import Enum
 import logging
 
+# Optional fast JSON decoder for the per-frame hot path; stdlib fallback.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except works.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import logger
 from ..utils.logger import setup_logger
 
@@ -83,10 +91,13 @@ class WebSocketClient:
         self.on_disconnect_callback: Optional[Callable] = None
         self.on_message_callback: Optional[Callable] = None
         self.on_error_callback: Optional[Callable] = None
+        self.on_pong_callback: Optional[Callable] = None
         
         # Tasks
         self._receive_task: Optional[asyncio.Task] = None
-        self._heartbeat_task: Optional[asyncio.Task] = None
+        # Heartbeat runs off the loop's timer heap, not a sleeping task
+        self._ping_handle: Optional[asyncio.TimerHandle] = None
+        self._ping_task: Optional[asyncio.Task] = None
         self._consecutive_timeouts = 0
         self._max_consecutive_timeouts = 3
 
@@ -111,8 +122,7 @@ class WebSocketClient:
                 self.logger.info(f"Connecting to {self.url}...")
 
                 # Cancel old tasks before creating new ones
-                if self._heartbeat_task and not self._heartbeat_task.done():
-                    self._heartbeat_task.cancel()
+                self._cancel_heartbeat()
                 if self._receive_task and not self._receive_task.done():
                     self._receive_task.cancel()
 
@@ -131,7 +141,7 @@ class WebSocketClient:
 
                 # Start background tasks
                 self._receive_task = asyncio.create_task(self._receive_loop())
-                self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+                self._arm_heartbeat()
 
                 # Call connect callback
                 if self.on_connect_callback:
@@ -181,13 +191,7 @@ class WebSocketClient:
             except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass
                 
-        if self._heartbeat_task and not self._heartbeat_task.done():
-            self._heartbeat_task.cancel()
-            try:
-                # CRITICAL FIX: Add 5s timeout for task cleanup
-                await asyncio.wait_for(self._heartbeat_task, timeout=5.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                pass
+        self._cancel_heartbeat()
         
         # Close connection with timeout
         if self.connection and not self.connection.closed:
@@ -289,12 +293,14 @@ class WebSocketClient:
             message: Raw message string
         """
         try:
-            data = json.loads(message)
-            self.logger.debug(f"Received: {data}")
+            data = _json_loads(message)
+            self.logger.debug("Received: %s", data)
             
             # Handle pong response
             if data.get("event") == "pong":
                 self.logger.debug("Received pong")
+                if self.on_pong_callback:
+                    await self.on_pong_callback()
                 return
             
             # Call message callback
@@ -306,24 +312,40 @@ class WebSocketClient:
         except Exception as e:
             self.logger.error(f"Error handling message: {e}")
     
-    async def _heartbeat_loop(self):
+    def _arm_heartbeat(self):
+        """Schedule the next ping heartbeat_interval seconds from now"""
+        self._ping_handle = asyncio.get_running_loop().call_later(
+            self.heartbeat_interval, self._send_ping_and_reschedule
+        )
+    
+    def _cancel_heartbeat(self):
+        """Cancel the pending ping timer and any in-flight ping send"""
+        if self._ping_handle:
+            self._ping_handle.cancel()
+            self._ping_handle = None
+        if self._ping_task and not self._ping_task.done():
+            self._ping_task.cancel()
+        self._ping_task = None
+    
+    def _send_ping_and_reschedule(self):
         """
-        Background task to send heartbeat (ping)
+        Timer callback: send heartbeat (ping) and re-arm the timer.
+        Stops re-arming once the connection is gone.
         """
+        self._ping_handle = None
+        if not self.is_connected():
+            return
+        
+        self._ping_task = asyncio.ensure_future(self._send_ping())
+        self._arm_heartbeat()
+    
+    async def _send_ping(self):
         try:
-            while self.is_connected():
-                await asyncio.sleep(self.heartbeat_interval)
-                
-                if self.is_connected():
-                    ping_message = {"event": "ping"}
-                    await self.send_message(ping_message)
-                    self.logger.debug("Sent ping")
-                    
-        except asyncio.CancelledError:
-            self.logger.debug("Heartbeat loop cancelled")
-            raise
+            ping_message = {"event": "ping"}
+            await self.send_message(ping_message)
+            self.logger.debug("Sent ping")
         except Exception as e:
-            self.logger.error(f"Heartbeat loop error: {e}")
+            self.logger.error(f"Heartbeat error: {e}")
     
     async def _schedule_reconnect(self):
         """
@@ -338,6 +360,7 @@ class WebSocketClient:
         self.state = ConnectionState.DISCONNECTED
         self._is_authenticated = False
         self.connection = None
+        self._cancel_heartbeat()
 
         # Schedule as a new task so _receive_loop's finally block can exit cleanly
         asyncio.create_task(self._reconnect_after_delay())
@@ -398,3 +421,7 @@ class WebSocketClient:
     def on_error(self, callback: Callable):
         """Set on_error callback"""
         self.on_error_callback = callback
+
+    def on_pong(self, callback: Callable):
+        """Set on_pong callback (heartbeat acknowledged)"""
+        self.on_pong_callback = callback
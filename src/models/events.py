@@ -7,8 +7,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from enum import Enum, IntEnum
 from typing import List, Optional, Union
 
+try:
+    from enum import StrEnum
+except ImportError:  # Python 3.10
+    class StrEnum(str, Enum):
+        """str-valued Enum whose str() is its value, as in Python 3.11+."""
+
+        def __str__(self) -> str:
+            return str(self.value)
+
+        def __format__(self, format_spec: str) -> str:
+            return str.__format__(str(self.value), format_spec)
+
+
+class Side(IntEnum):
+    """CoinGlass side codes (int-compatible, compares equal to raw 1/2)."""
+    SELL = 1
+    BUY = 2
+
 
 @dataclass(slots=True)
 class LiquidationEvent:
@@ -15,12 +15,61 @@ Responsibilities:
 import threading
 from collections import deque
 from copy import deepcopy
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import time
 
 from ..utils.logger import setup_logger
 
+# Windows (seconds) kept as running sums for the event detectors
+LIQUIDATION_SUM_WINDOWS = (30,)
+TRADE_SUM_WINDOWS = (60, 300)
+
+class SlidingWindowSum:
+    """
+    Running volume sum over a time window, updated incrementally
+
+    Mirrors the tail of a per-symbol buffer: holds at most maxlen
+    (timestamp_ms, vol) pairs, so it drops events exactly when the buffer
+    evicts them, and expires the rest lazily from the left on read.
+    """
+
+    __slots__ = ("window_ms", "maxlen", "total", "_events")
+
+    def __init__(self, window_sec: int, maxlen: int):
+        self.window_ms = window_sec * 1000
+        self.maxlen = maxlen
+        self.total = 0.0
+        self._events: deque = deque()
+
+    def add(self, ts: int, vol: float):
+        if len(self._events) >= self.maxlen:
+            self._drop_oldest()
+        self._events.append((ts, vol))
+        self.total += vol
+
+    def expire(self, now_ms: int):
+        """Drop events older than the window, O(expired)"""
+        cutoff = now_ms - self.window_ms
+        events = self._events
+        while events and events[0][0] < cutoff:
+            self._drop_oldest()
+
+    def oldest_ts(self) -> int:
+        return self._events[0][0] if self._events else 0
+
+    def clear(self):
+        self._events.clear()
+        self.total = 0.0
+
+    def _drop_oldest(self):
+        self.total -= self._events.popleft()[1]
+        if not self._events:
+            self.total = 0.0  # no float residue once empty
+
+    def __len__(self) -> int:
+        return len(self._events)
+
 class BufferManager:
     """
     Production-ready rolling buffer manager
@@ -53,6 +102,9 @@ class BufferManager:
         self._total_trades = 0
         self._symbols_tracked = set()
         
+        # Symbols with events added since the last pop_dirty()
+        self._dirty: set = set()
+        
         # Track evicted messages (oldest auto-removed when buffer full)
         self._evicted_liquidations = 0
         self._evicted_trades = 0
@@ -63,6 +115,10 @@ class BufferManager:
         self._hourly_trade_volume: Dict[str, deque] = {}
         self._last_hourly_update: float = 0
 
+        # Running window sums per symbol: {symbol: {window_sec: SlidingWindowSum}}
+        self._liq_sums: Dict[str, Dict[int, SlidingWindowSum]] = {}
+        self._trade_sums: Dict[str, Dict[int, SlidingWindowSum]] = {}
+
         # Thread safety
         self._lock = threading.Lock()
 
@@ -84,6 +140,7 @@ class BufferManager:
             event_copy = event.to_dict() if hasattr(event, "to_dict") else dict(event)
             if "timestamp" not in event_copy:
                 event_copy["timestamp"] = int(time.time() * 1000)
+            self._normalize(event_copy)
 
             with self._lock:
                 if symbol not in self.liquidation_buffers:
@@ -101,6 +158,9 @@ class BufferManager:
 
                 buffer.append(event_copy)
                 self._total_liquidations += 1
+                self._dirty.add(symbol)
+                self._feed_sums(self._liq_sums, symbol, event_copy, self.max_liquidations,
+                                LIQUIDATION_SUM_WINDOWS)
 
         except Exception as e:
             self.logger.error(f"Failed to add liquidation: {e}")
@@ -119,6 +179,7 @@ class BufferManager:
             event_copy = event.to_dict() if hasattr(event, "to_dict") else dict(event)
             if "timestamp" not in event_copy:
                 event_copy["timestamp"] = int(time.time() * 1000)
+            self._normalize(event_copy)
 
             with self._lock:
                 if symbol not in self.trade_buffers:
@@ -136,10 +197,78 @@ class BufferManager:
 
                 buffer.append(event_copy)
                 self._total_trades += 1
+                self._dirty.add(symbol)
+                self._feed_sums(self._trade_sums, symbol, event_copy, self.max_trades,
+                                TRADE_SUM_WINDOWS)
 
         except Exception as e:
             self.logger.error(f"Failed to add trade: {e}")
     
+    @staticmethod
+    def _normalize(event: dict):
+        """Coerce "vol" to float and "side" to int once, so readers index directly"""
+        event["vol"] = float(event.get("vol") or 0)
+        event["side"] = int(event.get("side") or 0)
+
+    @staticmethod
+    def _feed_sums(sums: Dict[str, Dict[int, SlidingWindowSum]], symbol: str,
+                   event: dict, maxlen: int, windows: tuple):
+        """Append event to symbol's running window sums; caller holds self._lock"""
+        per_window = sums.get(symbol)
+        if per_window is None:
+            per_window = sums[symbol] = {w: SlidingWindowSum(w, maxlen) for w in windows}
+        ts = event["timestamp"]
+        vol = event["vol"]
+        for window_sum in per_window.values():
+            window_sum.add(ts, vol)
+
+    def get_window_sum(self, symbol: str, time_window: int,
+                       liquidations: bool = False) -> Tuple[float, int, int]:
+        """
+        Volume total and event count within time window
+        
+        O(expired events) for the windows in LIQUIDATION_SUM_WINDOWS /
+        TRADE_SUM_WINDOWS; other windows fall back to a buffer scan.
+        
+        Args:
+            symbol: Trading pair
+            time_window: Time window in seconds
+            liquidations: Sum liquidations instead of trades
+            
+        Returns:
+            (total_volume, event_count, oldest_timestamp_ms or 0)
+        """
+        try:
+            now_ms = int(time.time() * 1000)
+            sums = self._liq_sums if liquidations else self._trade_sums
+            buffers = self.liquidation_buffers if liquidations else self.trade_buffers
+            windows = LIQUIDATION_SUM_WINDOWS if liquidations else TRADE_SUM_WINDOWS
+            
+            with self._lock:
+                if time_window not in windows:
+                    return self._sum_locked(buffers.get(symbol), now_ms - time_window * 1000)
+                
+                window_sum = sums.get(symbol, {}).get(time_window)
+                if window_sum is None:
+                    return 0.0, 0, 0
+                window_sum.expire(now_ms)
+                return window_sum.total, len(window_sum), window_sum.oldest_ts()
+                
+        except Exception as e:
+            self.logger.error(f"Failed to get window sum: {e}")
+            return 0.0, 0, 0
+    
+    def pop_dirty(self) -> set:
+        """
+        Symbols that received events since the last call (thread-safe)
+        
+        Returns:
+            Set of symbols; the internal set is reset
+        """
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        return dirty
+    
     def get_liquidations(self, symbol: str, time_window: int = 30, max_count: Optional[int] = None) -> List[dict]:
         """
         Get liquidations within time window
@@ -158,17 +287,7 @@ class BufferManager:
             # Calculate cutoff time (milliseconds)
             cutoff_time = int((time.time() - time_window) * 1000)
 
-            # Thread-safe read: snapshot buffer under lock
-            with self._lock:
-                if symbol not in self.liquidation_buffers:
-                    return []
-                buffer_snapshot = list(self.liquidation_buffers[symbol])
-
-            # Filter events within time window (outside lock for performance)
-            recent_events = [
-                event for event in buffer_snapshot
-                if event.get("timestamp", 0) >= cutoff_time
-            ]
+            recent_events = self._snapshot_window(self.liquidation_buffers, symbol, cutoff_time)
 
             # CRITICAL FIX: Limit results to max_count (most recent first)
             if max_count is not None and len(recent_events) > max_count:
@@ -203,17 +322,7 @@ class BufferManager:
             # Calculate cutoff time (milliseconds)
             cutoff_time = int((time.time() - time_window) * 1000)
 
-            # Thread-safe read: snapshot buffer under lock
-            with self._lock:
-                if symbol not in self.trade_buffers:
-                    return []
-                buffer_snapshot = list(self.trade_buffers[symbol])
-
-            # Filter events within time window (outside lock for performance)
-            recent_events = [
-                event for event in buffer_snapshot
-                if event.get("timestamp", 0) >= cutoff_time
-            ]
+            recent_events = self._snapshot_window(self.trade_buffers, symbol, cutoff_time)
 
             # CRITICAL FIX: Limit results to max_count (most recent first)
             if max_count is not None and len(recent_events) > max_count:
@@ -230,6 +339,153 @@ class BufferManager:
             self.logger.error(f"Failed to get trades: {e}")
             return []
     
+    def get_liquidation_columns(self, symbol: str, time_window: int = 30) -> Tuple[List[float], List[int], List[int]]:
+        """
+        Get liquidations within time window as parallel columns
+        
+        Args:
+            symbol: Trading pair
+            time_window: Time window in seconds (default 30s)
+            
+        Returns:
+            (vols, sides, timestamps), oldest first
+        """
+        try:
+            cutoff_time = int((time.time() - time_window) * 1000)
+            return self._snapshot_columns(self.liquidation_buffers, symbol, cutoff_time)
+        except Exception as e:
+            self.logger.error(f"Failed to get liquidation columns: {e}")
+            return [], [], []
+    
+    def get_trade_columns(self, symbol: str, time_window: int = 300) -> Tuple[List[float], List[int], List[int]]:
+        """
+        Get trades within time window as parallel columns
+        
+        Args:
+            symbol: Trading pair
+            time_window: Time window in seconds (default 300s = 5 minutes)
+            
+        Returns:
+            (vols, sides, timestamps), oldest first
+        """
+        try:
+            cutoff_time = int((time.time() - time_window) * 1000)
+            return self._snapshot_columns(self.trade_buffers, symbol, cutoff_time)
+        except Exception as e:
+            self.logger.error(f"Failed to get trade columns: {e}")
+            return [], [], []
+    
+    def _snapshot_window(self, buffers: Dict[str, deque], symbol: str, cutoff_time: int) -> List[dict]:
+        """
+        Copy only the events at or after cutoff_time (thread-safe)
+
+        Buffers are appended in arrival order and "timestamp" is stamped at
+        arrival, so the scan walks from the newest end and stops at the first
+        event outside the window instead of copying the whole deque.
+
+        Args:
+            buffers: liquidation_buffers or trade_buffers
+            symbol: Trading pair
+            cutoff_time: Oldest timestamp to include (milliseconds)
+
+        Returns:
+            Events within the window, oldest first
+        """
+        window = []
+        with self._lock:
+            buffer = buffers.get(symbol)
+            if not buffer:
+                return window
+            for event in reversed(buffer):
+                if event.get("timestamp", 0) < cutoff_time:
+                    break
+                window.append(event)
+        window.reverse()
+        return window
+
+    def _snapshot_columns(self, buffers: Dict[str, deque], symbol: str,
+                          cutoff_time: int) -> Tuple[List[float], List[int], List[int]]:
+        """
+        Like _snapshot_window, but split into (vols, sides, timestamps)
+
+        Numeric coercion happens once here, so detectors can aggregate
+        with sum()/bisect over flat lists instead of per-dict lookups.
+        """
+        with self._lock:
+            return self._columns_locked(buffers.get(symbol), cutoff_time)
+
+    @staticmethod
+    def _columns_locked(buffer: Optional[deque],
+                        cutoff_time: int) -> Tuple[List[float], List[int], List[int]]:
+        """Column scan of one buffer; caller must hold self._lock"""
+        vols: List[float] = []
+        sides: List[int] = []
+        timestamps: List[int] = []
+        if not buffer:
+            return vols, sides, timestamps
+        for event in reversed(buffer):
+            ts = event.get("timestamp", 0)
+            if ts < cutoff_time:
+                break
+            vols.append(event["vol"])
+            sides.append(event["side"])
+            timestamps.append(ts)
+        vols.reverse()
+        sides.reverse()
+        timestamps.reverse()
+        return vols, sides, timestamps
+
+    @staticmethod
+    def _sum_locked(buffer: Optional[deque], cutoff_time: int) -> Tuple[float, int, int]:
+        """Window total without building columns; caller must hold self._lock"""
+        total = 0.0
+        count = 0
+        oldest = 0
+        if not buffer:
+            return total, count, oldest
+        for event in reversed(buffer):
+            ts = event.get("timestamp", 0)
+            if ts < cutoff_time:
+                break
+            total += event["vol"]
+            count += 1
+            oldest = ts
+        return total, count, oldest
+
+    def get_trade_columns_many(self, symbols: List[str], time_window: int = 300) -> Dict[str, tuple]:
+        """
+        Trade columns for many symbols under one lock hold
+
+        Args:
+            symbols: Trading pairs
+            time_window: Time window in seconds (default 300s)
+
+        Returns:
+            {symbol: (vols, sides, timestamps)}
+        """
+        try:
+            cutoff_time = int((time.time() - time_window) * 1000)
+            with self._lock:
+                return {
+                    symbol: self._columns_locked(self.trade_buffers.get(symbol), cutoff_time)
+                    for symbol in symbols
+                }
+        except Exception as e:
+            self.logger.error(f"Failed to get trade columns for {len(symbols)} symbols: {e}")
+            return {}
+
+    def liquidation_count(self, symbol: str) -> int:
+        """
+        Number of liquidations buffered for symbol, O(1) without copying
+
+        Args:
+            symbol: Trading pair
+
+        Returns:
+            Liquidation buffer length
+        """
+        return len(self.liquidation_buffers.get(symbol, ()))
+
     def get_all_liquidations(self, symbol: str) -> List[dict]:
         """
         Get all liquidations for symbol
@@ -322,11 +578,17 @@ class BufferManager:
             if symbol in self.trade_buffers:
                 self.trade_buffers[symbol].clear()
                 self.logger.info(f"Cleared trade buffer for {symbol}")
+
+            for sums in (self._liq_sums, self._trade_sums):
+                for window_sum in sums.get(symbol, {}).values():
+                    window_sum.clear()
     
     def clear_all(self):
         """Clear all buffers"""
         self.liquidation_buffers.clear()
         self.trade_buffers.clear()
+        self._liq_sums.clear()
+        self._trade_sums.clear()
         self._symbols_tracked.clear()
         self._total_liquidations = 0
         self._total_trades = 0
@@ -360,15 +622,13 @@ class BufferManager:
         try:
             now = time.time()
             for symbol in list(self._symbols_tracked):
-                liqs = self.get_liquidations(symbol, time_window=3600)
-                liq_vol = sum(float(l.get("vol", 0)) for l in liqs)
+                liq_vol, _, _ = self.get_window_sum(symbol, 3600, liquidations=True)
                 with self._lock:
                     if symbol not in self._hourly_liq_volume:
                         self._hourly_liq_volume[symbol] = deque(maxlen=24)
                     self._hourly_liq_volume[symbol].append((now, liq_vol))
 
-                trades = self.get_trades(symbol, time_window=3600)
-                trade_vol = sum(float(t.get("vol", 0)) for t in trades)
+                trade_vol, _, _ = self.get_window_sum(symbol, 3600)
                 with self._lock:
                     if symbol not in self._hourly_trade_volume:
                         self._hourly_trade_volume[symbol] = deque(maxlen=24)
@@ -412,12 +672,10 @@ class BufferManager:
                 avg_trade = sum(v for _, v in hourly_trades) / len(hourly_trades)
                 result['avg_hourly_trade_volume'] = avg_trade
 
-            current_liqs = self.get_liquidations(symbol, time_window=1800)
-            current_liq_vol = sum(float(l.get("vol", 0)) for l in current_liqs)
+            current_liq_vol, _, _ = self.get_window_sum(symbol, 1800, liquidations=True)
             result['current_liq_volume'] = current_liq_vol
 
-            current_trades = self.get_trades(symbol, time_window=1800)
-            current_trade_vol = sum(float(t.get("vol", 0)) for t in current_trades)
+            current_trade_vol, _, _ = self.get_window_sum(symbol, 1800)
             result['current_trade_volume'] = current_trade_vol
 
             if result['avg_hourly_liq_volume'] > 0:
@@ -256,6 +256,66 @@ class DataValidator:
         
         return results
     
+    def validate_many(self, events: List[dict], data_type: str = "liquidation") -> List[bool]:
+        """
+        Fast-path structural check for a batch of events
+
+        Applies the same required/type/values/min rules as validate() in a
+        single pass, but skips building ValidationResult objects, error
+        strings and business-logic warnings. Use validate_batch() when the
+        per-event diagnostics are needed.
+
+        Args:
+            events: List of event dictionaries (flat or nested with "data" key)
+            data_type: Type of data ("liquidation" or "trade")
+
+        Returns:
+            List of booleans, one per event, True if the event is valid
+        """
+        if data_type == "liquidation":
+            schema = self.liquidation_schema
+        elif data_type == "trade":
+            schema = self.trade_schema
+        else:
+            self.logger.error(f"Unknown data type: {data_type}")
+            return [False] * len(events)
+
+        rules = [
+            (field, rule.get("type"), rule.get("values"), rule.get("min"))
+            for field, rule in schema.items()
+            if rule.get("required", False)
+        ]
+
+        results = []
+        errors = 0
+        for event in events:
+            data = event["data"] if "data" in event and isinstance(event["data"], dict) else event
+            ok = True
+            for field, expected_type, values, min_value in rules:
+                value = data.get(field)
+                if value is None or (expected_type and not isinstance(value, expected_type)):
+                    ok = False
+                    break
+                if values is not None and value not in values:
+                    ok = False
+                    break
+                if min_value is not None:
+                    try:
+                        if float(value) < min_value:
+                            ok = False
+                            break
+                    except (ValueError, TypeError):
+                        ok = False
+                        break
+            if not ok:
+                errors += 1
+            results.append(ok)
+
+        self._validation_count += len(results)
+        self._error_count += errors
+
+        return results
+
     def is_valid_symbol(self, symbol: str) -> bool:
         """
         Check if symbol format is valid
@@ -8,15 +8,81 @@
 # is used for adjustment. Otherwise, falls back to signal_type win rate.
 # This prevents overfitting on sparse setups while rewarding specific edge.
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 from collections import defaultdict
 
 from ..utils.logger import setup_logger
+from .signal_generator import SignalType
 
 # Minimum samples before a setup_key's own win rate is used
 MIN_SETUP_SAMPLES = 5
 
+# Number of most recent outcomes kept per signal_type / setup_key
+HISTORY_WINDOW = 100
+
+
+class OutcomeWindow:
+    """
+    Fixed-size ring buffer of WIN/LOSS outcomes with a running win count.
+
+    Recording and win-rate lookups are O(1) and memory stays bounded at
+    HISTORY_WINDOW bytes. Iterates oldest -> newest, so list(window)
+    gives the same shape as the old list-based history (for persistence).
+    """
+
+    __slots__ = ("_buf", "_head", "_count", "_wins")
+
+    def __init__(self, outcomes: Iterable[bool] = ()):
+        self._buf = bytearray(HISTORY_WINDOW)
+        self._head = 0  # next slot to write
+        self._count = 0
+        self._wins = 0
+        for outcome in outcomes:
+            self.append(outcome)
+
+    def append(self, was_successful: bool):
+        bit = 1 if was_successful else 0
+        if self._count == HISTORY_WINDOW:
+            self._wins -= self._buf[self._head]
+        else:
+            self._count += 1
+        self._buf[self._head] = bit
+        self._wins += bit
+        self._head = (self._head + 1) % HISTORY_WINDOW
+
+    @property
+    def wins(self) -> int:
+        return self._wins
+
+    def win_rate(self) -> float:
+        return self._wins / self._count if self._count else 0.5
+
+    def recent_win_rate(self, window: int) -> float:
+        """Win rate over the last `window` outcomes (0.5 when empty)."""
+        n = min(window, self._count)
+        if not n:
+            return 0.5
+        start = self._head - n
+        if start >= 0:
+            wins = sum(self._buf[start:self._head])
+        else:
+            wins = sum(self._buf[start:]) + sum(self._buf[:self._head])
+        return wins / n
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self._wins = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[bool]:
+        start = (self._head - self._count) % HISTORY_WINDOW
+        for i in range(self._count):
+            yield bool(self._buf[(start + i) % HISTORY_WINDOW])
+
 
 class ConfidenceScorer:
     """
@@ -44,22 +110,12 @@ class ConfidenceScorer:
         self._tier4_absorption = monitoring.get('tier4_absorption', 5_000)
 
         # ── Signal-type level learning (existing, always available) ──
-        self.signal_history: Dict[str, list] = {
-            "STOP_HUNT": [],
-            "ACCUMULATION": [],
-            "DISTRIBUTION": [],
-            "EVENT": [],
-        }
-        self.win_rates: Dict[str, float] = {
-            "STOP_HUNT": 0.5,
-            "ACCUMULATION": 0.5,
-            "DISTRIBUTION": 0.5,
-            "EVENT": 0.5,
-        }
+        self.signal_history: Dict[str, OutcomeWindow] = {st: OutcomeWindow() for st in SignalType}
+        self.win_rates: Dict[str, float] = {st: 0.5 for st in SignalType}
 
         # ── Setup-key level learning (new, granular) ──
-        # Key: setup_key string, Value: list of bools (True=WIN, False=LOSS)
-        self._setup_history: Dict[str, list] = defaultdict(list)
+        # Key: setup_key string, Value: ring of outcomes (True=WIN, False=LOSS)
+        self._setup_history: Dict[str, OutcomeWindow] = defaultdict(OutcomeWindow)
         # Key: setup_key, Value: EMA win rate
         self._setup_win_rates: Dict[str, float] = {}
 
@@ -83,28 +139,17 @@ class ConfidenceScorer:
         try:
             adjusted = base_confidence
 
-            # Factor 1: Historical win rate (setup-level if enough data, else signal-type)
+            # Factors 1+2: Historical win rate and recent trend
+            # (setup-level if enough data, else signal-type)
             win_rate, source = self._get_effective_win_rate(signal_type, setup_key)
-
-            if win_rate > 0.7:
-                adjusted += 5
-                self.logger.debug(f"{source}: +5% (strong: {win_rate:.1%})")
-            elif win_rate > 0.6:
-                adjusted += 3
-            elif win_rate < 0.4:
-                adjusted -= 5
-                self.logger.debug(f"{source}: -5% (weak: {win_rate:.1%})")
-            elif win_rate < 0.5:
-                adjusted -= 3
-
-            # Factor 2: Recent trend (setup-level if available, else signal-type)
             recent_trend = self._get_effective_trend(signal_type, setup_key, window=10)
-            if recent_trend > 0.75:
-                adjusted += 3
-                self.logger.debug(f"Hot streak: +3%")
-            elif recent_trend < 0.25:
-                adjusted -= 3
-                self.logger.debug(f"Cold streak: -3%")
+            performance = self._performance_adjustment(win_rate, recent_trend)
+            adjusted += performance
+            if performance:
+                self.logger.debug(
+                    f"{source}: {performance:+.0f}% "
+                    f"(win rate {win_rate:.1%}, trend {recent_trend:.0%})"
+                )
 
             # Factor 3: Quality metrics from metadata (tier-aware)
             if metadata:
@@ -123,6 +168,72 @@ class ConfidenceScorer:
             self.logger.error(f"Confidence adjustment failed: {e}")
             return base_confidence
 
+    def adjust_confidence_batch(self, base_confidences: List[float], signal_types: List[str],
+                                metadatas: Optional[List[Optional[dict]]] = None,
+                                symbols: Optional[List[str]] = None) -> List[float]:
+        """
+        Adjust many confidences at once (signal-type level learning only).
+
+        Same result as calling adjust_confidence() per signal without a
+        setup_key, but the win rate / trend adjustment is resolved once per
+        distinct signal_type instead of once per signal.
+
+        Args:
+            base_confidences: Initial confidences from analyzers
+            signal_types: Signal type per confidence
+            metadatas: Optional metadata per confidence
+            symbols: Optional trading pair per confidence
+        """
+        performance_by_type: Dict[str, float] = {}
+        results = []
+
+        for i, (base_confidence, signal_type) in enumerate(zip(base_confidences, signal_types)):
+            try:
+                performance = performance_by_type.get(signal_type)
+                if performance is None:
+                    performance = self._performance_adjustment(
+                        self.win_rates.get(signal_type, 0.5),
+                        self.get_recent_trend(signal_type, window=10),
+                    )
+                    performance_by_type[signal_type] = performance
+
+                adjusted = base_confidence + performance
+
+                metadata = metadatas[i] if metadatas else None
+                if metadata:
+                    adjusted += self.calculate_quality_boost(metadata, symbols[i] if symbols else "")
+                    adjusted += self._calculate_combo_bonus(metadata)
+
+                results.append(max(55.0, min(adjusted, 99.0)))
+
+            except Exception as e:
+                self.logger.error(f"Confidence adjustment failed: {e}")
+                results.append(base_confidence)
+
+        self._scores_calculated += len(results)
+        return results
+
+    @staticmethod
+    def _performance_adjustment(win_rate: float, recent_trend: float) -> float:
+        """Confidence delta from historical win rate and recent streak."""
+        adjustment = 0.0
+
+        if win_rate > 0.7:
+            adjustment += 5
+        elif win_rate > 0.6:
+            adjustment += 3
+        elif win_rate < 0.4:
+            adjustment -= 5
+        elif win_rate < 0.5:
+            adjustment -= 3
+
+        if recent_trend > 0.75:
+            adjustment += 3   # Hot streak
+        elif recent_trend < 0.25:
+            adjustment -= 3   # Cold streak
+
+        return adjustment
+
     # ── Win rate resolution ─────────────────────────────────────────
 
     def _get_effective_win_rate(self, signal_type: str, setup_key: str = "") -> tuple:
@@ -131,7 +242,7 @@ class ConfidenceScorer:
         Returns: (win_rate, source_label)
         """
         if setup_key and setup_key in self._setup_win_rates:
-            samples = len(self._setup_history.get(setup_key, []))
+            samples = len(self._setup_history.get(setup_key, ()))
             if samples >= MIN_SETUP_SAMPLES:
                 return (self._setup_win_rates[setup_key], f"setup[{setup_key[:40]}]")
 
@@ -142,8 +253,7 @@ class ConfidenceScorer:
         if setup_key and setup_key in self._setup_history:
             history = self._setup_history[setup_key]
             if len(history) >= 3:  # Need at least 3 for meaningful trend
-                recent = history[-window:]
-                return sum(1 for r in recent if r) / len(recent)
+                return history.recent_win_rate(window)
 
         return self.get_recent_trend(signal_type, window)
 
@@ -163,25 +273,19 @@ class ConfidenceScorer:
         try:
             # ── Signal-type level (always) ──
             if signal_type not in self.signal_history:
-                self.signal_history[signal_type] = []
-
-            self.signal_history[signal_type].append(was_successful)
-            if len(self.signal_history[signal_type]) > 100:
-                self.signal_history[signal_type] = self.signal_history[signal_type][-100:]
+                self.signal_history[signal_type] = OutcomeWindow()
 
             history = self.signal_history[signal_type]
-            current_wr = sum(1 for r in history if r) / len(history)
+            history.append(was_successful)
+            current_wr = history.win_rate()
             old_rate = self.win_rates.get(signal_type, 0.5)
             self.win_rates[signal_type] = old_rate * (1 - self.learning_rate) + current_wr * self.learning_rate
 
             # ── Setup-key level (if provided) ──
             if setup_key:
-                self._setup_history[setup_key].append(was_successful)
-                if len(self._setup_history[setup_key]) > 100:
-                    self._setup_history[setup_key] = self._setup_history[setup_key][-100:]
-
                 setup_hist = self._setup_history[setup_key]
-                setup_wr = sum(1 for r in setup_hist if r) / len(setup_hist)
+                setup_hist.append(was_successful)
+                setup_wr = setup_hist.win_rate()
                 old_setup_rate = self._setup_win_rates.get(setup_key, 0.5)
                 self._setup_win_rates[setup_key] = (
                     old_setup_rate * (1 - self.learning_rate) + setup_wr * self.learning_rate
@@ -276,11 +380,10 @@ class ConfidenceScorer:
         return min(boost, 5.0)
 
     def get_recent_trend(self, signal_type: str, window: int = 10) -> float:
-        history = self.signal_history.get(signal_type, [])
+        history = self.signal_history.get(signal_type)
         if not history:
             return 0.5
-        recent = history[-window:]
-        return sum(1 for r in recent if r) / len(recent) if recent else 0.5
+        return history.recent_win_rate(window)
 
     def record_result_legacy(self, signal_type: str, was_successful: bool):
         """Legacy interface — calls record_result without setup_key."""
@@ -292,16 +395,16 @@ class ConfidenceScorer:
     def get_setup_win_rate(self, setup_key: str) -> Optional[float]:
         """Get win rate for a specific setup_key, or None if not enough data."""
         if setup_key in self._setup_win_rates:
-            if len(self._setup_history.get(setup_key, [])) >= MIN_SETUP_SAMPLES:
+            if len(self._setup_history.get(setup_key, ())) >= MIN_SETUP_SAMPLES:
                 return self._setup_win_rates[setup_key]
         return None
 
     def get_signal_count(self, signal_type: str) -> int:
-        return len(self.signal_history.get(signal_type, []))
+        return len(self.signal_history.get(signal_type, ()))
 
     def get_overall_stats(self) -> dict:
         total_signals = sum(len(h) for h in self.signal_history.values())
-        total_wins = sum(sum(1 for r in h if r) for h in self.signal_history.values())
+        total_wins = sum(h.wins for h in self.signal_history.values())
 
         # Setup-level stats summary
         active_setups = {
@@ -323,7 +426,7 @@ class ConfidenceScorer:
             "per_type": {
                 signal_type: {
                     "count": len(history),
-                    "wins": sum(1 for r in history if r),
+                    "wins": history.wins,
                     "win_rate": self.win_rates[signal_type],
                 }
                 for signal_type, history in self.signal_history.items()
@@ -336,7 +439,7 @@ class ConfidenceScorer:
 
     def reset_history(self, signal_type: Optional[str] = None):
         if signal_type:
-            self.signal_history[signal_type] = []
+            self.signal_history[signal_type] = OutcomeWindow()
             self.win_rates[signal_type] = 0.5
             # Also clear setup keys starting with this signal_type
             to_remove = [k for k in self._setup_history if k.startswith(signal_type)]
@@ -344,12 +447,17 @@ class ConfidenceScorer:
                 del self._setup_history[k]
                 self._setup_win_rates.pop(k, None)
         else:
-            for st in self.signal_history:
-                self.signal_history[st] = []
+            for st, history in self.signal_history.items():
+                history.clear()
                 self.win_rates[st] = 0.5
             self._setup_history.clear()
             self._setup_win_rates.clear()
 
+    def reset(self):
+        """Clear all learned history and counters, keeping tier config."""
+        self.reset_history()
+        self._scores_calculated = 0
+
     def export_stats(self) -> dict:
         return {
             "timestamp": datetime.now().isoformat(),
@@ -10,6 +10,7 @@
 # Non-destructive: existing liquidation-based signals unchanged.
 
 import time
+from html import escape
 from dataclasses import dataclass
 from typing import Optional, List, Dict
 from collections import defaultdict
@@ -353,7 +354,7 @@ class RestSignalDetector:
                 "spot_level": spot_level,
                 "spot_direction": spot_dir,
                 "mega_override": mega,
-                "message": msg,
+                "message": escape(msg, quote=False),
             },
         )
 
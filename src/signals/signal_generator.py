@@ -19,13 +19,29 @@ Algorithm:
 5. Return unified signal if confidence meets threshold
 """
 
-from typing import Optional, List
+import functools
+from itertools import product
+from typing import NamedTuple, Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from ..models.events import StrEnum
 from ..utils.logger import setup_logger
 
-@dataclass
+class SignalType(StrEnum):
+    """Trading signal types (str-compatible, one shared object per value)"""
+    STOP_HUNT = "STOP_HUNT"
+    ACCUMULATION = "ACCUMULATION"
+    DISTRIBUTION = "DISTRIBUTION"
+    EVENT = "EVENT"
+
+class Direction(StrEnum):
+    """Trading signal directions (str-compatible, one shared object per value)"""
+    LONG = "LONG"
+    SHORT = "SHORT"
+    NEUTRAL = "NEUTRAL"
+
+@dataclass(slots=True)
 class TradingSignal:
     """Unified trading signal dataclass"""
     symbol: str
@@ -37,6 +53,34 @@ class TradingSignal:
     metadata: dict
     priority: int  # 1=High, 2=Medium, 3=Low
 
+class _SignalView(NamedTuple):
+    """Hashable view of the analyzer fields the combine step reads"""
+    direction: str
+    signal_type: str
+    confidence: float
+
+def _view(signal) -> _SignalView:
+    """Fingerprint an analyzer signal (confidence quantized to 0.01)"""
+    return _SignalView(
+        direction=getattr(signal, 'direction', ''),
+        signal_type=getattr(signal, 'signal_type', ''),
+        confidence=round(signal.confidence, 2)
+    )
+
+# Max released TradingSignal objects kept for reuse
+_POOL_MAX = 256
+
+# Contributing analyzers per (has_stop_hunt, has_order_flow, has_events)
+# input shape, precomputed so generate() does one lookup instead of branching
+_SOURCES_BY_SHAPE = {
+    shape: tuple(
+        name for name, present in zip(
+            ('StopHuntDetector', 'OrderFlowAnalyzer', 'EventPatternDetector'), shape
+        ) if present
+    )
+    for shape in product((False, True), repeat=3)
+}
+
 class SignalGenerator:
     """
     Production-ready signal generator
@@ -62,6 +106,13 @@ class SignalGenerator:
         self.logger = setup_logger("SignalGenerator", "INFO")
         self._signals_generated = 0
         
+        # Per-instance LRU over the pure combine step (type, direction,
+        # confidence, priority); metadata and the signal object stay fresh
+        self._combine_cached = functools.lru_cache(maxsize=4096)(self._combine)
+        
+        # Free list of discarded signals, refilled via release()
+        self._pool: List[TradingSignal] = []
+        
     async def generate(
         self,
         symbol: str,
@@ -89,33 +140,19 @@ class SignalGenerator:
             TradingSignal if confidence meets threshold, None otherwise
         """
         try:
-            # Collect available signals
-            signals = []
-            sources = []
-            
-            if stop_hunt_signal:
-                signals.append(('stop_hunt', stop_hunt_signal))
-                sources.append('StopHuntDetector')
-            
-            if order_flow_signal:
-                signals.append(('order_flow', order_flow_signal))
-                sources.append('OrderFlowAnalyzer')
-            
-            if event_signals:
-                signals.append(('events', event_signals))
-                sources.append('EventPatternDetector')
+            # Collect available signals (one lookup on the input shape)
+            sources = _SOURCES_BY_SHAPE[
+                (bool(stop_hunt_signal), bool(order_flow_signal), bool(event_signals))
+            ]
             
-            if not signals:
+            if not sources:
                 return None
             
-            # Determine primary signal type and direction
-            signal_type, direction = self.determine_signal_type_and_direction(
-                stop_hunt_signal, order_flow_signal
-            )
-            
-            # Merge confidence scores
-            merged_confidence = self.merge_confidence(
-                stop_hunt_signal, order_flow_signal, event_signals
+            # Type, direction, merged confidence and priority (memoized)
+            signal_type, direction, merged_confidence, priority = self._combine_cached(
+                _view(stop_hunt_signal) if stop_hunt_signal else None,
+                _view(order_flow_signal) if order_flow_signal else None,
+                tuple(_view(e) for e in event_signals) if event_signals else None
             )
             
             # Check confidence threshold
@@ -125,23 +162,18 @@ class SignalGenerator:
                 )
                 return None
             
-            # Determine priority
-            priority = self.determine_priority(
-                stop_hunt_signal, order_flow_signal, event_signals, merged_confidence
-            )
-            
             # Build metadata
             metadata = self.build_metadata(
                 stop_hunt_signal, order_flow_signal, event_signals
             )
             
             # Create unified signal
-            trading_signal = TradingSignal(
+            trading_signal = self._acquire(
                 symbol=symbol,
                 signal_type=signal_type,
                 direction=direction,
                 confidence=merged_confidence,
-                sources=sources,
+                sources=list(sources),
                 timestamp=datetime.now(timezone.utc).isoformat(),
                 metadata=metadata,
                 priority=priority
@@ -160,6 +192,67 @@ class SignalGenerator:
             self.logger.error(f"Signal generation failed: {e}")
             return None
     
+    def _acquire(
+        self,
+        symbol: str,
+        signal_type: str,
+        direction: str,
+        confidence: float,
+        sources: List[str],
+        timestamp: str,
+        metadata: dict,
+        priority: int
+    ) -> TradingSignal:
+        """Reuse a released TradingSignal if available, else allocate one"""
+        if not self._pool:
+            return TradingSignal(
+                symbol, signal_type, direction, confidence,
+                sources, timestamp, metadata, priority
+            )
+        
+        signal = self._pool.pop()
+        signal.symbol = symbol
+        signal.signal_type = signal_type
+        signal.direction = direction
+        signal.confidence = confidence
+        signal.sources = sources
+        signal.timestamp = timestamp
+        signal.metadata = metadata
+        signal.priority = priority
+        return signal
+    
+    def release(self, signal: TradingSignal):
+        """
+        Return a signal for reuse once it has been discarded.
+        
+        Only call this when nothing else holds a reference to the signal
+        (e.g. rejected before being queued, tracked or stored).
+        """
+        if len(self._pool) < _POOL_MAX:
+            self._pool.append(signal)
+    
+    def _combine(self, stop_hunt_view, order_flow_view, event_views) -> Tuple[str, str, float, int]:
+        """
+        Pure combine step over signal fingerprints (cached by generate)
+        
+        Returns:
+            (signal_type, direction, merged_confidence, priority) tuple
+        """
+        signal_type, direction = self.determine_signal_type_and_direction(
+            stop_hunt_view, order_flow_view
+        )
+        merged_confidence = self.merge_confidence(
+            stop_hunt_view, order_flow_view, event_views
+        )
+        priority = self.determine_priority(
+            stop_hunt_view, order_flow_view, event_views, merged_confidence
+        )
+        return (signal_type, direction, merged_confidence, priority)
+    
+    def cache_info(self):
+        """Hit/miss statistics of the combine-step cache"""
+        return self._combine_cached.cache_info()
+    
     def determine_signal_type_and_direction(self, stop_hunt_signal, order_flow_signal) -> tuple:
         """
         Determine primary signal type and direction
@@ -174,19 +267,19 @@ class SignalGenerator:
         if stop_hunt_signal:
             # Stop hunt is primary
             if stop_hunt_signal.direction == "SHORT_HUNT":
-                return ("STOP_HUNT", "LONG")  # After SHORT_HUNT, go LONG
+                return (SignalType.STOP_HUNT, Direction.LONG)  # After SHORT_HUNT, go LONG
             else:  # LONG_HUNT
-                return ("STOP_HUNT", "SHORT")  # After LONG_HUNT, go SHORT
+                return (SignalType.STOP_HUNT, Direction.SHORT)  # After LONG_HUNT, go SHORT
         
         elif order_flow_signal:
             # Order flow is primary
             if order_flow_signal.signal_type == "ACCUMULATION":
-                return ("ACCUMULATION", "LONG")
+                return (SignalType.ACCUMULATION, Direction.LONG)
             else:  # DISTRIBUTION
-                return ("DISTRIBUTION", "SHORT")
+                return (SignalType.DISTRIBUTION, Direction.SHORT)
         
         else:
-            return ("EVENT", "NEUTRAL")
+            return (SignalType.EVENT, Direction.NEUTRAL)
     
     def merge_confidence(self, stop_hunt_signal, order_flow_signal, event_signals) -> float:
         """
@@ -236,7 +329,7 @@ class SignalGenerator:
         if self.signals_aligned(stop_hunt_signal, order_flow_signal):
             bonus = min(merged * 0.15, 10.0)  # 15% of merged, capped at 10
             merged = min(merged + bonus, 99.0)
-            self.logger.debug(f"Signals aligned - confidence boosted by {bonus:.1f}%")
+            self.logger.debug("Signals aligned - confidence boosted by %.1f%%", bonus)
         
         return merged
     
@@ -338,9 +431,16 @@ class SignalGenerator:
         
         return metadata
     
+    def reset(self):
+        """Zero counters; the combine cache is kept warm"""
+        self._signals_generated = 0
+    
     def get_stats(self) -> dict:
         """Get generator statistics"""
+        cache = self._combine_cached.cache_info()
         return {
             "signals_generated": self._signals_generated,
-            "min_confidence": self.min_confidence
+            "min_confidence": self.min_confidence,
+            "cache_hits": cache.hits,
+            "cache_misses": cache.misses
         }
@@ -19,9 +19,11 @@ Algorithm:
 5. If all pass, approve and add cooldown
 """
 
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 import hashlib
+import heapq
 
 from ..utils.logger import setup_logger
 
@@ -76,14 +78,18 @@ class SignalValidator:
             4: monitoring.get('tier4_cooldown_minutes', 15),
         }
         
-        # Track recent signals for rate limiting
-        self.recent_signals: List[datetime] = []
+        # Track recent signals for rate limiting (approval order = time order)
+        self.recent_signals: Deque[datetime] = deque()
         
-        # Track cooldowns per signal key
+        # Track cooldowns per signal key, plus a min-heap of (expiry, key)
+        # so expired entries are dropped without rebuilding the dict
         self.signal_cooldowns: Dict[str, datetime] = {}
+        self._cooldown_expiry: List[Tuple[datetime, str]] = []
         
-        # Track signal hashes to prevent exact duplicates
+        # Track signal hashes to prevent exact duplicates, plus their
+        # insertion order for incremental expiry
         self.recent_hashes: Dict[str, datetime] = {}
+        self._hash_order: Deque[Tuple[datetime, str]] = deque()
         
         # Statistics
         self._total_validated = 0
@@ -120,7 +126,7 @@ class SignalValidator:
                 self._total_rejected += 1
                 self._rejection_reasons["low_confidence"] += 1
                 reason = f"Confidence {signal.confidence:.1f}% below threshold {self.min_confidence}%"
-                self.logger.debug(f"❌ Rejected: {reason}")
+                self.logger.debug("❌ Rejected: %s", reason)
                 return (False, reason)
             
             # Rule 2: Check for exact duplicate
@@ -129,7 +135,7 @@ class SignalValidator:
                 self._total_rejected += 1
                 self._rejection_reasons["duplicate"] += 1
                 reason = "Exact duplicate signal"
-                self.logger.debug(f"❌ Rejected: {reason}")
+                self.logger.debug("❌ Rejected: %s", reason)
                 return (False, reason)
             
             # Rule 3: Check cooldown period
@@ -140,7 +146,7 @@ class SignalValidator:
                 cooldown_until = self.signal_cooldowns[signal_key]
                 remaining = (cooldown_until - datetime.now(timezone.utc)).total_seconds() / 60
                 reason = f"In cooldown (remaining: {remaining:.1f} min)"
-                self.logger.debug(f"❌ Rejected: {reason}")
+                self.logger.debug("❌ Rejected: %s", reason)
                 return (False, reason)
             
             # Rule 4: Check rate limit
@@ -166,6 +172,21 @@ class SignalValidator:
             self.logger.error(f"Validation error: {e}")
             return (False, f"Validation error: {str(e)}")
     
+    def validate_many(self, signals: List) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Validate a batch of signals in order
+        
+        Signals are checked sequentially because each approval updates the
+        duplicate/cooldown/rate-limit state seen by the next one.
+        
+        Args:
+            signals: TradingSignals to validate
+            
+        Returns:
+            List of (is_valid, rejection_reason) tuples, one per signal
+        """
+        return [self.validate(signal) for signal in signals]
+    
     def generate_signal_key(self, signal) -> str:
         """
         Generate unique key for signal cooldown tracking
@@ -211,10 +232,10 @@ class SignalValidator:
         """
         # Clean old hashes (older than 10 minutes)
         cutoff = datetime.now(timezone.utc) - timedelta(minutes=10)
-        self.recent_hashes = {
-            h: t for h, t in self.recent_hashes.items()
-            if t > cutoff
-        }
+        while self._hash_order and self._hash_order[0][0] <= cutoff:
+            t, h = self._hash_order.popleft()
+            if self.recent_hashes.get(h) == t:
+                del self.recent_hashes[h]
         
         # Check if hash exists
         if signal_hash in self.recent_hashes:
@@ -234,10 +255,10 @@ class SignalValidator:
         """
         # Clean expired cooldowns
         now = datetime.now(timezone.utc)
-        self.signal_cooldowns = {
-            k: t for k, t in self.signal_cooldowns.items()
-            if t > now
-        }
+        while self._cooldown_expiry and self._cooldown_expiry[0][0] <= now:
+            t, k = heapq.heappop(self._cooldown_expiry)
+            if self.signal_cooldowns.get(k) == t:
+                del self.signal_cooldowns[k]
         
         cooldown_until = self.signal_cooldowns.get(signal_key)
         if cooldown_until and now < cooldown_until:
@@ -252,12 +273,7 @@ class SignalValidator:
         Returns:
             True if rate limited, False otherwise
         """
-        # Clean signals older than 1 hour
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
-        self.recent_signals = [
-            t for t in self.recent_signals
-            if t > cutoff
-        ]
+        self._prune_recent_signals()
         
         # Check count
         if len(self.recent_signals) >= self.max_signals_per_hour:
@@ -265,6 +281,12 @@ class SignalValidator:
         
         return False
     
+    def _prune_recent_signals(self):
+        """Drop rate-limit entries older than 1 hour (oldest are at the head)"""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
+        while self.recent_signals and self.recent_signals[0] <= cutoff:
+            self.recent_signals.popleft()
+    
     def _get_symbol_tier(self, symbol: str) -> int:
         """Get tier number for a symbol (1-4)."""
         if symbol in self._tier1_symbols:
@@ -296,13 +318,16 @@ class SignalValidator:
 
         # Add tier-based cooldown
         cooldown = self._get_cooldown_for_symbol(signal.symbol)
-        self.signal_cooldowns[signal_key] = now + timedelta(minutes=cooldown)
+        cooldown_until = now + timedelta(minutes=cooldown)
+        self.signal_cooldowns[signal_key] = cooldown_until
+        heapq.heappush(self._cooldown_expiry, (cooldown_until, signal_key))
         self.logger.info(
             f"Cooldown set: {signal.symbol} tier {self._get_symbol_tier(signal.symbol)} → {cooldown} min"
         )
 
         # Add hash
         self.recent_hashes[signal_hash] = now
+        self._hash_order.append((now, signal_hash))
     
     def get_remaining_quota(self) -> int:
         """
@@ -311,12 +336,7 @@ class SignalValidator:
         Returns:
             Number of signals remaining
         """
-        # Clean old signals
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
-        self.recent_signals = [
-            t for t in self.recent_signals
-            if t > cutoff
-        ]
+        self._prune_recent_signals()
         
         return max(0, self.max_signals_per_hour - len(self.recent_signals))
     
@@ -362,8 +382,22 @@ class SignalValidator:
     def reset_all_cooldowns(self):
         """Reset all cooldowns"""
         self.signal_cooldowns.clear()
+        self._cooldown_expiry.clear()
         self.logger.info("Reset all cooldowns")
     
+    def reset(self):
+        """Clear tracking state and statistics in place, keeping settings"""
+        self.recent_signals.clear()
+        self.signal_cooldowns.clear()
+        self._cooldown_expiry.clear()
+        self.recent_hashes.clear()
+        self._hash_order.clear()
+        self._total_validated = 0
+        self._total_approved = 0
+        self._total_rejected = 0
+        for reason in self._rejection_reasons:
+            self._rejection_reasons[reason] = 0
+    
     def get_stats(self) -> dict:
         """Get validator statistics"""
         return {